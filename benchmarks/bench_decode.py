@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark the hand-rolled fastabi decoders against eth_abi.
+
+Builds synthetic getAllBids() / getBid() / auction() return data with 10,
+1k and 50k contributions, checks that fastabi produces exactly what
+eth_abi + records.bid_from_raw (the generic path) produces, then times
+both.
+
+Usage:
+    bench_decode.py                  Table output
+    bench_decode.py --json           Machine-readable results
+    bench_decode.py --sizes 10,1000  Custom contribution counts
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from eth_abi import decode, encode  # noqa: E402
+
+import fastabi  # noqa: E402
+from fastabi import AUCTION_TYPES, BID_TYPE, decode_auction, decode_bid, decode_bids  # noqa: E402
+from records import bid_from_raw, bids_from_raw  # noqa: E402
+
+DEFAULT_SIZES = (10, 1_000, 50_000)
+CONTRIBUTIONS_PER_BID = 10
+
+
+def make_bids(contributions):
+    """Synthetic bids totalling `contributions` contributions."""
+    bids = []
+    n_bids = max(1, contributions // CONTRIBUTIONS_PER_BID)
+    for i in range(n_bids):
+        count = CONTRIBUTIONS_PER_BID if contributions >= CONTRIBUTIONS_PER_BID else contributions
+        contribs = [
+            ("0x%040x" % (1 + (i * 7 + j) % 5000), 1_000_000 + j, 1_700_000_000 + i + j)
+            for j in range(count)
+        ]
+        bids.append((sum(c[1] for c in contribs), f"https://example.com/bid/{i}", contribs))
+    return bids
+
+
+def payloads(contributions):
+    bids = make_bids(contributions)
+    return {
+        "getAllBids": encode([BID_TYPE + "[]"], [bids]),
+        "getBid": encode([BID_TYPE], [bids[0]]),
+        "auction": encode(AUCTION_TYPES, [332, bids[0], 1_700_000_000, 1_700_086_400, False, (0, "https://qrcoin.fun")]),
+    }
+
+
+def generic(kind, data):
+    if kind == "getAllBids":
+        (bids,) = decode([BID_TYPE + "[]"], data)
+        return bids_from_raw(bids, checksum=True)
+    if kind == "getBid":
+        (bid,) = decode([BID_TYPE], data)
+        return bid_from_raw(bid, checksum=True)
+    auction = decode(AUCTION_TYPES, data)
+    return (auction[0], bid_from_raw(auction[1], checksum=True)) + tuple(auction[2:])
+
+
+FAST = {"getAllBids": decode_bids, "getBid": decode_bid, "auction": decode_auction}
+
+
+def _plain(value):
+    """Comparable form of Bid / Contribution records and tuples."""
+    if isinstance(value, (list, tuple)):
+        return [_plain(v) for v in value]
+    if hasattr(value, "__slots__"):
+        return [_plain(getattr(value, name)) for name in value.__slots__]
+    return value
+
+
+def timeit(fn, data, min_time=0.2):
+    runs, elapsed = 0, 0.0
+    while elapsed < min_time:
+        started = time.perf_counter()
+        fn(data)
+        elapsed += time.perf_counter() - started
+        runs += 1
+    return elapsed / runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark fastabi against eth_abi")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--sizes", type=str, help="Comma-separated contribution counts")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",")] if args.sizes else DEFAULT_SIZES
+    results = []
+    for size in sizes:
+        for kind, data in payloads(size).items():
+            if _plain(FAST[kind](data)) != _plain(generic(kind, data)):
+                print(f"Error: fastabi mismatch for {kind} at {size} contributions", file=sys.stderr)
+                sys.exit(1)
+            eth_abi_s = timeit(lambda d: generic(kind, d), data)
+            # Cold checksum cache each run, as in a fresh CLI invocation
+            fast_s = timeit(lambda d: (fastabi._checksum_cache.clear(), FAST[kind](d)), data)
+            results.append({
+                "contributions": size,
+                "call": kind,
+                "bytes": len(data),
+                "ethAbiMs": eth_abi_s * 1000,
+                "fastMs": fast_s * 1000,
+                "speedup": eth_abi_s / fast_s,
+            })
+
+    if args.json:
+        print(json.dumps({"benchmark": "decode", "results": results}, indent=2))
+        return
+
+    print(f"{'contribs':>9} {'call':<11} {'bytes':>10} {'eth_abi ms':>11} {'fastabi ms':>11} {'speedup':>8}")
+    for r in results:
+        print(f"{r['contributions']:>9} {r['call']:<11} {r['bytes']:>10} {r['ethAbiMs']:>11.3f} {r['fastMs']:>11.3f} {r['speedup']:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmarks against a local mock auction (mockchain.py).
+
+For each bid count (10, 1k and 50k by default) starts a MockChain and
+times, in a fresh interpreter per run (isolated HOME, QRCOIN_DIRECT=1 so
+a running daemon doesn't serve them):
+
+  - every query-bids.py mode (--summary, --json, --ndjson, --contributors,
+    --serial, --url), with the view-call cache off
+  - submit: qrcoin.py createBid / contribute --yes end to end (settings,
+    key, pre-flight batch, sign, broadcast) with a throwaway key
+
+plus the calldata encoders in-process. Reports the median wall time, the
+RPC requests (HTTP round trips) and JSON-RPC calls per run, and output
+size.
+
+Usage:
+    bench_e2e.py                      Table output
+    bench_e2e.py --json               Machine-readable results
+    bench_e2e.py --sizes 10,1000      Custom bid counts
+    bench_e2e.py --contributions 3    Contributions per bid (default 3)
+    bench_e2e.py --latency 20         Milliseconds of injected latency per RPC request
+    bench_e2e.py --runs 5             Runs per case (median reported, default 3)
+    bench_e2e.py --compare OLD.json   Show deltas against a saved --json run
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from encode import encode_approve, encode_contribute_to_bid, encode_create_bid  # noqa: E402
+from mockchain import AUCTION, MockChain  # noqa: E402
+from wallet import address_from_key  # noqa: E402
+
+SCRIPTS = Path(__file__).resolve().parent.parent / "scripts"
+DEFAULT_SIZES = (10, 1_000, 50_000)
+DEFAULT_CONTRIBUTIONS = 3
+
+# Throwaway key; the mock accepts anything it signs
+BENCH_KEY = "0x" + "42" * 32
+
+
+def query_cases(chain):
+    existing = chain.bids[0][1] if chain.bids else "https://example.com/bid/0"
+    cases = [(f"query-bids {mode}", ["query-bids.py", mode]) for mode in
+             ("--summary", "--json", "--ndjson", "--contributors", "--serial")]
+    cases.append(("query-bids --url", ["query-bids.py", "--url", existing]))
+    return [(name, argv + ["--no-cache", "--rpc", chain.url]) for name, argv in cases]
+
+
+def submit_cases(chain):
+    existing = chain.bids[0][1] if chain.bids else None
+    cases = [("submit createBid", ["qrcoin.py", "createBid", "https://example.com/new", "bench", "--yes"])]
+    if existing:
+        cases.append(("submit contribute", ["qrcoin.py", "contribute", existing, "bench", "--yes"]))
+    return cases
+
+
+def setup_home(home, url):
+    """Skill config pointing at the mock, with the throwaway key."""
+    config_dir = Path(home) / ".clawdbot" / "skills" / "qrcoin"
+    config_dir.mkdir(parents=True)
+    config = {"rpcUrl": url, "privateKey": BENCH_KEY, "address": address_from_key(BENCH_KEY),
+              "xHandle": "bench"}
+    (config_dir / "config.json").write_text(json.dumps(config))
+
+
+def measure(chain, argv, runs, env):
+    walls, output = [], 0
+    for _ in range(runs):
+        chain.reset_stats()
+        started = time.perf_counter()
+        proc = subprocess.run([sys.executable, *argv], cwd=SCRIPTS, env=env, capture_output=True)
+        walls.append(time.perf_counter() - started)
+        if proc.returncode != 0:
+            print(f"Error: {' '.join(argv)} exited {proc.returncode}:", file=sys.stderr)
+            print(proc.stderr.decode(errors="replace")[-2000:], file=sys.stderr)
+            sys.exit(1)
+        output = len(proc.stdout)
+    return {
+        "wallMs": statistics.median(walls) * 1000,
+        "minMs": min(walls) * 1000,
+        "rpcRequests": chain.stats["requests"],
+        "rpcCalls": chain.stats["calls"],
+        "outputBytes": output,
+    }
+
+
+def timeit(fn, min_time=0.2):
+    runs, started = 0, time.perf_counter()
+    while time.perf_counter() - started < min_time:
+        fn()
+        runs += 1
+    return (time.perf_counter() - started) / runs
+
+
+def encode_results():
+    url = "https://example.com/bid/0"
+    cases = [
+        ("encode createBid", lambda: encode_create_bid(332, url, "bench")),
+        ("encode contributeToBid", lambda: encode_contribute_to_bid(332, url, "bench")),
+        ("encode approve", lambda: encode_approve(AUCTION, 50_000_000)),
+    ]
+    return [{"case": name, "bids": None, "wallMs": timeit(fn) * 1000} for name, fn in cases]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end benchmarks against a mock auction")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--sizes", type=str, help="Comma-separated bid counts")
+    parser.add_argument("--contributions", type=int, default=DEFAULT_CONTRIBUTIONS,
+                        help=f"Contributions per bid (default {DEFAULT_CONTRIBUTIONS})")
+    parser.add_argument("--latency", type=float, default=0.0, help="Milliseconds of latency per RPC request")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per case (default 3)")
+    parser.add_argument("--compare", type=str, help="Previous --json output to diff against")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",")] if args.sizes else DEFAULT_SIZES
+    results = encode_results()
+    for size in sizes:
+        with MockChain(size, args.contributions, args.latency / 1000) as chain, \
+                tempfile.TemporaryDirectory() as home:
+            chain.all_bids()  # Encode up front so the first run doesn't pay for it
+            setup_home(home, chain.url)
+            env = {**os.environ, "HOME": home, "QRCOIN_DIRECT": "1"}
+            env.pop("QRCOIN_TRACE", None)
+            for name, argv in query_cases(chain) + submit_cases(chain):
+                results.append({"case": name, "bids": size, **measure(chain, argv, args.runs, env)})
+
+    if args.json:
+        print(json.dumps({
+            "benchmark": "e2e",
+            "python": sys.version.split()[0],
+            "contributions": args.contributions,
+            "latencyMs": args.latency,
+            "runs": args.runs,
+            "results": results,
+        }, indent=2))
+        return
+
+    previous = {}
+    if args.compare:
+        with open(args.compare) as f:
+            previous = {(r["case"], r["bids"]): r for r in json.load(f)["results"]}
+
+    print(f"{'case':<26} {'bids':>7} {'wall ms':>9} {'requests':>9} {'calls':>6} {'output':>10} {'delta ms':>9}")
+    for r in results:
+        old = previous.get((r["case"], r["bids"]))
+        places = 4 if r["bids"] is None else 1
+        delta = f"{r['wallMs'] - old['wallMs']:+9.{places}f}" if old else f"{'':>9}"
+        if r["bids"] is None:
+            print(f"{r['case']:<26} {'-':>7} {r['wallMs']:>9.4f} {'-':>9} {'-':>6} {'-':>10} {delta}")
+            continue
+        print(f"{r['case']:<26} {r['bids']:>7} {r['wallMs']:>9.0f} {r['rpcRequests']:>9} {r['rpcCalls']:>6} "
+              f"{r['outputBytes']:>10} {delta}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Track CLI startup cost per entry point.
+
+Runs each script under `python -X importtime` with arguments that exit
+before any network I/O (--help, no-arg usage, `encode.py selectors`),
+and reports wall time, total import time, module count, whether web3 /
+eth_account were pulled in, and the heaviest top-level imports.
+
+Usage:
+    bench_startup.py                     Table output
+    bench_startup.py --json              Machine-readable results
+    bench_startup.py --runs 10           Runs per entry point (median reported)
+    bench_startup.py --compare OLD.json  Show deltas against a saved --json run
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPTS = Path(__file__).resolve().parent.parent / "scripts"
+
+# (name, argv) -- each exits without touching the network
+ENTRY_POINTS = [
+    ("query-bids", ["query-bids.py", "--help"]),
+    ("wallet", ["wallet.py"]),
+    ("encode", ["encode.py", "selectors"]),
+    ("qrcoin", ["qrcoin.py", "help"]),
+    ("indexer", ["indexer.py", "--help"]),
+    ("backfill", ["backfill.py", "--help"]),
+    ("readcache", ["readcache.py"]),
+]
+
+# Reference point: what every entry point used to pay up front
+BASELINE = ("import web3", ["-c", "import web3"])
+
+HEAVY = ("web3", "eth_account")
+
+
+def parse_importtime(stderr):
+    """Return (total_us, modules, top_level) from -X importtime output."""
+    total, modules, top = 0, set(), []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        name = name[1:]  # drop the separator space; the rest is nesting indent
+        modules.add(name.strip())
+        # Top-level imports have no indentation in the name column
+        if not name.startswith("  "):
+            total += int(cumulative)
+            top.append((name.strip(), int(cumulative)))
+    return total, modules, top
+
+
+def measure(argv, runs):
+    walls, imports, last = [], [], None
+    with tempfile.TemporaryDirectory() as home:
+        # Isolated HOME so readcache/indexer don't touch real state
+        env = {**os.environ, "HOME": home}
+        for _ in range(runs):
+            started = time.perf_counter()
+            proc = subprocess.run(
+                [sys.executable, "-X", "importtime", *argv],
+                cwd=SCRIPTS, env=env, capture_output=True, text=True,
+            )
+            walls.append(time.perf_counter() - started)
+            total, modules, top = parse_importtime(proc.stderr)
+            imports.append(total)
+            last = (modules, top)
+    modules, top = last
+    top.sort(key=lambda item: item[1], reverse=True)
+    return {
+        "wallMs": statistics.median(walls) * 1000,
+        "importMs": statistics.median(imports) / 1000,
+        "modules": len(modules),
+        "heavy": [name for name in HEAVY if name in modules],
+        "topImports": [{"module": name, "ms": us / 1000} for name, us in top[:5]],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CLI startup / import time")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per entry point (default 5)")
+    parser.add_argument("--compare", type=str, help="Previous --json output to diff against")
+    args = parser.parse_args()
+
+    results = []
+    for name, argv in [BASELINE] + ENTRY_POINTS:
+        results.append({"entryPoint": name, **measure(argv, args.runs)})
+
+    if args.json:
+        print(json.dumps({"benchmark": "startup", "python": sys.version.split()[0], "results": results}, indent=2))
+        return
+
+    previous = {}
+    if args.compare:
+        with open(args.compare) as f:
+            previous = {r["entryPoint"]: r for r in json.load(f)["results"]}
+
+    print(f"{'entry point':<13} {'wall ms':>8} {'import ms':>10} {'modules':>8} {'delta ms':>9}  heavy / top import")
+    for r in results:
+        old = previous.get(r["entryPoint"])
+        delta = f"{r['wallMs'] - old['wallMs']:+9.0f}" if old else f"{'':>9}"
+        top = r["topImports"][0] if r["topImports"] else {"module": "-", "ms": 0}
+        heavy = ",".join(r["heavy"]) or "-"
+        print(f"{r['entryPoint']:<13} {r['wallMs']:>8.0f} {r['importMs']:>10.0f} {r['modules']:>8} {delta}  "
+              f"{heavy} / {top['module']} {top['ms']:.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,509 @@
+#!/usr/bin/env python3
+"""
+In-process mock JSON-RPC server for the QR auction on Base.
+
+Serves ABI-correct answers for what the scripts read and send:
+auction(), getAllBids(), getBid(string), getBidCount(), both reserve
+prices, Multicall3 aggregate3 / getEthBalance, USDC balanceOf /
+allowance / approve, createBid / contributeToBid pre-flights (reverting
+with URL_ALREADY_HAS_BID / BID_NOT_FOUND like the contract, and with
+USDC_TOKEN_TRANSFER_FAILED while `allowance` is below the reserve price),
+eth_getLogs
+(AuctionCreated, AuctionBid and BidContributionMade for every bid),
+fee history, gas estimates, eth_sendRawTransaction and receipts, and
+JSON-RPC batches. A sent transaction counts towards the "pending" nonce
+at once and towards "latest" once `block` has moved past it. The bid set is synthetic and deterministic:
+`bids` bids with `contributions` contributions each.
+
+`latency` (seconds) is slept before answering every HTTP request, to
+model a remote provider; it can be changed while serving. `max_logs`
+caps eth_getLogs results the way providers do (-32005 "query returned
+more than N results"), inject() answers the next calls of a method with
+an error, e.g. a rate limit, and inject_http() fails whole HTTP requests
+(429, 503) like an overloaded endpoint. Several MockChains make a pool
+of endpoints for rpcpool. getAllBids() is hand-encoded and cached, so a 50k-bid chain
+starts in about a second.
+
+Usage (as a library):
+    with MockChain(bids=1000, contributions=3, latency=0.02) as chain:
+        subprocess.run(["scripts/query-bids.py", "--summary", "--rpc", chain.url])
+        chain.stats   # {"requests": ..., "calls": ..., "methods": Counter}
+        chain.inject("eth_getLogs", -32005, "rate limit exceeded", times=2)
+        chain.inject_http(503, times=1)
+
+Usage (standalone):
+    mockchain.py [--bids N] [--contributions N] [--latency MS] [--port PORT] [--max-logs N]
+"""
+
+import argparse
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from eth_abi import decode, encode
+from eth_utils import keccak, to_checksum_address
+
+AUCTION = "0x7309779122069efa06ef71a45ae0db55a259a176"
+USDC = "0x833589fcd6edb6e08f4c7c32d4f71b54bda02913"
+MULTICALL3 = "0xca11bde05977b3631167028862be2a173976ca11"
+CHAIN_ID = 8453
+
+BID_TYPE = "(uint256,string,(address,uint256,uint256)[])"
+AUCTION_TYPES = ["uint256", BID_TYPE, "uint256", "uint256", "bool", "(uint256,string)"]
+
+TOKEN_ID = 332
+HEAD_BLOCK = 30_000_000
+FIRST_LOG_BLOCK = HEAD_BLOCK - 40_000
+LOGS_PER_BLOCK = 4
+CREATE_RESERVE = 11_110_000
+CONTRIBUTE_RESERVE = 1_000_000
+BASE_FEE = 10_000_000  # 0.01 gwei
+ETH_BALANCE = 10**17
+USDC_BALANCE = 1_000 * 10**6
+GAS_ESTIMATE = 150_000
+
+
+def _selector(signature):
+    return keccak(text=signature)[:4]
+
+
+def _topic(signature):
+    return "0x" + keccak(text=signature).hex()
+
+
+SEL = {name: _selector(name) for name in (
+    "auction()", "getAllBids()", "getBid(string)", "getBidCount()",
+    "createBidReservePrice()", "contributeBidReservePrice()",
+    "createBid(uint256,string,string)", "contributeToBid(uint256,string,string)",
+    "aggregate3((address,bool,bytes)[])", "getEthBalance(address)",
+    "balanceOf(address)", "allowance(address,address)", "approve(address,uint256)",
+)}
+ERRORS = {name: _selector(f"{name}()") for name in ("URL_ALREADY_HAS_BID", "BID_NOT_FOUND", "USDC_TOKEN_TRANSFER_FAILED")}
+TOPICS = {
+    "AuctionCreated": _topic("AuctionCreated(uint256,uint256,uint256)"),
+    "AuctionBid": _topic("AuctionBid(uint256,address,uint256,bool,uint256,string,string)"),
+    "BidContributionMade": _topic("BidContributionMade(uint256,string,address,uint256,uint256,bool,uint256,string)"),
+}
+
+
+class Revert(Exception):
+    """A call the contract would revert, with its revert data."""
+
+    def __init__(self, data):
+        super().__init__("execution reverted")
+        self.data = data
+
+
+class Fault(Exception):
+    """A JSON-RPC error answer from the node itself (result cap, rate limit)."""
+
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+def _word(n):
+    return n.to_bytes(32, "big")
+
+
+def _padded(raw):
+    return _word(len(raw)) + raw + b"\0" * (-len(raw) % 32)
+
+
+def _encode_bid(bid):
+    """ABI-encode one Bid tuple body (same bytes as eth_abi, much faster for 50k bids)."""
+    total, url, contributions = bid
+    url_part = _padded(url.encode())
+    parts = [_word(total), _word(96), _word(96 + len(url_part)), url_part, _word(len(contributions))]
+    for contributor, amount, timestamp in contributions:
+        parts += [b"\0" * 12 + bytes.fromhex(contributor[2:]), _word(amount), _word(timestamp)]
+    return b"".join(parts)
+
+
+def _encode_bids(bids):
+    bodies = [_encode_bid(bid) for bid in bids]
+    offsets, position = [], 32 * len(bodies)
+    for body in bodies:
+        offsets.append(_word(position))
+        position += len(body)
+    return _word(32) + _word(len(bodies)) + b"".join(offsets) + b"".join(bodies)
+
+
+def make_bids(count, contributions):
+    """Deterministic bids: amounts vary so ranking does real work."""
+    bids = []
+    for i in range(count):
+        contribs = [
+            ("0x%040x" % (1 + (i * 7 + j) % 5000), 1_000_000 * (1 + (i * 37 + j * 11) % 50),
+             1_700_000_000 + i + j)
+            for j in range(contributions)
+        ]
+        bids.append((sum(c[1] for c in contribs), f"https://example.com/bid/{i}", contribs))
+    return bids
+
+
+class MockChain:
+    """The auction's chain state plus a threaded HTTP JSON-RPC server over it."""
+
+    def __init__(self, bids=10, contributions=3, latency=0.0, port=0, max_logs=None):
+        self.bids = make_bids(bids, contributions)
+        self.by_url = {bid[1]: bid for bid in self.bids}
+        self.leader = max(self.bids, key=lambda bid: bid[0], default=(0, "", []))
+        self.latency = latency
+        self.port = port
+        self.max_logs = max_logs
+        self.block = HEAD_BLOCK
+        self.allowance = USDC_BALANCE
+        self.started = int(time.time()) - 3_600
+        self.ends = self.started + 86_400
+        self.sent = {}
+        self.stats = {"requests": 0, "calls": 0, "methods": Counter()}
+        self._all_bids = None
+        self._logs = None
+        self._faults = {}
+        self._http_faults = None
+        self._reorgs = []
+        self._lock = threading.Lock()
+        self._server = None
+
+    # -- contract state ---------------------------------------------------
+
+    def all_bids(self):
+        if self._all_bids is None:
+            self._all_bids = _encode_bids(self.bids)
+        return self._all_bids
+
+    def contract_call(self, to, data):
+        """Return data for an eth_call of `data` (bytes) on `to`; raises Revert."""
+        selector, args = data[:4], data[4:]
+        if to == AUCTION:
+            if selector == SEL["getAllBids()"]:
+                return self.all_bids()
+            if selector == SEL["auction()"]:
+                return encode(AUCTION_TYPES, [TOKEN_ID, self.leader, self.started, self.ends, False,
+                                              (0, "https://qrcoin.fun")])
+            if selector == SEL["getBid(string)"]:
+                (url,) = decode(["string"], args)
+                return encode([BID_TYPE], [self.by_url.get(url, (0, "", []))])
+            if selector == SEL["getBidCount()"]:
+                return _word(len(self.bids))
+            if selector == SEL["createBidReservePrice()"]:
+                return _word(CREATE_RESERVE)
+            if selector == SEL["contributeBidReservePrice()"]:
+                return _word(CONTRIBUTE_RESERVE)
+            if selector in (SEL["createBid(uint256,string,string)"], SEL["contributeToBid(uint256,string,string)"]):
+                _, url, _ = decode(["uint256", "string", "string"], args)
+                if selector == SEL["createBid(uint256,string,string)"] and url in self.by_url:
+                    raise Revert(ERRORS["URL_ALREADY_HAS_BID"])
+                if selector == SEL["contributeToBid(uint256,string,string)"] and url not in self.by_url:
+                    raise Revert(ERRORS["BID_NOT_FOUND"])
+                reserve = CREATE_RESERVE if selector == SEL["createBid(uint256,string,string)"] else CONTRIBUTE_RESERVE
+                if self.allowance < reserve:
+                    raise Revert(ERRORS["USDC_TOKEN_TRANSFER_FAILED"])
+                return b""
+        elif to == USDC:
+            if selector == SEL["balanceOf(address)"]:
+                return _word(USDC_BALANCE)
+            if selector == SEL["allowance(address,address)"]:
+                return _word(self.allowance)
+            if selector == SEL["approve(address,uint256)"]:
+                return _word(1)
+        elif to == MULTICALL3:
+            if selector == SEL["getEthBalance(address)"]:
+                return _word(ETH_BALANCE)
+            if selector == SEL["aggregate3((address,bool,bytes)[])"]:
+                (calls,) = decode(["(address,bool,bytes)[]"], args)
+                results = []
+                for target, allow_failure, call_data in calls:
+                    try:
+                        results.append((True, self.contract_call(target.lower(), call_data)))
+                    except Revert as e:
+                        if not allow_failure:
+                            raise
+                        results.append((False, e.data))
+                return encode(["(bool,bytes)[]"], [results])
+        raise Revert(b"")
+
+    def logs(self):
+        """AuctionCreated, then AuctionBid per bid and BidContributionMade per later contribution."""
+        if self._logs is None:
+            logs = []
+            address = to_checksum_address(AUCTION)
+
+            def add(topics, data):
+                index = len(logs)
+                block = FIRST_LOG_BLOCK + index // LOGS_PER_BLOCK
+                logs.append({
+                    "address": address,
+                    "blockNumber": hex(block),
+                    "blockHash": "0x%064x" % block,
+                    "transactionHash": "0x%064x" % (index + 1 << 128),
+                    "transactionIndex": "0x0",
+                    "logIndex": hex(index % LOGS_PER_BLOCK),
+                    "topics": topics,
+                    "data": "0x" + data.hex(),
+                    "removed": False,
+                })
+
+            token = "0x" + _word(TOKEN_ID).hex()
+            add([TOPICS["AuctionCreated"], token, "0x" + _word(self.started).hex(), "0x" + _word(self.ends).hex()], b"")
+            name_part = _padded(b"bench")
+            for total, url, contributions in self.bids:
+                url_part = _padded(url.encode())
+                running = 0
+                for k, (contributor, amount, _) in enumerate(contributions):
+                    running += amount
+                    who = "0x" + (b"\0" * 12 + bytes.fromhex(contributor[2:])).hex()
+                    if k == 0:
+                        # (bool extended, uint256 endTime, string urlString, string name)
+                        data = _word(0) + _word(self.ends) + _word(128) + _word(128 + len(url_part)) + url_part + name_part
+                        add([TOPICS["AuctionBid"], token, who, "0x" + _word(amount).hex()], data)
+                    else:
+                        # (string urlString, uint256 totalAmount, bool extended, uint256 endTime, string name)
+                        data = (_word(160) + _word(running) + _word(0) + _word(self.ends)
+                                + _word(160 + len(url_part)) + url_part + name_part)
+                        add([TOPICS["BidContributionMade"], token, who, "0x" + _word(amount).hex()], data)
+            self._logs = logs
+        return self._logs
+
+    def get_logs(self, query):
+        def block(value, default):
+            if value in (None, "latest", "pending", "safe", "finalized"):
+                return default
+            return int(value, 16) if isinstance(value, str) else int(value)
+
+        low, high = block(query.get("fromBlock"), self.block), block(query.get("toBlock"), self.block)
+        topics = query.get("topics") or []
+        wanted = topics[0] if topics else None
+        if isinstance(wanted, str):
+            wanted = [wanted]
+        out = []
+        for log in self.logs():
+            number = int(log["blockNumber"], 16)
+            if number < low or number > high:
+                continue
+            if wanted and log["topics"][0] not in wanted:
+                continue
+            out.append(log)
+        if self.max_logs is not None and len(out) > self.max_logs:
+            raise Fault(-32005, f"query returned more than {self.max_logs} results")
+        return out
+
+    def inject(self, method, code, message, times=1, after=0):
+        """Answer `times` calls of `method` with error (code, message), after letting `after` through."""
+        with self._lock:
+            self._faults[method] = [after, times, code, message]
+
+    def _fault(self, method):
+        with self._lock:
+            fault = self._faults.get(method)
+            if fault is None:
+                return None
+            if fault[0]:
+                fault[0] -= 1
+                return None
+            fault[1] -= 1
+            if not fault[1]:
+                del self._faults[method]
+            return Fault(fault[2], fault[3])
+
+    def reorg(self, block):
+        """Give `block` and every later block a new hash, as if the chain reorganized there."""
+        with self._lock:
+            self._reorgs.append(block)
+
+    def block_hash(self, number):
+        fork = sum(1 for block in self._reorgs if number >= block)
+        return "0x%064x" % (number + (fork << 128))
+
+    def inject_http(self, status, times=1):
+        """Answer the next `times` HTTP requests with a bare `status` and a plain-text body."""
+        with self._lock:
+            self._http_faults = [times, status]
+
+    def _http_status(self):
+        with self._lock:
+            if self._http_faults is None:
+                return 200
+            self._http_faults[0] -= 1
+            status = self._http_faults[1]
+            if not self._http_faults[0]:
+                self._http_faults = None
+            return status
+
+    # -- JSON-RPC ---------------------------------------------------------
+
+    def handle(self, method, params):
+        if method == "eth_chainId":
+            return hex(CHAIN_ID)
+        if method == "eth_blockNumber":
+            return hex(self.block)
+        if method == "eth_call":
+            if len(params) > 1 and str(params[1]).startswith("0x") and int(params[1], 16) > self.block:
+                raise Fault(-32000, "header not found")  # Pinned past our head, like a lagging node
+            data = bytes.fromhex(params[0].get("data", "0x")[2:])
+            return "0x" + self.contract_call(params[0]["to"].lower(), data).hex()
+        if method == "eth_estimateGas":
+            data = bytes.fromhex(params[0].get("data", "0x")[2:])
+            self.contract_call(params[0]["to"].lower(), data)
+            return hex(GAS_ESTIMATE)
+        if method == "eth_getLogs":
+            return self.get_logs(params[0])
+        if method == "eth_getBalance":
+            return hex(ETH_BALANCE)
+        if method == "eth_getCode":
+            return "0x6080"
+        if method == "eth_getTransactionCount":
+            if params[1] == "pending":
+                return hex(len(self.sent))
+            return hex(sum(1 for block in self.sent.values() if block < self.block))
+        if method == "eth_gasPrice":
+            return hex(2 * BASE_FEE)
+        if method == "eth_maxPriorityFeePerGas":
+            return hex(BASE_FEE // 10)
+        if method == "eth_feeHistory":
+            count = int(params[0], 16) if isinstance(params[0], str) else int(params[0])
+            percentiles = params[2] if len(params) > 2 else []
+            oldest = self.block - count + 1
+            return {
+                "oldestBlock": hex(oldest),
+                "baseFeePerGas": [hex(BASE_FEE)] * (count + 1),
+                "gasUsedRatio": [0.5] * count,
+                "reward": [[hex(BASE_FEE // 100 * (1 + int(p))) for p in percentiles] for _ in range(count)],
+            }
+        if method == "eth_getBlockByNumber":
+            number = self.block if params[0] in ("latest", "pending") else int(params[0], 16)
+            return {
+                "number": hex(number),
+                "hash": self.block_hash(number),
+                "parentHash": self.block_hash(number - 1),
+                "timestamp": hex(self.started + 2 * (number - HEAD_BLOCK) + 3_600),
+                "baseFeePerGas": hex(BASE_FEE),
+                "gasLimit": hex(30_000_000),
+                "gasUsed": hex(15_000_000),
+                "transactions": [],
+            }
+        if method == "eth_sendRawTransaction":
+            tx_hash = "0x" + keccak(bytes.fromhex(params[0][2:])).hex()
+            with self._lock:
+                self.sent[tx_hash] = self.block
+            return tx_hash
+        if method == "eth_getTransactionReceipt":
+            block = self.sent.get(params[0])
+            if block is None:
+                return None
+            return {
+                "transactionHash": params[0],
+                "status": "0x1",
+                "blockNumber": hex(block + 1),
+                "gasUsed": hex(GAS_ESTIMATE * 2 // 3),
+                "effectiveGasPrice": hex(BASE_FEE + BASE_FEE // 10),
+                "logs": [],
+            }
+        raise ValueError(f"method not supported by the mock: {method}")
+
+    def reply(self, request):
+        with self._lock:
+            self.stats["calls"] += 1
+            self.stats["methods"][request.get("method")] += 1
+        try:
+            fault = self._fault(request.get("method"))
+            if fault is not None:
+                raise fault
+            result = self.handle(request.get("method"), request.get("params") or [])
+            return {"jsonrpc": "2.0", "id": request.get("id"), "result": result}
+        except Revert as e:
+            return {"jsonrpc": "2.0", "id": request.get("id"),
+                    "error": {"code": 3, "message": "execution reverted", "data": "0x" + e.data.hex()}}
+        except Fault as e:
+            return {"jsonrpc": "2.0", "id": request.get("id"), "error": {"code": e.code, "message": str(e)}}
+        except Exception as e:
+            return {"jsonrpc": "2.0", "id": request.get("id"), "error": {"code": -32601, "message": str(e)}}
+
+    # -- server -----------------------------------------------------------
+
+    def start(self):
+        chain = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like a real provider
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with chain._lock:
+                    chain.stats["requests"] += 1
+                if chain.latency:
+                    time.sleep(chain.latency)
+                status = chain._http_status()
+                if status != 200:
+                    data = f"HTTP {status} from mock".encode()
+                    self.send_response(status)
+                    self.send_header("Content-Type", "text/plain")
+                    self.send_header("Content-Length", str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                    return
+                if isinstance(body, list):
+                    out = [chain.reply(request) for request in body]
+                else:
+                    out = chain.reply(body)
+                data = json.dumps(out).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", self.port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self.url
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def reset_stats(self):
+        self.stats = {"requests": 0, "calls": 0, "methods": Counter()}
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a mock QR auction over JSON-RPC")
+    parser.add_argument("--bids", type=int, default=10, help="Number of bids (default 10)")
+    parser.add_argument("--contributions", type=int, default=3, help="Contributions per bid (default 3)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Milliseconds slept per HTTP request")
+    parser.add_argument("--port", type=int, default=8545, help="Port (default 8545)")
+    parser.add_argument("--max-logs", type=int, help="Reject eth_getLogs queries returning more logs than this")
+    args = parser.parse_args()
+
+    chain = MockChain(args.bids, args.contributions, args.latency / 1000, args.port, args.max_logs)
+    chain.all_bids()
+    print(f"Mock auction with {args.bids} bids serving on {chain.start()} (Ctrl-C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        chain.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Parallel historical backfill of auction events into the indexer database.
+
+Splits the range from contract deployment up to the indexer cursor (or
+head - confirmations on a fresh database) into chunks and fetches
+eth_getLogs for them concurrently with a bounded worker pool. When a
+provider rejects a chunk for returning too many results, the chunk is
+bisected and both halves are retried; when it rate-limits a request, the
+same chunk is retried with exponential backoff instead (splitting would
+only multiply the requests). Completed chunks are checkpointed in the
+database, so an interrupted run resumes where it stopped.
+
+Usage:
+    backfill.py                      Backfill from the deployment block
+    backfill.py --from-block N       Backfill from block N
+    backfill.py --workers 8          Concurrent eth_getLogs requests (default 4)
+    backfill.py --chunk 5000         Initial blocks per request (default 2000)
+    backfill.py --reset              Forget checkpoints and start over
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from events import decode_log
+from indexer import CONTRACT_ADDR, DEFAULT_CONFIRMATIONS, MAX_BLOCK_RANGE, Indexer
+from rpcpool import load_rpc_client
+
+DEFAULT_WORKERS = 4
+MAX_RETRIES = 3
+MAX_RATE_LIMIT_RETRIES = 6
+RATE_LIMIT_BACKOFF = 1.0  # seconds, doubling per consecutive rate limit
+
+# Substrings providers use when a getLogs result or block range would be too large
+TOO_MANY_RESULTS = (
+    "too many results",
+    "returned more than",
+    "response size",
+    "result size",
+    "block range",
+    "range is too large",
+    "range too large",
+    "is limited to",
+)
+
+# Substrings of rate-limit errors (some providers reuse -32005 for these)
+RATE_LIMITED = (
+    "rate limit",
+    "too many requests",
+    "exceeded the quota",
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS backfill_chunks (
+    start_block INTEGER NOT NULL,
+    end_block INTEGER NOT NULL,
+    log_count INTEGER NOT NULL,
+    PRIMARY KEY (start_block, end_block)
+);
+"""
+
+
+class RangeTooLarge(Exception):
+    """Provider refused a block range; split it and retry."""
+
+
+def is_too_many_results(error):
+    message = str(error).lower()
+    return any(marker in message for marker in TOO_MANY_RESULTS)
+
+
+def is_rate_limited(error):
+    if getattr(error, "code", None) == 429:
+        return True
+    message = str(error).lower()
+    return any(marker in message for marker in RATE_LIMITED)
+
+
+def find_deploy_block(client, high=None):
+    """Binary-search the first block where the auction contract has code."""
+    low, high = 0, high if high is not None else client.eth.block_number
+    while low < high:
+        mid = (low + high) // 2
+        if len(client.eth.get_code(CONTRACT_ADDR, mid)) > 0:
+            high = mid
+        else:
+            low = mid + 1
+    return low
+
+
+def missing_ranges(start, end, done):
+    """Sub-ranges of [start, end] not covered by the sorted `done` ranges."""
+    gaps = []
+    position = start
+    for lo, hi in sorted(done):
+        if hi < position:
+            continue
+        if lo > end:
+            break
+        if lo > position:
+            gaps.append((position, lo - 1))
+        position = max(position, hi + 1)
+    if position <= end:
+        gaps.append((position, end))
+    return gaps
+
+
+def split_chunks(ranges, size):
+    chunks = []
+    for lo, hi in ranges:
+        while lo <= hi:
+            chunks.append((lo, min(lo + size - 1, hi)))
+            lo += size
+    return chunks
+
+
+def fetch_chunk(indexer, client, start, end):
+    """Fetch one range, raising RangeTooLarge if the provider caps it."""
+    failures = throttled = 0
+    while True:
+        try:
+            return indexer.fetch_logs(client, start, end)
+        except Exception as e:
+            if is_rate_limited(e):
+                if throttled == MAX_RATE_LIMIT_RETRIES:
+                    raise
+                time.sleep(RATE_LIMIT_BACKOFF * 2 ** throttled)
+                throttled += 1
+                continue
+            if is_too_many_results(e):
+                raise RangeTooLarge(str(e))
+            failures += 1
+            if failures == MAX_RETRIES:
+                raise
+            time.sleep(0.5 * 2 ** (failures - 1))
+
+
+def backfill(indexer, client, start, end, workers=DEFAULT_WORKERS, chunk=MAX_BLOCK_RANGE, quiet=False):
+    """
+    Index every log in [start, end] with up to `workers` concurrent requests.
+
+    Logs are fetched in worker threads and applied on the calling thread
+    (SQLite connections aren't shared across threads). Returns the number
+    of events applied.
+    """
+    indexer.db.executescript(SCHEMA)
+    done = indexer.db.execute("SELECT start_block, end_block FROM backfill_chunks").fetchall()
+    pending = split_chunks(missing_ranges(start, end, done), chunk)
+    total_blocks = sum(hi - lo + 1 for lo, hi in pending)
+    fetched_blocks = 0
+    applied = 0
+
+    if not quiet:
+        print(f"Backfilling blocks {start}-{end}: {len(pending)} chunks, {total_blocks} blocks to fetch", file=sys.stderr)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        running = {}
+        while pending or running:
+            while pending and len(running) < workers:
+                lo, hi = pending.pop(0)
+                running[pool.submit(fetch_chunk, indexer, client, lo, hi)] = (lo, hi)
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                lo, hi = running.pop(future)
+                try:
+                    logs = future.result()
+                except RangeTooLarge:
+                    if lo == hi:
+                        raise RuntimeError(f"Provider rejects logs for single block {lo}")
+                    mid = (lo + hi) // 2
+                    # Run the halves next so progress stays roughly in order
+                    pending[:0] = [(lo, mid), (mid + 1, hi)]
+                    continue
+
+                for log in logs:
+                    event = decode_log(log)
+                    if event is not None:
+                        indexer.apply(event)
+                        applied += 1
+                indexer.db.execute(
+                    "INSERT OR REPLACE INTO backfill_chunks VALUES (?, ?, ?)",
+                    (lo, hi, len(logs)),
+                )
+                indexer.db.commit()
+                fetched_blocks += hi - lo + 1
+                if not quiet:
+                    pct = 100 * fetched_blocks / total_blocks if total_blocks else 100
+                    print(f"  {lo}-{hi}: {len(logs)} logs ({pct:.1f}%)", file=sys.stderr)
+
+    return applied
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill historical QR Coin auction events")
+    parser.add_argument("--from-block", type=int, help="First block (default: contract deployment block)")
+    parser.add_argument("--to-block", type=int, help="Last block (default: indexer cursor or head - confirmations)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Concurrent eth_getLogs requests")
+    parser.add_argument("--chunk", type=int, default=MAX_BLOCK_RANGE, help="Initial blocks per request")
+    parser.add_argument("--confirmations", type=int, default=DEFAULT_CONFIRMATIONS, help="Blocks behind head to stop at")
+    parser.add_argument("--reset", action="store_true", help="Forget backfill checkpoints")
+    args = parser.parse_args()
+
+    indexer = Indexer()
+    indexer.db.executescript(SCHEMA)
+    if args.reset:
+        indexer.db.execute("DELETE FROM backfill_chunks")
+        indexer.set_meta("backfill_range", None)
+        indexer.db.commit()
+
+    client = load_rpc_client()
+    if not client.is_connected():
+        print("Error: Cannot connect to Base RPC", file=sys.stderr)
+        sys.exit(1)
+
+    # Keep the range stable across resumes
+    saved = indexer.get_meta("backfill_range")
+    if saved and args.from_block is None and args.to_block is None:
+        start, end = (int(x) for x in saved.split(":"))
+    else:
+        if args.to_block is not None:
+            end = args.to_block
+        elif indexer.cursor() is not None:
+            end = indexer.cursor()
+        else:
+            end = client.eth.block_number - args.confirmations
+        if args.from_block is not None:
+            start = args.from_block
+        else:
+            print("Locating contract deployment block...", file=sys.stderr)
+            start = find_deploy_block(client, end)
+        indexer.set_meta("backfill_range", f"{start}:{end}")
+        indexer.db.commit()
+
+    started = time.time()
+    applied = backfill(indexer, client, start, end, args.workers, args.chunk)
+
+    # A fresh database can continue incrementally from where backfill ended
+    if indexer.cursor() is None:
+        indexer.set_meta("cursor", end)
+        indexer.db.commit()
+
+    print(f"✓ Backfilled blocks {start}-{end}: {applied} events in {time.time() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
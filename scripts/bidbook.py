@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Ranked bid book shared by query-bids.py output modes and the watcher.
+
+Bids are indexed by URL and kept ordered by totalAmount (highest first,
+ties in first-seen order, matching a stable sort of getAllBids()). A
+single contribution is applied with one remove + one insert into the
+ordered index, and rank / top-K / gap-to-leader are answered from it
+without re-sorting.
+
+Uses sortedcontainers.SortedList when installed (O(log n) updates);
+otherwise falls back to a bisect-maintained list.
+"""
+
+from bisect import bisect_left, insort
+
+from records import Bid, Contribution
+
+try:
+    from sortedcontainers import SortedList
+except ImportError:
+    SortedList = None
+
+
+class _BisectList:
+    """Minimal SortedList stand-in backed by a plain list."""
+
+    def __init__(self, items=()):
+        self._items = sorted(items)
+
+    def add(self, item):
+        insort(self._items, item)
+
+    def remove(self, item):
+        i = bisect_left(self._items, item)
+        if i == len(self._items) or self._items[i] != item:
+            raise ValueError(f"{item!r} not in list")
+        del self._items[i]
+
+    def index(self, item):
+        i = bisect_left(self._items, item)
+        if i == len(self._items) or self._items[i] != item:
+            raise ValueError(f"{item!r} not in list")
+        return i
+
+    def __getitem__(self, i):
+        return self._items[i]
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+
+class BidBook:
+    """URL-indexed bids ordered by totalAmount."""
+
+    def __init__(self, bids=()):
+        self._bids = {}
+        self._keys = {}
+        self._seq = 0
+        for bid in bids:
+            self._index_key(bid)
+        keys = self._keys.values()
+        self._order = SortedList(keys) if SortedList is not None else _BisectList(keys)
+
+    def _index_key(self, bid):
+        url = bid.urlString
+        self._bids[url] = bid
+        key = (-bid.totalAmount, self._seq, url)
+        self._seq += 1
+        self._keys[url] = key
+        return key
+
+    # -- updates ----------------------------------------------------------
+
+    def add(self, bid):
+        """Insert a new bid, or replace the one with the same URL."""
+        url = bid.urlString
+        if url in self._keys:
+            self._order.remove(self._keys[url])
+            seq = self._keys[url][1]
+            self._bids[url] = bid
+            self._keys[url] = (-bid.totalAmount, seq, url)
+            self._order.add(self._keys[url])
+        else:
+            self._order.add(self._index_key(bid))
+        return bid
+
+    def contribute(self, url, contributor, amount, timestamp=None, total=None):
+        """
+        Record one contribution to `url`, creating the bid if needed.
+
+        `total` is the on-chain totalAmount after the contribution when
+        known (e.g. from BidContributionMade); otherwise amount is added.
+        """
+        bid = self._bids.get(url)
+        if bid is None:
+            bid = self.add(Bid(0, url))
+        new_total = total if total is not None else bid.totalAmount + amount
+        bid.contributions.append(Contribution(contributor, amount, timestamp))
+        self.set_total(url, new_total)
+        return bid
+
+    def set_total(self, url, total):
+        """Move `url` to its new position for `total`."""
+        old_key = self._keys[url]
+        if old_key[0] == -total:
+            return
+        self._order.remove(old_key)
+        new_key = (-total, old_key[1], url)
+        self._keys[url] = new_key
+        self._bids[url].totalAmount = total
+        self._order.add(new_key)
+
+    # -- queries ----------------------------------------------------------
+
+    def __len__(self):
+        return len(self._bids)
+
+    def __contains__(self, url):
+        return url in self._bids
+
+    def get(self, url):
+        return self._bids.get(url)
+
+    def rank(self, url):
+        """1-based rank of `url`, or None if it has no bid."""
+        key = self._keys.get(url)
+        if key is None:
+            return None
+        return self._order.index(key) + 1
+
+    def leader(self):
+        return self._bids[self._order[0][2]] if self._bids else None
+
+    def top(self, k):
+        """The k highest bids, best first."""
+        return [self._bids[self._order[i][2]] for i in range(min(k, len(self._order)))]
+
+    def ranked(self):
+        """Iterate (rank, bid) from highest to lowest."""
+        for rank, key in enumerate(self._order, 1):
+            yield rank, self._bids[key[2]]
+
+    def gap_to_leader(self, url):
+        """Amount `url` is behind the leader (0 if it leads), or None."""
+        bid = self._bids.get(url)
+        if bid is None:
+            return None
+        return self.leader().totalAmount - bid.totalAmount
+
+
+def as_book(bids):
+    """Accept either a BidBook or a list of Bids."""
+    return bids if isinstance(bids, BidBook) else BidBook(bids)
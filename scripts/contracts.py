@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+Base Mainnet contracts and transaction defaults shared by the scripts
+that sign (qrcoin.py, presign.py, signer.py).
+
+Kept in its own module so they can import these without importing
+qrcoin.py, which would load it a second time when it is __main__.
+Function selectors live in encode.py (SELECTORS).
+"""
+
+AUCTION = "0x7309779122069EFa06ef71a45AE0DB55A259A176"
+USDC = "0x833589fCD6eDb6E08f4c7c32D4f71b54bdA02913"
+CHAIN_ID = 8453
+
+DEFAULT_GAS_LIMIT = 500_000
+GAS_BUFFER = 1.3
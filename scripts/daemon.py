@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Resident daemon that keeps the read-only commands warm.
+
+Every heartbeat command otherwise starts a cold interpreter, re-imports
+the decoders and opens a fresh (TLS) connection to the RPC. `daemon.py
+start` loads the scripts once and serves them on a Unix socket, with
+RPC connections shared across commands (rpc.share_connections) and the
+view-call cache kept open.
+
+The scripts forward to it by themselves before their heavy imports:
+query-bids.py (except --watch), wallet.py balance(s) and qrcoin.py status /
+--build (build-tx.sh). When the daemon isn't running, the command isn't
+one it serves, or it fails there, the script runs directly as before.
+Anything that signs or prompts always runs directly; wallet.py balance
+is only answered when the address is known without the keychain (config
+or signer agent). Set QRCOIN_DIRECT=1 to bypass the daemon.
+
+Usage:
+    daemon.py start [--foreground]   Start serving
+    daemon.py status                 Show uptime and commands served
+    daemon.py stop                   Stop the daemon
+"""
+
+import json
+import os
+import socket
+import sys
+import time
+from pathlib import Path
+
+SOCKET_FILE = Path.home() / ".clawdbot" / "skills" / "qrcoin" / "daemon.sock"
+SCRIPT_DIR = Path(__file__).resolve().parent
+CONNECT_TIMEOUT = 0.5  # seconds; past these the client runs directly
+RUN_TIMEOUT = 60
+READ_TIMEOUT = 5  # seconds the daemon waits on a client's request or reply
+SERVING_ENV = "QRCOIN_DAEMON"  # Set in the daemon process, so scripts can avoid prompting
+
+
+def _qrcoin_served(argv):
+    actions = [arg for arg in argv if not arg.startswith("-")]
+    return "--build" in argv or actions[:1] == ["status"]
+
+
+# script -> argv predicate: the read-only invocations the daemon runs
+SERVED = {
+    "query-bids.py": lambda argv: "--watch" not in argv,
+    "wallet.py": lambda argv: argv[:1] in (["balance"], ["balances"]),
+    "qrcoin.py": _qrcoin_served,
+}
+
+
+def request(message, timeout=None):
+    """Send one request to the daemon and return its reply (raises OSError if not running)."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(str(SOCKET_FILE))
+        sock.settimeout(timeout)
+        sock.sendall(json.dumps(message).encode() + b"\n")
+        line = sock.makefile("rb").readline()
+    if not line:
+        raise ConnectionError("daemon closed the connection")
+    return json.loads(line)
+
+
+def forward(script):
+    """
+    Run this invocation in the daemon and exit with its result, if it can.
+
+    Called from a script's __main__ guard before its heavy imports.
+    Returns (so the script runs directly) when the daemon isn't running,
+    doesn't serve these arguments, or the command failed there.
+    """
+    argv = sys.argv[1:]
+    if os.environ.get("QRCOIN_DIRECT") or not SERVED[script](argv) or not SOCKET_FILE.exists():
+        return
+    trace = os.environ.get("QRCOIN_TRACE")
+    try:
+        reply = request({"op": "run", "script": script, "argv": argv, "cwd": os.getcwd(),
+                         "trace": trace and os.path.abspath(trace)}, RUN_TIMEOUT)
+    except (OSError, ValueError):
+        return
+    if reply.get("code") != 0:
+        return  # Read-only, so running it again directly is safe
+    sys.stdout.write(reply["stdout"])
+    sys.stderr.write(reply["stderr"])
+    sys.stdout.flush()
+    sys.exit(0)
+
+
+class Daemon:
+    """Runs SERVED scripts' main() in-process, one command at a time."""
+
+    def __init__(self):
+        import importlib.util
+        import rpc
+
+        rpc.share_connections()
+        os.environ[SERVING_ENV] = "1"
+        self.modules = {}
+        for script in SERVED:
+            spec = importlib.util.spec_from_file_location(script[:-3].replace("-", "_"), SCRIPT_DIR / script)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            self.modules[script] = module
+        self.started = time.time()
+        self.served = 0
+        self.busy = 0.0
+        self.running = True
+
+    def run(self, script, argv, trace=None, cwd=None):
+        """
+        Run one served command and capture its output. `cwd` is the
+        client's working directory, so relative paths in argv (e.g.
+        wallet.py balances --file) resolve as they would run directly.
+        """
+        import contextlib
+        import io
+        import traceback
+        import tracing
+
+        if script not in SERVED or not SERVED[script](argv):
+            return {"code": 2, "stdout": "", "stderr": f"{script} {' '.join(argv)} is not served\n"}
+        saved_cwd = os.getcwd()
+        try:
+            if cwd:
+                os.chdir(cwd)
+        except OSError as e:
+            return {"code": 2, "stdout": "", "stderr": f"cannot run in {cwd}: {e}\n"}
+        stdout, stderr = io.StringIO(), io.StringIO()
+        saved_argv = sys.argv
+        sys.argv = [script] + list(argv)
+        # The client's QRCOIN_TRACE (span file) applies to its command only
+        saved_trace = os.environ.pop(tracing.TRACE_ENV, None)
+        if trace:
+            os.environ[tracing.TRACE_ENV] = trace
+        mark = time.perf_counter()
+        code = 0
+        try:
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                tracing.configure(sys.argv)
+                try:
+                    self.modules[script].main()
+                except SystemExit as e:
+                    if isinstance(e.code, str):
+                        print(e.code, file=sys.stderr)
+                    code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+                except Exception:
+                    traceback.print_exc()
+                    code = 1
+                tracing.finish()
+        finally:
+            os.chdir(saved_cwd)
+            sys.argv = saved_argv
+            os.environ.pop(tracing.TRACE_ENV, None)
+            if saved_trace is not None:
+                os.environ[tracing.TRACE_ENV] = saved_trace
+        self.served += 1
+        self.busy += time.perf_counter() - mark
+        return {"code": code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+    def dispatch(self, message):
+        op = message.get("op")
+        if op == "run":
+            return self.run(message.get("script"), message.get("argv") or [], message.get("trace"),
+                            message.get("cwd"))
+        if op == "status":
+            return {"pid": os.getpid(), "uptime": time.time() - self.started,
+                    "served": self.served, "busy": self.busy}
+        if op == "stop":
+            self.running = False
+            return {"stopped": True}
+        return {"error": f"unknown op: {op}"}
+
+    def serve(self, path=SOCKET_FILE):
+        import socketserver
+        from peercred import peer_is_owner
+
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                if not peer_is_owner(self.request):
+                    return
+                # Commands are served one at a time: a stuck client must not stall the rest
+                self.request.settimeout(READ_TIMEOUT)
+                try:
+                    line = self.rfile.readline()
+                except OSError:
+                    return
+                try:
+                    reply = daemon.dispatch(json.loads(line))
+                except ValueError as e:
+                    reply = {"error": str(e)}
+                try:
+                    self.wfile.write(json.dumps(reply).encode() + b"\n")
+                except OSError:
+                    pass  # The client gave up (or stopped reading); it runs directly
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists():
+            path.unlink()
+        old_umask = os.umask(0o077)
+        try:
+            server = socketserver.UnixStreamServer(str(path), Handler)
+        finally:
+            os.umask(old_umask)
+        try:
+            while self.running:
+                server.handle_request()
+        finally:
+            server.server_close()
+            if path.exists():
+                path.unlink()
+
+
+def start(foreground):
+    try:
+        request({"op": "status"})
+        print(f"Daemon already running ({SOCKET_FILE})")
+        sys.exit(1)
+    except (OSError, ValueError):
+        pass
+
+    daemon = Daemon()
+    if not foreground:
+        pid = os.fork()
+        if pid:
+            print(f"✓ Daemon running (pid {pid})")
+            print(f"Socket: {SOCKET_FILE}")
+            return
+        os.setsid()
+        devnull = os.open(os.devnull, os.O_RDWR)
+        for fd in (0, 1, 2):
+            os.dup2(devnull, fd)
+    daemon.serve()
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    cmd = sys.argv[1]
+
+    if cmd == 'start':
+        start('--foreground' in sys.argv)
+    elif cmd in ('status', 'stop'):
+        try:
+            reply = request({"op": cmd}, timeout=5)
+        except (OSError, ValueError):
+            print("No daemon running")
+            sys.exit(1)
+        if cmd == 'stop':
+            print("✓ Daemon stopped")
+        else:
+            served = reply["served"]
+            average = reply["busy"] / served * 1000 if served else 0
+            print(f"PID:     {reply['pid']}")
+            print(f"Uptime:  {int(reply['uptime'])}s")
+            print(f"Served:  {served} commands ({average:.1f}ms average)")
+    else:
+        print(f"Unknown command: {cmd}")
+        print(__doc__)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
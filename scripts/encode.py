@@ -11,13 +11,13 @@ Functions:
 
 import sys
 from eth_abi import encode
-from web3 import Web3
+from eth_utils import keccak
 
 # Function selectors (keccak256 of signature, first 4 bytes)
 SELECTORS = {
-    'approve': Web3.keccak(text='approve(address,uint256)')[:4].hex(),
-    'createBid': Web3.keccak(text='createBid(uint256,string,string)')[:4].hex(),
-    'contributeToBid': Web3.keccak(text='contributeToBid(uint256,string,string)')[:4].hex(),
+    'approve': keccak(text='approve(address,uint256)')[:4].hex(),
+    'createBid': keccak(text='createBid(uint256,string,string)')[:4].hex(),
+    'contributeToBid': keccak(text='contributeToBid(uint256,string,string)')[:4].hex(),
 }
 
 def encode_approve(spender: str, amount_wei: int) -> str:
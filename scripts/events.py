@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Decode auction contract event logs using references/auction-abi.json.
+
+Works on logs as returned by web3 (HexBytes topics) or raw JSON-RPC
+(hex strings), without building a web3 contract object.
+
+Usage (as a library):
+    from events import TOPICS, decode_log
+
+    logs = w3.eth.get_logs({"address": AUCTION, "topics": [TOPICS.values()]})
+    for log in logs:
+        event = decode_log(log)   # {"event": "AuctionBid", "tokenId": ..., ...}
+"""
+
+import json
+from pathlib import Path
+
+from eth_abi import decode
+from eth_utils import keccak, to_checksum_address
+
+ABI_FILE = Path(__file__).parent.parent / "references" / "auction-abi.json"
+
+# Events the skill indexes and watches
+INDEXED_EVENTS = ("AuctionBid", "BidContributionMade", "AuctionCreated", "AuctionSettled")
+
+
+def abi_type(param):
+    """Canonical ABI type string for a param, expanding tuples."""
+    t = param["type"]
+    if t.startswith("tuple"):
+        inner = ",".join(abi_type(c) for c in param["components"])
+        return f"({inner}){t[len('tuple'):]}"
+    return t
+
+
+def _to_bytes(value):
+    if isinstance(value, str):
+        return bytes.fromhex(value[2:] if value.startswith("0x") else value)
+    return bytes(value)
+
+
+def _to_int(value):
+    return int(value, 16) if isinstance(value, str) else int(value)
+
+
+def _load_events(names=INDEXED_EVENTS):
+    with open(ABI_FILE) as f:
+        abi = json.load(f)
+    events = {}
+    for entry in abi:
+        if entry.get("type") != "event" or entry["name"] not in names:
+            continue
+        signature = f"{entry['name']}({','.join(abi_type(i) for i in entry['inputs'])})"
+        events[keccak(text=signature)] = entry
+    return events
+
+
+EVENTS = _load_events()
+TOPICS = {entry["name"]: "0x" + topic.hex() for topic, entry in EVENTS.items()}
+
+
+def decode_log(log):
+    """
+    Decode one log into a flat dict of event args plus log position fields.
+
+    Returns None for logs that aren't one of INDEXED_EVENTS.
+    """
+    topics = [_to_bytes(t) for t in log["topics"]]
+    entry = EVENTS.get(topics[0]) if topics else None
+    if entry is None:
+        return None
+
+    indexed = [i for i in entry["inputs"] if i["indexed"]]
+    plain = [i for i in entry["inputs"] if not i["indexed"]]
+
+    values = {}
+    for param, topic in zip(indexed, topics[1:]):
+        (values[param["name"]],) = decode([abi_type(param)], topic)
+    decoded = decode([abi_type(p) for p in plain], _to_bytes(log["data"]))
+    for param, value in zip(plain, decoded):
+        values[param["name"]] = value
+
+    for key in ("bidder", "contributor"):
+        if key in values:
+            values[key] = to_checksum_address(values[key])
+
+    values["event"] = entry["name"]
+    values["blockNumber"] = _to_int(log["blockNumber"])
+    values["blockHash"] = "0x" + _to_bytes(log["blockHash"]).hex()
+    values["transactionHash"] = "0x" + _to_bytes(log["transactionHash"]).hex()
+    values["logIndex"] = _to_int(log["logIndex"])
+    return values
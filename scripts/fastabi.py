@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Specialized decoders for the auction contract's fixed return layouts.
+
+getAllBids(), getBid(string) and auction() always return the same nested
+Bid / BidContribution shapes, so instead of walking eth_abi's generic
+type tree we read the ABI words straight out of a memoryview over the
+raw eth_call bytes and build records.Bid objects directly, with no
+intermediate tuples or copies.
+
+Layouts (all offsets are relative to the start of the enclosing tuple):
+
+    Bid             = [totalAmount][@urlString][@contributions]
+    contributions   = [n] n * [address][amount][timestamp]   (static tuples)
+    Bid[]           = [n] n * [@Bid]                        (relative to after n)
+    auction()       = [tokenId][@highestBid][startTime][endTime][settled][@qrMetadata]
+    QRData          = [validUntil][@urlString]
+
+BID_TYPE and AUCTION_TYPES are the equivalent eth_abi type strings, used
+by tests/test_fastabi.py and the benchmark to cross-check results.
+"""
+
+from eth_utils import to_checksum_address
+
+from records import Bid, Contribution
+
+BID_TYPE = "(uint256,string,(address,uint256,uint256)[])"
+AUCTION_TYPES = ["uint256", BID_TYPE, "uint256", "uint256", "bool", "(uint256,string)"]
+
+_from_bytes = int.from_bytes
+
+# Contributor addresses repeat heavily across bids; checksum each once
+_checksum_cache = {}
+
+
+def _checksum(raw20):
+    address = _checksum_cache.get(raw20)
+    if address is None:
+        if len(_checksum_cache) > 100_000:
+            _checksum_cache.clear()
+        address = _checksum_cache[raw20] = to_checksum_address(raw20.hex())
+    return address
+
+
+def _check(buf, end):
+    if end > len(buf):
+        raise ValueError(f"ABI data truncated: need {end} bytes, have {len(buf)}")
+
+
+def _uint(buf, pos):
+    return _from_bytes(buf[pos:pos + 32], "big")
+
+
+def _string(buf, pos):
+    _check(buf, pos + 32)
+    length = _uint(buf, pos)
+    _check(buf, pos + 32 + length)
+    return str(buf[pos + 32:pos + 32 + length], "utf-8")
+
+
+def _bid_at(buf, base):
+    _check(buf, base + 96)
+    total = _uint(buf, base)
+    url = _string(buf, base + _uint(buf, base + 32))
+
+    pos = base + _uint(buf, base + 64)
+    _check(buf, pos + 32)
+    count = _uint(buf, pos)
+    pos += 32
+    _check(buf, pos + 96 * count)
+
+    contributions = []
+    append = contributions.append
+    for p in range(pos, pos + 96 * count, 96):
+        append(Contribution(
+            _checksum(bytes(buf[p + 12:p + 32])),
+            _from_bytes(buf[p + 32:p + 64], "big"),
+            _from_bytes(buf[p + 64:p + 96], "big"),
+        ))
+    return Bid(total, url, contributions)
+
+
+def decode_bid(data):
+    """Decode getBid(string) return data into a Bid."""
+    buf = memoryview(data)
+    _check(buf, 32)
+    return _bid_at(buf, _uint(buf, 0))
+
+
+def decode_bids(data):
+    """Decode getAllBids() return data into a list of Bids."""
+    buf = memoryview(data)
+    _check(buf, 32)
+    pos = _uint(buf, 0)
+    _check(buf, pos + 32)
+    count = _uint(buf, pos)
+    heads = pos + 32
+    _check(buf, heads + 32 * count)
+    return [_bid_at(buf, heads + _uint(buf, heads + 32 * i)) for i in range(count)]
+
+
+def decode_auction(data):
+    """
+    Decode auction() return data.
+
+    Returns (tokenId, highestBid, startTime, endTime, settled,
+    (validUntil, urlString)) with highestBid as a Bid.
+    """
+    buf = memoryview(data)
+    _check(buf, 192)
+    qr = _uint(buf, 160)
+    _check(buf, qr + 64)
+    return (
+        _uint(buf, 0),
+        _bid_at(buf, _uint(buf, 32)),
+        _uint(buf, 64),
+        _uint(buf, 96),
+        _uint(buf, 128) != 0,
+        (_uint(buf, qr), _string(buf, qr + _uint(buf, qr + 32))),
+    )
+
+
+def decode_uint(data):
+    """Decode a single uint256 return value."""
+    buf = memoryview(data)
+    _check(buf, 32)
+    return _uint(buf, 0)
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+EIP-1559 fee estimation from a cached eth_feeHistory window.
+
+Keeps the base fee and priority-fee percentiles of the last FEE_WINDOW
+blocks in FEE_CACHE_FILE. Each refresh only asks for the blocks produced
+since the previous one (Base makes one every ~2s), and the request is
+meant to ride in the same JSON-RPC batch as the nonce and gas reads, so
+fee estimation adds no round trip to the send path. If that request
+fails, the cached window is only used while it is under MAX_CACHE_AGE
+old; past that the caller prices with eth_gasPrice.
+
+Urgency levels pick a priority-fee percentile over the window and a
+headroom multiplier on the next block's base fee:
+
+    low      p10 tip, 1.25x base fee
+    normal   p50 tip, 2x base fee
+    high     p90 tip, 2x base fee
+    snipe    2x p99 tip, 3x base fee  (last minutes of an auction)
+
+Usage:
+    fees.py                 Show maxFeePerGas / maxPriorityFeePerGas per level
+    fees.py --json          Same, as JSON
+"""
+
+import json
+import math
+import os
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+from rpc import RpcError
+
+FEE_CACHE_FILE = Path.home() / ".clawdbot" / "skills" / "qrcoin" / "fee-history.json"
+FEE_WINDOW = 20               # blocks of history kept
+BLOCK_TIME = 2                # seconds, Base
+MAX_CACHE_AGE = 5 * BLOCK_TIME  # seconds the cached window may stand in for a failed refresh
+REWARD_PERCENTILES = [10, 50, 90, 99]
+MIN_PRIORITY_FEE = 1_000_000  # 0.001 gwei floor when blocks carry no tips
+
+# level -> (reward percentile, tip multiplier, base fee multiplier)
+URGENCY = {
+    "low": (10, 1, 1.25),
+    "normal": (50, 1, 2),
+    "high": (90, 1, 2),
+    "snipe": (99, 2, 3),
+}
+SNIPE_WINDOW = 300  # seconds before auction end when bids default to "snipe"
+
+
+class FeeHistory:
+    """Rolling eth_feeHistory window persisted between runs."""
+
+    def __init__(self, path=FEE_CACHE_FILE, window=FEE_WINDOW):
+        self.path = Path(path)
+        self.window = window
+        self.blocks = {}       # block number -> [base fee, [rewards per percentile]]
+        self.next_base_fee = None
+        self.newest = None
+        self.updated = 0.0
+        try:
+            with open(self.path) as f:
+                state = json.load(f)
+            if state.get("percentiles") == REWARD_PERCENTILES:
+                self.blocks = {int(n): v for n, v in state["blocks"].items()}
+                self.next_base_fee = state["nextBaseFee"]
+                self.newest = state["newest"]
+                self.updated = state["updated"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def request(self):
+        """
+        The eth_feeHistory call that brings the window up to date, as a
+        (method, params) pair for RpcClient.batch.
+        """
+        if not self.blocks:
+            count = self.window
+        else:
+            elapsed = time.time() - self.updated
+            count = min(self.window, max(1, math.ceil(elapsed / BLOCK_TIME) + 1))
+        return ("eth_feeHistory", [hex(count), "latest", REWARD_PERCENTILES])
+
+    def update(self, result):
+        """Merge an eth_feeHistory result into the window and save it."""
+        oldest = int(result["oldestBlock"], 16)
+        base_fees = [int(fee, 16) for fee in result["baseFeePerGas"]]
+        rewards = result.get("reward") or [[]] * (len(base_fees) - 1)
+        for i, reward in enumerate(rewards):
+            self.blocks[oldest + i] = [base_fees[i], [int(r, 16) for r in reward]]
+        newest = oldest + len(rewards) - 1
+        if self.newest is None or newest >= self.newest:
+            # baseFeePerGas carries one extra entry: the block after `newest`
+            self.newest = newest
+            self.next_base_fee = base_fees[-1]
+        for number in sorted(self.blocks)[:-self.window]:
+            del self.blocks[number]
+        self.updated = time.time()
+        self.save()
+
+    def refresh(self, client):
+        """Update the window with its own request (outside the send path)."""
+        method, params = self.request()
+        self.update(client.request(method, params))
+
+    def save(self):
+        state = {
+            "percentiles": REWARD_PERCENTILES,
+            "blocks": self.blocks,
+            "nextBaseFee": self.next_base_fee,
+            "newest": self.newest,
+            "updated": self.updated,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Unique per writer: fleet.py saves from several threads at once
+            tmp = self.path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+            with open(tmp, "w") as f:
+                json.dump(state, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"Warning: could not save fee history ({e})", file=sys.stderr)
+
+    def fees(self, urgency="normal"):
+        """Return (max_fee_per_gas, max_priority_fee_per_gas) in wei."""
+        if urgency not in URGENCY:
+            raise ValueError(f"Unknown urgency: {urgency}")
+        if self.next_base_fee is None:
+            raise ValueError("No fee history loaded")
+        percentile, tip_multiplier, base_multiplier = URGENCY[urgency]
+        column = REWARD_PERCENTILES.index(percentile)
+        tips = [reward[column] for _, reward in self.blocks.values() if len(reward) > column]
+        tip = int(statistics.median(tips) * tip_multiplier) if tips else 0
+        tip = max(tip, MIN_PRIORITY_FEE)
+        return int(self.next_base_fee * base_multiplier) + tip, tip
+
+
+def urgency_for(end_time, now=None):
+    """Default urgency for a bid: "snipe" in the auction's last SNIPE_WINDOW seconds."""
+    remaining = end_time - (now if now is not None else time.time())
+    return "snipe" if 0 < remaining <= SNIPE_WINDOW else "normal"
+
+
+def tx_fees(history, urgency, result):
+    """
+    Fee fields for a transaction from the batched eth_feeHistory `result`.
+
+    Falls back to the cached window if the call failed and the window is
+    at most MAX_CACHE_AGE old; returns None otherwise, in which case the
+    caller uses gasPrice.
+    """
+    if not isinstance(result, RpcError):
+        history.update(result)
+    elif history.next_base_fee is None or time.time() - history.updated > MAX_CACHE_AGE:
+        return None
+    max_fee, tip = history.fees(urgency)
+    return {"type": 2, "maxFeePerGas": max_fee, "maxPriorityFeePerGas": tip}
+
+
+def main():
+    from rpcpool import load_rpc_client
+
+    if len(sys.argv) > 1 and sys.argv[1] not in ("--json",):
+        print(__doc__)
+        sys.exit(1)
+
+    history = FeeHistory()
+    try:
+        history.refresh(load_rpc_client())
+    except (RpcError, OSError) as e:
+        print(f"Error: eth_feeHistory failed: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    levels = {level: history.fees(level) for level in URGENCY}
+    if "--json" in sys.argv:
+        print(json.dumps({
+            "newestBlock": history.newest,
+            "nextBaseFee": history.next_base_fee,
+            "levels": {
+                level: {"maxFeePerGas": max_fee, "maxPriorityFeePerGas": tip}
+                for level, (max_fee, tip) in levels.items()
+            },
+        }, indent=2))
+        return
+
+    print(f"Block {history.newest}, next base fee {history.next_base_fee / 1e9:.6f} gwei "
+          f"({len(history.blocks)}-block window)")
+    print(f"{'urgency':<8} {'max fee (gwei)':>15} {'tip (gwei)':>12}")
+    for level, (max_fee, tip) in levels.items():
+        print(f"{level:<8} {max_fee / 1e9:>15.6f} {tip / 1e9:>12.6f}")
+
+
+if __name__ == '__main__':
+    main()
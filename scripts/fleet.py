@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+Fleet mode: contribute to one bid from many wallets at once.
+
+Wallets come from a manifest (FLEET_FILE unless --manifest is given):
+
+    {
+      "amount": "5",
+      "wallets": [
+        {"name": "main"},
+        {"name": "scout-2", "account": "scout-2", "amount": "10"},
+        {"name": "scout-3", "account": "scout-3", "address": "0x..."}
+      ]
+    }
+
+`account` names a keychain entry (`keychain.py store <key> --account
+NAME`); without it the wallet is the skill's default one. `amount` (USDC)
+falls back to the manifest's, and --amount overrides both. `address` is
+optional and only saves `show` from reading the key.
+
+`contribute` reads the auction, the bid and every wallet's ETH, USDC and
+allowance in two Multicall3 calls. Wallets without ETH or enough USDC are
+skipped. The rest get approve(amount) first unless their allowance is
+already exactly the amount, because contributeToBid takes the whole
+allowance. A bounded thread pool (--workers) then signs and broadcasts
+each wallet's approve + contributeToBid with consecutive nonces from the
+nonce manager. All wallets are on the wire within a few round trips,
+so the contributions land in the same few blocks. One tracker follows
+every receipt and fee-bumps stuck transactions. The report lists what
+landed per wallet and in which blocks.
+
+Usage:
+    fleet.py show [--manifest PATH]        Wallets with ETH, USDC and allowance
+    fleet.py contribute <url> [name] [--amount USDC] [--workers N] [--urgency LEVEL]
+                        [--timeout S] [--manifest PATH] [--yes] [--json]
+
+    Add --profile to either for an RPC / sign time breakdown (stderr).
+"""
+
+import contextlib
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from getpass import getpass
+from pathlib import Path
+
+from encode import encode_approve, encode_contribute_to_bid
+from fastabi import decode_auction, decode_bid, decode_uint
+from fees import URGENCY, urgency_for
+from keychain import ACCOUNT_NAME, encrypted_file, file_retrieve, retrieve_key
+from multicall import aggregate3, encode_call
+from qrcoin import (AUCTION, RULE, USDC, PreflightRevert, confirm, load_settings, open_client,
+                    send_transactions, usdc_to_wei, wait_for_receipts)
+from readcache import BlockReader
+from rpc import RpcError
+from signer import LocalSigner, SignerError
+from wallet import read_balances
+
+FLEET_FILE = Path.home() / ".clawdbot" / "skills" / "qrcoin" / "fleet.json"
+DEFAULT_WORKERS = 8
+FLEET_TIMEOUT = 180  # seconds to wait for every receipt
+
+# send_transactions output worth showing per wallet; the rest goes in the report
+NOTABLE = ("Warning", "Gas estimation failed", "Fee history unavailable")
+
+
+def load_manifest(path):
+    """Read and validate the manifest; exits with a message if it's unusable."""
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Error: Cannot read fleet manifest {path} ({e})")
+        sys.exit(1)
+    wallets = manifest.get("wallets") or []
+    if not wallets:
+        print(f"Error: No wallets in {path}")
+        sys.exit(1)
+    names = [w.get("name") or w.get("account") or ACCOUNT_NAME for w in wallets]
+    if len(set(names)) != len(names):
+        print("Error: Wallet names in the manifest must be unique")
+        sys.exit(1)
+    for wallet, name in zip(wallets, names):
+        wallet["name"] = name
+    return manifest
+
+
+def load_signers(wallets):
+    """
+    A LocalSigner per wallet, reading keys one by one (keychain prompts).
+    Encrypted-file keys try one shared fleet password first and prompt
+    for their own only if it doesn't decrypt them.
+    """
+    password = None
+    if any(encrypted_file(w.get("account", ACCOUNT_NAME)).exists() for w in wallets):
+        password = getpass("Fleet wallet password (blank: ask per wallet): ") or None
+    signers = {}
+    for wallet in wallets:
+        account = wallet.get("account", ACCOUNT_NAME)
+        key = None
+        if password is not None and encrypted_file(account).exists():
+            key = file_retrieve(account, password)
+        try:
+            key = key or retrieve_key(account)
+        except Exception:
+            key = None
+        if not key:
+            print(f"Error: Could not retrieve the key for '{wallet['name']}' (keychain account {account})")
+            sys.exit(1)
+        signers[wallet["name"]] = LocalSigner(key)
+    return signers
+
+
+def read_plan(client, url, wallets, addresses, amounts):
+    """
+    Read the auction, the bid on `url` and every wallet's balances at one
+    block. Returns (auction dict, {name: plan}); a plan has the calls to
+    send, or `skip` with the reason.
+    """
+    reader = BlockReader(client)
+    (auction_ok, auction_data), (buffer_ok, buffer_data), (reserve_ok, reserve_data), (bid_ok, bid_data) = \
+        aggregate3(client, [
+            (AUCTION, encode_call("auction()")),
+            (AUCTION, encode_call("timeBuffer()")),
+            (AUCTION, encode_call("contributeBidReservePrice()")),
+            (AUCTION, encode_call("getBid(string)", ["string"], [url])),
+        ], reader=reader)
+    if not auction_ok:
+        raise RpcError(None, "auction() call failed")
+    auction = decode_auction(auction_data)
+    bid = decode_bid(bid_data) if bid_ok else None
+    info = {
+        "tokenId": auction[0],
+        "endTime": auction[3],
+        "timeBuffer": decode_uint(buffer_data) if buffer_ok else None,
+        "reserve": decode_uint(reserve_data) if reserve_ok else 0,
+        "bidTotal": bid.totalAmount if bid and bid.urlString else None,
+        "block": reader.block,
+    }
+
+    plans = {}
+    rows = read_balances(reader, [addresses[w["name"]] for w in wallets])
+    for wallet, row in zip(wallets, rows):
+        name = wallet["name"]
+        amount = amounts[name]
+        plan = {"address": row["address"], "amount": amount, "calls": [], "intents": []}
+        plans[name] = plan
+        if row["eth"] == 0:
+            plan["skip"] = "no ETH for gas"
+        elif row["usdc"] is not None and row["usdc"] < amount:
+            plan["skip"] = f"only {row['usdc'] / 1_000_000:.2f} USDC"
+        elif amount < info["reserve"]:
+            plan["skip"] = f"below the {info['reserve'] / 1_000_000:.2f} USDC contribute reserve"
+        if "skip" in plan:
+            continue
+        usdc = f"{Decimal(amount) / 1_000_000:f}"
+        if row["allowance"] != amount:
+            plan["calls"].append((USDC, "0x" + encode_approve(AUCTION, amount)))
+            plan["intents"].append(f"Approve {usdc} USDC")
+        plan["calls"].append((AUCTION, None))  # calldata filled in once the name is known
+        plan["intents"].append(f"Contribute {usdc} USDC to bid {url}")
+    return info, plans
+
+
+def send_wallet(client, signer, plan, urgency):
+    """Broadcast one wallet's pipeline; returns (entries, notes, error)."""
+    notes = []
+
+    def log(message):
+        notes.append(message)
+        if message.startswith(NOTABLE):
+            print(f"[{plan['name']}] {message}", flush=True)
+
+    try:
+        entries = send_transactions(client, signer, plan["calls"], urgency, plan["intents"], log)
+    except PreflightRevert as e:
+        return [], notes, f"would revert: {e.revert}" + (f" ({e.revert.hint})" if e.revert.hint else "")
+    except (RpcError, SignerError, OSError) as e:
+        return [], notes, str(e)
+    nonces = ", ".join(str(e["nonce"]) for e in entries)
+    print(f"[{plan['name']}] sent {len(entries)} transaction{'s' if len(entries) != 1 else ''} (nonce {nonces})",
+          flush=True)
+    return entries, notes, None
+
+
+def cmd_show(manifest):
+    wallets = manifest["wallets"]
+    missing = [w for w in wallets if not w.get("address")]
+    signers = load_signers(missing) if missing else {}
+    addresses = [w.get("address") or signers[w["name"]].address for w in wallets]
+    settings = load_settings(signing=False)
+    rows = read_balances(BlockReader(open_client(settings)), addresses)
+    print(f"{'Wallet':<16}  {'Address':<42}  {'ETH':>10}  {'USDC':>10}  {'Allowance':>10}")
+    for wallet, row in zip(wallets, rows):
+        values = [
+            "?" if value is None else f"{value / scale:.{places}f}"
+            for value, scale, places in ((row["eth"], 10**18, 6), (row["usdc"], 10**6, 2), (row["allowance"], 10**6, 2))
+        ]
+        print(f"{wallet['name']:<16}  {row['address']:<42}  {values[0]:>10}  {values[1]:>10}  {values[2]:>10}")
+
+
+def cmd_contribute(manifest, url, name, amount, workers, urgency, timeout, yes, as_json):
+    wallets = manifest["wallets"]
+    amounts = {}
+    for wallet in wallets:
+        value = amount or wallet.get("amount") or manifest.get("amount")
+        if value is None:
+            print(f"Error: No amount for '{wallet['name']}'; set one in the manifest or pass --amount")
+            sys.exit(1)
+        amounts[wallet["name"]] = usdc_to_wei(str(value))
+
+    settings = load_settings(signing=True)
+    name = name or settings["xHandle"]
+    client = open_client(settings)
+    signers = load_signers(wallets)
+    addresses = {w["name"]: signers[w["name"]].address for w in wallets}
+
+    info, plans = read_plan(client, url, wallets, addresses, amounts)
+    if info["bidTotal"] is None:
+        print(f"Error: {url} has no bid yet. Create it first: submit-tx.sh createBid {url}")
+        sys.exit(1)
+    contribute = "0x" + encode_contribute_to_bid(info["tokenId"], url, name)
+    for wallet_name, plan in plans.items():
+        plan["name"] = wallet_name
+        plan["calls"] = [(to, data or contribute) for to, data in plan["calls"]]
+    urgency = urgency or urgency_for(info["endTime"])
+    active = {n: p for n, p in plans.items() if "skip" not in p}
+
+    out = sys.stderr if as_json else sys.stdout
+    with contextlib.redirect_stdout(out):
+        print(RULE)
+        print("  FLEET CONTRIBUTE")
+        print(RULE)
+        print()
+        print(f"Token ID: {info['tokenId']}")
+        print(f"URL:      {url} (bid total {info['bidTotal'] / 1_000_000:.2f} USDC)")
+        print(f"Name:     {name}")
+        print(f"Urgency:  {urgency}")
+        remaining = info["endTime"] - int(time.time())
+        if info["timeBuffer"] is not None:
+            print(f"Ends in:  {max(remaining, 0)}s (bids in the last {info['timeBuffer']}s extend it)")
+        print()
+        for wallet_name, plan in plans.items():
+            what = plan["skip"] if "skip" in plan else " + ".join(
+                "approve" if to == USDC else "contribute" for to, _ in plan["calls"])
+            print(f"  {wallet_name:<16} {plan['address']}  {plan['amount'] / 1_000_000:>10.2f} USDC  {what}")
+        total = sum(p["amount"] for p in active.values())
+        print()
+        print(f"{len(active)} of {len(plans)} wallets, {total / 1_000_000:.2f} USDC total")
+        print()
+        if not active:
+            print("Nothing to send.")
+            sys.exit(1)
+        if not confirm(yes):
+            return
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            futures = {
+                n: pool.submit(send_wallet, client, signers[n], p, urgency)
+                for n, p in active.items()
+            }
+            sent = {n: future.result() for n, future in futures.items()}
+
+        groups, owners = [], []
+        for wallet_name, (entries, _, _) in sent.items():
+            for entry in entries:
+                groups.append([entry])
+                owners.append(wallet_name)
+        by_address = {addresses[n]: signers[n] for n in active}
+        results = wait_for_receipts(client, groups, by_address, timeout or FLEET_TIMEOUT) if groups else []
+
+    report = fleet_report(plans, sent, owners, results)
+    report.update({"url": url, "tokenId": info["tokenId"], "urgency": urgency})
+    if as_json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    if report["summary"]["contributed"] != len(active):
+        sys.exit(1)
+
+
+def fleet_report(plans, sent, owners, results):
+    """Aggregate per-wallet outcomes and the block span of the contributions."""
+    wallets = []
+    outcomes = {}
+    for wallet_name, (entry, receipt) in zip(owners, results):
+        outcomes.setdefault(wallet_name, []).append((entry, receipt))
+    blocks = []
+    landed = 0
+    for wallet_name, plan in plans.items():
+        row = {"name": wallet_name, "address": plan["address"], "amountUsdc": plan["amount"] / 1_000_000}
+        if "skip" in plan:
+            row["status"] = "skipped"
+            row["reason"] = plan["skip"]
+        elif sent[wallet_name][2] is not None:
+            row["status"] = "failed"
+            row["reason"] = sent[wallet_name][2]
+        else:
+            row["transactions"] = []
+            for entry, receipt in outcomes.get(wallet_name, []):
+                tx = {"intent": entry["intent"], "hash": entry["hash"], "nonce": entry["nonce"]}
+                if receipt is None:
+                    tx["status"] = "pending"
+                else:
+                    tx["status"] = "confirmed" if receipt.get("status") == "0x1" else "reverted"
+                    tx["block"] = int(receipt["blockNumber"], 16)
+                row["transactions"].append(tx)
+            last = row["transactions"][-1] if row["transactions"] else {"status": "pending"}
+            row["status"] = "contributed" if last["status"] == "confirmed" else last["status"]
+            if row["status"] == "contributed":
+                landed += plan["amount"]
+                blocks.append(last["block"])
+        wallets.append(row)
+    counts = {}
+    for row in wallets:
+        counts[row["status"]] = counts.get(row["status"], 0) + 1
+    return {
+        "wallets": wallets,
+        "summary": {
+            "contributed": counts.get("contributed", 0),
+            "failed": counts.get("failed", 0) + counts.get("reverted", 0),
+            "pending": counts.get("pending", 0),
+            "skipped": counts.get("skipped", 0),
+            "landedUsdc": landed / 1_000_000,
+            "firstBlock": min(blocks) if blocks else None,
+            "lastBlock": max(blocks) if blocks else None,
+        },
+    }
+
+
+def print_report(report):
+    print()
+    print(RULE)
+    print("  FLEET REPORT")
+    print(RULE)
+    print()
+    for row in report["wallets"]:
+        detail = row.get("reason", "")
+        if "transactions" in row and row["transactions"]:
+            last = row["transactions"][-1]
+            detail = f"{last['hash']}" + (f" block {last['block']}" if "block" in last else "")
+        print(f"  {row['name']:<16} {row['status']:<12} {row['amountUsdc']:>10.2f} USDC  {detail}")
+    summary = report["summary"]
+    print()
+    print(f"Contributed: {summary['contributed']} wallets, {summary['landedUsdc']:.2f} USDC")
+    if summary["firstBlock"] is not None:
+        span = summary["lastBlock"] - summary["firstBlock"] + 1
+        print(f"Blocks:      {summary['firstBlock']}-{summary['lastBlock']} ({span} block{'s' if span != 1 else ''})")
+    for status in ("failed", "pending", "skipped"):
+        if summary[status]:
+            print(f"{status.capitalize() + ':':<13}{summary[status]}")
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    cmd = sys.argv[1]
+    manifest_path = FLEET_FILE
+    amount = None
+    workers = DEFAULT_WORKERS
+    urgency = None
+    timeout = None
+    yes = False
+    as_json = False
+    args = []
+    argv = iter(sys.argv[2:])
+    for arg in argv:
+        if arg in ("--yes", "-y"):
+            yes = True
+        elif arg == "--json":
+            as_json = True
+        elif arg == "--profile":
+            pass  # Read by tracing.configure()
+        elif arg in ("--manifest", "--amount", "--workers", "--urgency", "--timeout"):
+            value = next(argv, None)
+            if value is None:
+                print(f"Error: {arg} needs a value")
+                sys.exit(1)
+            if arg == "--manifest":
+                manifest_path = Path(value).expanduser()
+            elif arg == "--amount":
+                usdc_to_wei(value)  # validate before reading keys
+                amount = value
+            elif arg == "--urgency":
+                if value not in URGENCY:
+                    print(f"Error: --urgency must be one of {', '.join(URGENCY)}")
+                    sys.exit(1)
+                urgency = value
+            else:
+                try:
+                    number = float(value)
+                except ValueError:
+                    print(f"Error: {arg} needs a number")
+                    sys.exit(1)
+                if arg == "--workers":
+                    workers = int(number)
+                else:
+                    timeout = number
+        else:
+            args.append(arg)
+
+    manifest = load_manifest(manifest_path)
+
+    if cmd == 'show':
+        cmd_show(manifest)
+    elif cmd == 'contribute':
+        if not args:
+            print("Usage: fleet.py contribute <url> [name] [--amount USDC] [--workers N] [--yes]")
+            sys.exit(1)
+        cmd_contribute(manifest, args[0], args[1] if len(args) > 1 else None, amount, workers,
+                       urgency, timeout, yes, as_json)
+    else:
+        print(f"Unknown command: {cmd}")
+        print(__doc__)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
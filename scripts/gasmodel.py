@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Local gas-limit model per function selector.
+
+approve, createBid and contributeToBid use very predictable gas, growing
+with the calldata length (URL and name). This keeps recent (calldata
+length, gas) samples per selector in GAS_MODEL_FILE, learned from our own
+receipts, and predicts a limit without an RPC call:
+
+    least-squares line over the samples + the largest under-prediction
+
+A receipt's gasUsed is after refunds and only reflects the state the call
+ran against, so a sample is max(gasUsed, the send's eth_estimateGas) when
+the send was estimated. Until a selector has MIN_SAMPLES samples the model
+is cold and the caller estimates as before. It also stays cold while the
+samples stray from the line by more than MAX_RESIDUAL of the mean: then
+the cost depends on state (e.g. an approve from a zero allowance costs
+more than one that changes it) and only eth_estimateGas can see that. A
+reverted receipt clears the selector's samples so the next send
+estimates again.
+
+Usage:
+    gasmodel.py show              Show samples and predictions per selector
+    gasmodel.py reset [selector]  Forget samples (all selectors by default)
+"""
+
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+
+GAS_MODEL_FILE = Path.home() / ".clawdbot" / "skills" / "qrcoin" / "gas-model.json"
+MIN_SAMPLES = 3
+MAX_RESIDUAL = 0.1
+MAX_SAMPLES = 50
+
+
+def _key(data):
+    data = data[2:] if data.startswith("0x") else data
+    return data[:8].lower(), len(data) // 2
+
+
+class GasModel:
+    """Persisted gas samples keyed by 4-byte selector (hex, no 0x)."""
+
+    def __init__(self, path=GAS_MODEL_FILE):
+        self.path = Path(path)
+        try:
+            with open(self.path) as f:
+                self.samples = json.load(f)
+        except (OSError, ValueError):
+            self.samples = {}
+
+    def predict(self, data):
+        """Predicted gas for calldata `data`, or None while the model is cold or unsteady."""
+        selector, length = _key(data)
+        samples = self.samples.get(selector, [])
+        if len(samples) < MIN_SAMPLES:
+            return None
+        lengths = [l for l, _ in samples]
+        gases = [g for _, g in samples]
+        mean_l = sum(lengths) / len(lengths)
+        mean_g = sum(gases) / len(gases)
+        spread = sum((l - mean_l) ** 2 for l in lengths)
+        slope = 0.0
+        if spread:
+            slope = max(0.0, sum((l - mean_l) * (g - mean_g) for l, g in samples) / spread)
+        intercept = mean_g - slope * mean_l
+        residuals = [g - (intercept + slope * l) for l, g in samples]
+        if max(abs(r) for r in residuals) > MAX_RESIDUAL * mean_g:
+            return None
+        return int(intercept + slope * length + max(max(residuals), 0))
+
+    def observe(self, data, gas):
+        """Add a gas sample for `data`: max(receipt gasUsed, estimate) if estimated."""
+        selector, length = _key(data)
+        samples = self.samples.setdefault(selector, [])
+        samples.append([length, int(gas)])
+        del samples[:-MAX_SAMPLES]
+        self.save()
+
+    def invalidate(self, data):
+        """Drop a selector's samples so the next send estimates again."""
+        selector, _ = _key(data)
+        if self.samples.pop(selector, None) is not None:
+            self.save()
+
+    def reset(self, selector=None):
+        if selector is None:
+            self.samples = {}
+        else:
+            self.samples.pop(selector.lower().removeprefix("0x"), None)
+        self.save()
+
+    def save(self):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Unique per writer: fleet.py saves from several threads at once
+            tmp = self.path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+            with open(tmp, "w") as f:
+                json.dump(self.samples, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"Warning: could not save gas model ({e})", file=sys.stderr)
+
+
+def main():
+    from encode import SELECTORS
+
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    cmd = sys.argv[1]
+    model = GasModel()
+
+    if cmd == 'show':
+        if not model.samples:
+            print("No gas samples yet")
+        names = {selector: name for name, selector in SELECTORS.items()}
+        for selector, samples in model.samples.items():
+            name = names.get(selector, "0x" + selector)
+            lengths = sorted({l for l, _ in samples})
+            line = f"{name:<16} {len(samples):>3} samples"
+            # Prediction at the shortest and longest calldata seen
+            low = model.predict("0x" + selector + "00" * (lengths[0] - 4))
+            high = model.predict("0x" + selector + "00" * (lengths[-1] - 4))
+            if low is None:
+                print(f"{line}  ({'cold' if len(samples) < MIN_SAMPLES else 'state-dependent, estimating'})")
+                continue
+            print(f"{line}  {lengths[0]}-{lengths[-1]} bytes -> {low}-{high} gas")
+    elif cmd == 'reset':
+        model.reset(sys.argv[2] if len(sys.argv) > 2 else None)
+        print("✓ Gas model cleared")
+    else:
+        print(f"Unknown command: {cmd}")
+        print(__doc__)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Incremental event-log indexer for the QR Coin auction contract.
+
+Pulls eth_getLogs from a persisted block cursor, decodes AuctionBid,
+BidContributionMade, AuctionCreated and AuctionSettled, and keeps local
+SQLite tables of auctions and contributions (plus a `bids` view summing
+contributions per URL). After the first sync each run only reads the
+handful of new logs instead of re-downloading getAllBids().
+
+Only blocks at least --confirmations behind the head are indexed. If the
+hash of the cursor block changes (a reorg), the last REORG_REWIND blocks
+are dropped and re-indexed.
+
+Usage:
+    indexer.py sync                   Index new logs up to head - confirmations
+    indexer.py sync --from-block N    First sync starts at block N
+    indexer.py status                 Show cursor and table sizes
+    indexer.py bids [--token ID]      Show indexed bids (default: latest auction)
+    indexer.py bids --json            JSON output
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+from events import TOPICS, decode_log
+from records import Bid, Contribution
+
+CONTRACT_ADDR = "0x7309779122069EFa06ef71a45AE0DB55A259A176"
+DB_FILE = Path.home() / ".clawdbot" / "skills" / "qrcoin" / "index.sqlite"
+
+DEFAULT_CONFIRMATIONS = 3
+INITIAL_LOOKBACK = 50_000  # blocks (~28h on Base) when no --from-block is given
+MAX_BLOCK_RANGE = 2_000    # blocks per eth_getLogs request
+REORG_REWIND = 64          # blocks dropped when the cursor block hash changes
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS auctions (
+    token_id INTEGER PRIMARY KEY,
+    start_time INTEGER,
+    scheduled_end_time INTEGER,
+    end_time INTEGER,
+    created_block INTEGER,
+    settled INTEGER NOT NULL DEFAULT 0,
+    winning_url TEXT,
+    winning_amount INTEGER,
+    settled_block INTEGER
+);
+CREATE TABLE IF NOT EXISTS contributions (
+    tx_hash TEXT NOT NULL,
+    log_index INTEGER NOT NULL,
+    block_number INTEGER NOT NULL,
+    token_id INTEGER NOT NULL,
+    url TEXT NOT NULL,
+    contributor TEXT NOT NULL,
+    amount INTEGER NOT NULL,
+    name TEXT,
+    kind TEXT NOT NULL,
+    end_time INTEGER,
+    PRIMARY KEY (tx_hash, log_index)
+);
+CREATE INDEX IF NOT EXISTS contributions_bid ON contributions (token_id, url);
+CREATE INDEX IF NOT EXISTS contributions_block ON contributions (block_number);
+CREATE VIEW IF NOT EXISTS bids AS
+    SELECT token_id,
+           url,
+           SUM(amount) AS total_amount,
+           COUNT(*) AS contribution_count,
+           MIN(block_number) AS created_block,
+           MAX(block_number) AS updated_block
+    FROM contributions
+    GROUP BY token_id, url;
+"""
+
+
+class Indexer:
+    """SQLite store of decoded auction events with a block cursor."""
+
+    def __init__(self, path=DB_FILE):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(path), timeout=10)
+        self.db.executescript(SCHEMA)
+
+    # -- cursor -----------------------------------------------------------
+
+    def get_meta(self, key):
+        row = self.db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key, value):
+        self.db.execute(
+            "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+            (key, None if value is None else str(value)),
+        )
+
+    def cursor(self):
+        value = self.get_meta("cursor")
+        return int(value) if value is not None else None
+
+    # -- applying events --------------------------------------------------
+
+    def apply(self, event):
+        """Apply one decoded event (from events.decode_log). Idempotent."""
+        name = event["event"]
+        block = event["blockNumber"]
+
+        if name == "AuctionCreated":
+            self.db.execute(
+                "INSERT INTO auctions (token_id, start_time, scheduled_end_time, end_time, created_block)"
+                " VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT (token_id) DO UPDATE SET"
+                "  start_time = excluded.start_time,"
+                "  scheduled_end_time = excluded.scheduled_end_time,"
+                "  end_time = MAX(COALESCE(end_time, 0), excluded.end_time),"
+                "  created_block = excluded.created_block",
+                (event["tokenId"], event["startTime"], event["endTime"], event["endTime"], block),
+            )
+
+        elif name in ("AuctionBid", "BidContributionMade"):
+            if name == "AuctionBid":
+                kind, who = "create", event["bidder"]
+            else:
+                kind, who = "contribute", event["contributor"]
+            self.db.execute(
+                "INSERT OR IGNORE INTO contributions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    event["transactionHash"], event["logIndex"], block, event["tokenId"],
+                    event["urlString"], who, event["amount"], event["name"], kind, event["endTime"],
+                ),
+            )
+            # Bids can extend the auction end time
+            self.db.execute(
+                "INSERT INTO auctions (token_id, end_time) VALUES (?, ?)"
+                " ON CONFLICT (token_id) DO UPDATE SET"
+                "  end_time = MAX(COALESCE(end_time, 0), excluded.end_time)",
+                (event["tokenId"], event["endTime"]),
+            )
+
+        elif name == "AuctionSettled":
+            winning = event["winningBid"]
+            self.db.execute(
+                "INSERT INTO auctions (token_id, settled, winning_url, winning_amount, settled_block)"
+                " VALUES (?, 1, ?, ?, ?)"
+                " ON CONFLICT (token_id) DO UPDATE SET"
+                "  settled = 1,"
+                "  winning_url = excluded.winning_url,"
+                "  winning_amount = excluded.winning_amount,"
+                "  settled_block = excluded.settled_block",
+                (event["tokenId"], winning[1], winning[0], block),
+            )
+
+    def rewind(self, block):
+        """Drop everything indexed after `block` and move the cursor back."""
+        self.db.execute("DELETE FROM contributions WHERE block_number > ?", (block,))
+        self.db.execute("DELETE FROM auctions WHERE created_block > ?", (block,))
+        self.db.execute(
+            "UPDATE auctions SET settled = 0, winning_url = NULL, winning_amount = NULL,"
+            " settled_block = NULL WHERE settled_block > ?",
+            (block,),
+        )
+        self.db.execute(
+            "UPDATE auctions SET end_time = MAX("
+            " COALESCE(scheduled_end_time, 0),"
+            " COALESCE((SELECT MAX(c.end_time) FROM contributions c"
+            "           WHERE c.token_id = auctions.token_id), 0))"
+        )
+        self.set_meta("cursor", block)
+        self.set_meta("cursor_hash", None)
+        self.db.commit()
+
+    # -- syncing ----------------------------------------------------------
+
+    def fetch_logs(self, client, from_block, to_block):
+        return client.eth.get_logs({
+            "address": CONTRACT_ADDR,
+            "fromBlock": from_block,
+            "toBlock": to_block,
+            "topics": [list(TOPICS.values())],
+        })
+
+    def check_reorg(self, client):
+        """Rewind if the cursor block's hash no longer matches the chain."""
+        cursor = self.cursor()
+        stored_hash = self.get_meta("cursor_hash")
+        if cursor is None or stored_hash is None:
+            return False
+        current_hash = client.eth.get_block(cursor)["hash"]
+        if current_hash == stored_hash:
+            return False
+        print(f"Reorg detected at block {cursor}, rewinding {REORG_REWIND} blocks", file=sys.stderr)
+        self.rewind(max(0, cursor - REORG_REWIND))
+        return True
+
+    def sync(self, client, confirmations=DEFAULT_CONFIRMATIONS, from_block=None,
+             max_range=MAX_BLOCK_RANGE, quiet=False):
+        """
+        Index logs from the cursor up to head - confirmations.
+
+        Commits after each block range, together with the hash of its last
+        block, so an interrupted sync resumes where it stopped and the next
+        run still detects a reorg. Returns the number of events applied.
+        """
+        head = client.eth.block_number
+        target = head - confirmations
+
+        self.check_reorg(client)
+        cursor = self.cursor()
+        if cursor is None:
+            start = from_block if from_block is not None else max(0, target - INITIAL_LOOKBACK)
+        else:
+            start = cursor + 1
+
+        applied = 0
+        while start <= target:
+            end = min(start + max_range - 1, target)
+            logs = self.fetch_logs(client, start, end)
+            for log in logs:
+                event = decode_log(log)
+                if event is not None:
+                    self.apply(event)
+                    applied += 1
+            # The hash moves with the cursor, so an interrupted sync still checks for reorgs
+            self.set_meta("cursor", end)
+            self.set_meta("cursor_hash", client.eth.get_block(end)["hash"])
+            self.db.commit()
+            if not quiet:
+                print(f"Indexed blocks {start}-{end}: {len(logs)} logs", file=sys.stderr)
+            start = end + 1
+
+        if self.cursor() is not None and self.get_meta("cursor_hash") is None:
+            # Nothing new since a rewind (or a backfill that set the cursor)
+            block = client.eth.get_block(self.cursor())
+            self.set_meta("cursor_hash", block["hash"])
+            self.db.commit()
+
+        return applied
+
+    # -- queries ----------------------------------------------------------
+
+    def latest_token_id(self):
+        row = self.db.execute(
+            "SELECT MAX(token_id) FROM (SELECT token_id FROM auctions UNION SELECT token_id FROM contributions)"
+        ).fetchone()
+        return row[0]
+
+    def get_auction(self, token_id):
+        row = self.db.execute(
+            "SELECT token_id, start_time, end_time, settled, winning_url, winning_amount"
+            " FROM auctions WHERE token_id = ?",
+            (token_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        keys = ("tokenId", "startTime", "endTime", "settled", "winningUrl", "winningAmount")
+        auction = dict(zip(keys, row))
+        auction["settled"] = bool(auction["settled"])
+        return auction
+
+    def get_bids(self, token_id):
+        """Bids for one auction in the same shape as query-bids.py get_all_bids()."""
+        bids = {}
+        rows = self.db.execute(
+            "SELECT url, contributor, amount FROM contributions"
+            " WHERE token_id = ? ORDER BY block_number, log_index",
+            (token_id,),
+        )
+        for url, contributor, amount in rows:
+            bid = bids.get(url)
+            if bid is None:
+                bid = bids[url] = Bid(0, url)
+            bid.totalAmount += amount
+            bid.contributions.append(Contribution(contributor, amount))
+        return list(bids.values())
+
+    def counts(self):
+        return {
+            "auctions": self.db.execute("SELECT COUNT(*) FROM auctions").fetchone()[0],
+            "contributions": self.db.execute("SELECT COUNT(*) FROM contributions").fetchone()[0],
+            "bids": self.db.execute("SELECT COUNT(*) FROM bids").fetchone()[0],
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index QR Coin auction events into SQLite")
+    sub = parser.add_subparsers(dest="cmd")
+
+    p_sync = sub.add_parser("sync", help="Index new logs")
+    p_sync.add_argument("--confirmations", type=int, default=DEFAULT_CONFIRMATIONS, help="Blocks behind head to stop at")
+    p_sync.add_argument("--from-block", type=int, help="Start block for the first sync")
+    p_sync.add_argument("--max-range", type=int, default=MAX_BLOCK_RANGE, help="Blocks per eth_getLogs request")
+
+    sub.add_parser("status", help="Show cursor and table sizes")
+
+    p_bids = sub.add_parser("bids", help="Show indexed bids")
+    p_bids.add_argument("--token", type=int, help="Auction token ID (default: latest indexed)")
+    p_bids.add_argument("--json", action="store_true", help="Output as JSON")
+
+    args = parser.parse_args()
+    if not args.cmd:
+        print(__doc__)
+        sys.exit(1)
+
+    indexer = Indexer()
+
+    if args.cmd == "sync":
+        from rpcpool import load_rpc_client
+
+        client = load_rpc_client()
+        if not client.is_connected():
+            print("Error: Cannot connect to Base RPC", file=sys.stderr)
+            sys.exit(1)
+        applied = indexer.sync(client, args.confirmations, args.from_block, args.max_range)
+        print(f"✓ Applied {applied} events, cursor at block {indexer.cursor()}")
+
+    elif args.cmd == "status":
+        counts = indexer.counts()
+        print(f"Database:      {DB_FILE}")
+        print(f"Cursor:        {indexer.cursor() if indexer.cursor() is not None else 'not synced'}")
+        print(f"Auctions:      {counts['auctions']}")
+        print(f"Bids:          {counts['bids']}")
+        print(f"Contributions: {counts['contributions']}")
+
+    elif args.cmd == "bids":
+        token_id = args.token if args.token is not None else indexer.latest_token_id()
+        if token_id is None:
+            print("No auctions indexed. Run: indexer.py sync", file=sys.stderr)
+            sys.exit(1)
+        bids = sorted(indexer.get_bids(token_id), key=lambda b: b.totalAmount, reverse=True)
+        if args.json:
+            print(json.dumps({
+                "auction": indexer.get_auction(token_id),
+                "cursor": indexer.cursor(),
+                "bidCount": len(bids),
+                "bids": [
+                    {
+                        "rank": rank,
+                        "totalUsdc": bid.totalAmount / 1_000_000,
+                        "url": bid.urlString,
+                        "contributorCount": len(bid.contributions),
+                    }
+                    for rank, bid in enumerate(bids, 1)
+                ],
+            }, indent=2))
+        else:
+            print(f"Auction #{token_id} ({len(bids)} bids, indexed to block {indexer.cursor()})")
+            for rank, bid in enumerate(bids, 1):
+                print(f"#{rank} ${bid.totalAmount / 1_000_000:>8.2f} USDC ({len(bid.contributions)} contrib) - {bid.urlString}")
+
+
+if __name__ == "__main__":
+    main()
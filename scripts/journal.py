@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Persistent journal of every transaction this skill broadcasts.
+
+Each send is recorded in SQLite with its hash, sender, nonce, calldata,
+gas, fees and intent (e.g. "Create bid https://..."), then updated by the
+receipt tracker (tracker.py) to confirmed / reverted, or to replaced when
+a fee-bumped transaction with the same nonce took its place. Whether a
+bid landed is a lookup here instead of a bid re-query.
+
+Usage:
+    journal.py list [N]        Show the last N transactions (default 20)
+    journal.py pending         Show transactions without a receipt yet
+"""
+
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+DB_FILE = Path.home() / ".clawdbot" / "skills" / "qrcoin" / "journal.sqlite"
+
+# entry key -> column
+COLUMNS = {
+    "hash": "hash",
+    "chainId": "chain_id",
+    "from": "sender",
+    "nonce": "nonce",
+    "to": "to_addr",
+    "data": "data",
+    "gas": "gas",
+    "maxFeePerGas": "max_fee",
+    "maxPriorityFeePerGas": "priority_fee",
+    "gasPrice": "gas_price",
+    "urgency": "urgency",
+    "intent": "intent",
+    "sentAt": "sent_at",
+    "replaces": "replaces",
+    "status": "status",
+    "block": "block",
+    "gasUsed": "gas_used",
+    "gasEstimate": "gas_estimate",
+}
+
+
+class Journal:
+    """SQLite record of broadcast transactions and their outcome."""
+
+    def __init__(self, path=DB_FILE):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(path), timeout=10, isolation_level=None)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS txs ("
+            " hash TEXT PRIMARY KEY,"
+            " chain_id INTEGER NOT NULL,"
+            " sender TEXT NOT NULL,"
+            " nonce INTEGER NOT NULL,"
+            " to_addr TEXT NOT NULL,"
+            " data TEXT NOT NULL,"
+            " gas INTEGER NOT NULL,"
+            " max_fee INTEGER,"
+            " priority_fee INTEGER,"
+            " gas_price INTEGER,"
+            " urgency TEXT,"
+            " intent TEXT,"
+            " sent_at REAL NOT NULL,"
+            " replaces TEXT,"
+            " status TEXT NOT NULL DEFAULT 'pending',"
+            " block INTEGER,"
+            " gas_used INTEGER,"
+            " gas_estimate INTEGER)"
+        )
+        # Journals from before gas_estimate existed
+        if "gas_estimate" not in {row[1] for row in self.db.execute("PRAGMA table_info(txs)")}:
+            self.db.execute("ALTER TABLE txs ADD COLUMN gas_estimate INTEGER")
+        self.db.execute("CREATE INDEX IF NOT EXISTS txs_status ON txs (status)")
+
+    def record(self, entry):
+        """Store a just-broadcast transaction (an entry dict, see COLUMNS)."""
+        entry = {**entry, "status": entry.get("status", "pending")}
+        keys = [key for key in COLUMNS if key in entry]
+        self.db.execute(
+            f"INSERT OR REPLACE INTO txs ({', '.join(COLUMNS[k] for k in keys)}) "
+            f"VALUES ({', '.join('?' for _ in keys)})",
+            [entry[k] for k in keys],
+        )
+
+    def resolve(self, tx_hash, status, block=None, gas_used=None):
+        self.db.execute(
+            "UPDATE txs SET status = ?, block = ?, gas_used = ? WHERE hash = ?",
+            (status, block, gas_used, tx_hash),
+        )
+
+    def _entries(self, where="", params=(), limit=None):
+        query = f"SELECT {', '.join(COLUMNS.values())} FROM txs {where} ORDER BY sent_at DESC"
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+        return [
+            {key: value for key, value in zip(COLUMNS, row) if value is not None}
+            for row in self.db.execute(query, params).fetchall()
+        ]
+
+    def get(self, tx_hash):
+        rows = self._entries("WHERE hash = ?", (tx_hash,))
+        return rows[0] if rows else None
+
+    def pending(self, sender=None):
+        """
+        Unresolved transactions, oldest first, one per nonce: the latest
+        replacement (earlier attempts are still watched by the tracker
+        through their `replaces` chain).
+        """
+        if sender is None:
+            rows = self._entries("WHERE status = 'pending'")
+        else:
+            rows = self._entries("WHERE status = 'pending' AND lower(sender) = ?", (sender.lower(),))
+        latest = {}
+        for entry in rows:  # newest first
+            latest.setdefault((entry["chainId"], entry["from"], entry["nonce"]), entry)
+        return sorted(latest.values(), key=lambda e: e["sentAt"])
+
+    def attempts(self, entry):
+        """Every pending transaction sharing this entry's nonce, oldest first."""
+        rows = self._entries(
+            "WHERE status = 'pending' AND chain_id = ? AND sender = ? AND nonce = ?",
+            (entry["chainId"], entry["from"], entry["nonce"]),
+        )
+        return rows[::-1]
+
+    def rows(self, limit=20):
+        return self._entries(limit=limit)
+
+
+def open_journal():
+    """Open the default journal, or return None if it is unusable."""
+    try:
+        return Journal()
+    except (OSError, sqlite3.Error) as e:
+        print(f"Warning: transaction journal disabled ({e})", file=sys.stderr)
+        return None
+
+
+def print_entries(entries):
+    if not entries:
+        print("No transactions")
+    for entry in entries:
+        age = int(time.time() - entry["sentAt"])
+        where = f" block {entry['block']}" if "block" in entry else ""
+        print(f"{entry['status']:<9} nonce {entry['nonce']:<5} {entry.get('intent', ''):<40} "
+              f"{entry['hash']}{where} ({age}s ago)")
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    cmd = sys.argv[1]
+    journal = Journal()
+
+    if cmd == 'list':
+        print_entries(journal.rows(int(sys.argv[2]) if len(sys.argv) > 2 else 20))
+    elif cmd == 'pending':
+        print_entries(journal.pending())
+    else:
+        print(f"Unknown command: {cmd}")
+        print(__doc__)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -12,6 +12,9 @@ Usage:
   keychain.py retrieve              Retrieve key from keychain
   keychain.py delete                Remove key from keychain
   keychain.py status                Check if key is stored
+
+store / retrieve / delete take --account NAME to keep extra wallets
+(e.g. a fleet, see fleet.py) next to the default one.
 """
 
 import sys
@@ -28,6 +31,12 @@ ACCOUNT_NAME = "agent-wallet"
 CONFIG_DIR = Path.home() / ".clawdbot" / "skills" / "qrcoin"
 ENCRYPTED_FILE = CONFIG_DIR / ".wallet.enc"
 
+def encrypted_file(account: str = ACCOUNT_NAME) -> Path:
+    """Encrypted key file for an account (the default account keeps .wallet.enc)."""
+    if account == ACCOUNT_NAME:
+        return ENCRYPTED_FILE
+    return CONFIG_DIR / f".wallet-{account}.enc"
+
 def get_platform():
     """Detect platform and available keychain."""
     system = platform.system()
@@ -45,21 +54,21 @@ def get_platform():
     # Fallback to encrypted file
     return "file"
 
-def macos_store(private_key: str) -> bool:
+def macos_store(private_key: str, account: str = ACCOUNT_NAME) -> bool:
     """Store in macOS Keychain."""
     try:
         # Delete existing entry first (ignore errors)
         subprocess.run([
             "security", "delete-generic-password",
             "-s", SERVICE_NAME,
-            "-a", ACCOUNT_NAME
+            "-a", account
         ], capture_output=True)
         
         # Add new entry
         result = subprocess.run([
             "security", "add-generic-password",
             "-s", SERVICE_NAME,
-            "-a", ACCOUNT_NAME,
+            "-a", account,
             "-w", private_key,
             "-U"  # Update if exists
         ], capture_output=True, text=True)
@@ -69,13 +78,13 @@ def macos_store(private_key: str) -> bool:
         print(f"Keychain error: {e}")
         return False
 
-def macos_retrieve() -> str:
+def macos_retrieve(account: str = ACCOUNT_NAME) -> str:
     """Retrieve from macOS Keychain."""
     try:
         result = subprocess.run([
             "security", "find-generic-password",
             "-s", SERVICE_NAME,
-            "-a", ACCOUNT_NAME,
+            "-a", account,
             "-w"  # Output password only
         ], capture_output=True, text=True)
         
@@ -85,26 +94,26 @@ def macos_retrieve() -> str:
     except Exception:
         return None
 
-def macos_delete() -> bool:
+def macos_delete(account: str = ACCOUNT_NAME) -> bool:
     """Delete from macOS Keychain."""
     try:
         result = subprocess.run([
             "security", "delete-generic-password",
             "-s", SERVICE_NAME,
-            "-a", ACCOUNT_NAME
+            "-a", account
         ], capture_output=True)
         return result.returncode == 0
     except Exception:
         return False
 
-def linux_store(private_key: str) -> bool:
+def linux_store(private_key: str, account: str = ACCOUNT_NAME) -> bool:
     """Store in Linux secret-service (GNOME Keyring, KWallet, etc.)."""
     try:
         result = subprocess.run([
             "secret-tool", "store",
             "--label", "QR Coin Agent Wallet",
             "service", SERVICE_NAME,
-            "account", ACCOUNT_NAME
+            "account", account
         ], input=private_key.encode(), capture_output=True)
         
         return result.returncode == 0
@@ -112,13 +121,13 @@ def linux_store(private_key: str) -> bool:
         print(f"Secret service error: {e}")
         return False
 
-def linux_retrieve() -> str:
+def linux_retrieve(account: str = ACCOUNT_NAME) -> str:
     """Retrieve from Linux secret-service."""
     try:
         result = subprocess.run([
             "secret-tool", "lookup",
             "service", SERVICE_NAME,
-            "account", ACCOUNT_NAME
+            "account", account
         ], capture_output=True, text=True)
         
         if result.returncode == 0:
@@ -127,13 +136,13 @@ def linux_retrieve() -> str:
     except Exception:
         return None
 
-def linux_delete() -> bool:
+def linux_delete(account: str = ACCOUNT_NAME) -> bool:
     """Delete from Linux secret-service."""
     try:
         result = subprocess.run([
             "secret-tool", "clear",
             "service", SERVICE_NAME,
-            "account", ACCOUNT_NAME
+            "account", account
         ], capture_output=True)
         return result.returncode == 0
     except Exception:
@@ -194,7 +203,7 @@ def decrypt_key(encrypted: bytes, password: str) -> str:
     except Exception as e:
         return None
 
-def file_store(private_key: str) -> bool:
+def file_store(private_key: str, account: str = ACCOUNT_NAME) -> bool:
     """Store encrypted in file (fallback)."""
     password = getpass("Enter encryption password: ")
     password2 = getpass("Confirm password: ")
@@ -204,30 +213,35 @@ def file_store(private_key: str) -> bool:
         return False
     
     encrypted = encrypt_key(private_key, password)
+    path = encrypted_file(account)
     
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    with open(ENCRYPTED_FILE, 'wb') as f:
+    with open(path, 'wb') as f:
         f.write(encrypted)
-    os.chmod(ENCRYPTED_FILE, 0o600)
+    os.chmod(path, 0o600)
     
     return True
 
-def file_retrieve() -> str:
-    """Retrieve from encrypted file."""
-    if not ENCRYPTED_FILE.exists():
+def file_retrieve(account: str = ACCOUNT_NAME, password: str = None) -> str:
+    """Retrieve from encrypted file (prompts for the password unless given)."""
+    path = encrypted_file(account)
+    if not path.exists():
         return None
     
-    password = getpass("Enter wallet password: ")
+    if password is None:
+        label = "wallet" if account == ACCOUNT_NAME else f"'{account}' wallet"
+        password = getpass(f"Enter {label} password: ")
     
-    with open(ENCRYPTED_FILE, 'rb') as f:
+    with open(path, 'rb') as f:
         encrypted = f.read()
     
     return decrypt_key(encrypted, password)
 
-def file_delete() -> bool:
+def file_delete(account: str = ACCOUNT_NAME) -> bool:
     """Delete encrypted file."""
-    if ENCRYPTED_FILE.exists():
-        ENCRYPTED_FILE.unlink()
+    path = encrypted_file(account)
+    if path.exists():
+        path.unlink()
         return True
     return False
 
@@ -238,15 +252,17 @@ BACKENDS = {
     "file": (file_store, file_retrieve, file_delete),
 }
 
-def store_key(private_key: str) -> bool:
+def store_key(private_key: str, account: str = ACCOUNT_NAME) -> bool:
     """Store private key in most secure available backend."""
     backend = get_platform()
     store_fn, _, _ = BACKENDS[backend]
     
     print(f"Using {backend} keychain...")
-    success = store_fn(private_key)
+    success = store_fn(private_key, account)
     
-    if success:
+    if success and account != ACCOUNT_NAME:
+        print(f"✓ Private key for '{account}' stored securely ({backend})")
+    elif success:
         print(f"✓ Private key stored securely ({backend})")
         
         # Update config to indicate keychain storage
@@ -261,8 +277,11 @@ def store_key(private_key: str) -> bool:
     
     return success
 
-def retrieve_key() -> str:
-    """Retrieve private key from keychain."""
+def retrieve_key(account: str = ACCOUNT_NAME, password: str = None) -> str:
+    """
+    Retrieve private key from keychain. `password` is only used by the
+    encrypted-file backend (prompted for when not given).
+    """
     # Check config for storage method
     config_file = CONFIG_DIR / "config.json"
     backend = get_platform()
@@ -272,16 +291,18 @@ def retrieve_key() -> str:
             config = json.load(f)
         
         # If plain key still in config, return it (legacy)
-        if 'privateKey' in config:
+        if 'privateKey' in config and account == ACCOUNT_NAME:
             return config['privateKey']
         
         # Use stored backend preference
         backend = config.get('keyStorage', backend)
     
     _, retrieve_fn, _ = BACKENDS.get(backend, BACKENDS['file'])
-    return retrieve_fn()
+    if retrieve_fn is file_retrieve:
+        return file_retrieve(account, password)
+    return retrieve_fn(account)
 
-def delete_key() -> bool:
+def delete_key(account: str = ACCOUNT_NAME) -> bool:
     """Delete private key from keychain."""
     backend = get_platform()
     
@@ -292,7 +313,7 @@ def delete_key() -> bool:
         backend = config.get('keyStorage', backend)
     
     _, _, delete_fn = BACKENDS.get(backend, BACKENDS['file'])
-    success = delete_fn()
+    success = delete_fn(account)
     
     if success:
         print(f"✓ Private key removed from {backend}")
@@ -338,12 +359,20 @@ def main():
         sys.exit(1)
     
     cmd = sys.argv[1]
+    account = ACCOUNT_NAME
+    if '--account' in sys.argv:
+        i = sys.argv.index('--account')
+        if i + 1 >= len(sys.argv):
+            print("Usage: keychain.py <command> --account NAME")
+            sys.exit(1)
+        account = sys.argv[i + 1]
+        del sys.argv[i:i + 2]
     
     if cmd == 'store':
         if len(sys.argv) < 3:
-            print("Usage: keychain.py store <private_key>")
+            print("Usage: keychain.py store <private_key> [--account NAME]")
             sys.exit(1)
-        success = store_key(sys.argv[2])
+        success = store_key(sys.argv[2], account)
         sys.exit(0 if success else 1)
     
     elif cmd == 'retrieve':
@@ -360,7 +389,7 @@ def main():
                 print("  security find-generic-password -s qrcoin-wallet -a agent-wallet -w", file=sys.stderr)
                 sys.exit(1)
         
-        key = retrieve_key()
+        key = retrieve_key(account)
         if key:
             print(key)
         else:
@@ -368,7 +397,7 @@ def main():
             sys.exit(1)
     
     elif cmd == 'delete':
-        success = delete_key()
+        success = delete_key(account)
         sys.exit(0 if success else 1)
     
     elif cmd == 'status':
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Multicall3 helpers for batching contract reads into a single eth_call.
+
+Multicall3 is deployed at the same address on Base and every other major
+chain. aggregate3() takes a list of (target, allowFailure, callData) and
+returns one (success, returnData) pair per call, so any number of view
+calls costs a single RPC round trip.
+
+Usage (as a library):
+    from multicall import aggregate3, selector
+
+    results = aggregate3(client, [
+        (AUCTION, selector("createBidReservePrice()")),
+        (AUCTION, selector("contributeBidReservePrice()")),
+    ])
+"""
+
+from eth_abi import decode, encode
+from eth_utils import keccak, to_checksum_address
+
+MULTICALL3_ADDR = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+
+def selector(signature: str) -> bytes:
+    """Return the 4-byte function selector for a signature like 'getBid(string)'."""
+    return keccak(text=signature)[:4]
+
+
+AGGREGATE3 = selector("aggregate3((address,bool,bytes)[])")
+
+
+def encode_call(signature: str, arg_types=(), args=()) -> bytes:
+    """Encode calldata for a function signature and its arguments."""
+    if not arg_types:
+        return selector(signature)
+    return selector(signature) + encode(list(arg_types), list(args))
+
+
+def aggregate3(client, calls, block_identifier="latest", reader=None):
+    """
+    Execute calls through Multicall3.aggregate3 in one eth_call.
+
+    `client` is an rpc.RpcClient (or a Web3 instance; only eth.call is used).
+
+    Each call is (target, calldata) or (target, calldata, allow_failure);
+    allow_failure defaults to True so one reverting lookup (e.g. getBid on
+    an unknown URL) doesn't sink the whole batch.
+
+    If `reader` (a readcache.BlockReader) is given, the batch goes through
+    it instead, pinned to its block and served from its cache when possible.
+
+    Returns a list of (success, return_data_bytes) in call order.
+    """
+    packed = []
+    for call in calls:
+        target, calldata = call[0], call[1]
+        allow_failure = call[2] if len(call) > 2 else True
+        packed.append((to_checksum_address(target), allow_failure, bytes(calldata)))
+
+    data = AGGREGATE3 + encode(["(address,bool,bytes)[]"], [packed])
+    if reader is not None:
+        raw = reader.call(to_checksum_address(MULTICALL3_ADDR), data)
+    else:
+        raw = client.eth.call(
+            {"to": to_checksum_address(MULTICALL3_ADDR), "data": "0x" + data.hex()},
+            block_identifier,
+        )
+    (results,) = decode(["(bool,bytes)[]"], bytes(raw))
+    return [(success, bytes(ret)) for success, ret in results]
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Local nonce manager for the signing wallet.
+
+Keeps the next nonce per (chain, address) in SQLite so back-to-back
+transactions (approve then bid, or several CLI runs in a row) get
+consecutive nonces without waiting for the previous one to show up on
+chain. Each allocation is reconciled with the provider's `pending`
+transaction count:
+
+  - no local state, or chain ahead of us  -> use the chain's count
+  - local ahead of chain, recently used   -> trust local (our txs may not
+                                             have reached this node yet)
+  - local ahead of chain, stale           -> assume dropped, use chain
+
+Allocation runs inside an IMMEDIATE transaction, so concurrent processes
+never hand out the same nonce.
+
+Usage:
+    nonces.py show             Show tracked nonces
+    nonces.py reset [address]  Forget local state (all addresses by default)
+"""
+
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+DB_FILE = Path.home() / ".clawdbot" / "skills" / "qrcoin" / "nonces.sqlite"
+STALE_AFTER = 300  # seconds before a local nonce ahead of the chain is distrusted
+
+
+class NonceManager:
+    """Persisted next-nonce per (chain_id, address)."""
+
+    def __init__(self, path=DB_FILE, stale_after=STALE_AFTER):
+        self.stale_after = stale_after
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(path), timeout=10, isolation_level=None)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS nonces ("
+            " chain_id INTEGER NOT NULL,"
+            " address TEXT NOT NULL,"
+            " next_nonce INTEGER NOT NULL,"
+            " updated REAL NOT NULL,"
+            " PRIMARY KEY (chain_id, address))"
+        )
+
+    def allocate(self, chain_id, address, pending_count, count=1):
+        """
+        Reserve `count` consecutive nonces given the chain's pending count.
+
+        Returns the list of nonces, lowest first.
+        """
+        address = address.lower()
+        now = time.time()
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            row = self.db.execute(
+                "SELECT next_nonce, updated FROM nonces WHERE chain_id = ? AND address = ?",
+                (chain_id, address),
+            ).fetchone()
+            start = pending_count
+            if row is not None:
+                local, updated = row
+                if local > pending_count and now - updated <= self.stale_after:
+                    start = local
+            self.db.execute(
+                "INSERT OR REPLACE INTO nonces VALUES (?, ?, ?, ?)",
+                (chain_id, address, start + count, now),
+            )
+            self.db.execute("COMMIT")
+        except BaseException:
+            self.db.execute("ROLLBACK")
+            raise
+        return list(range(start, start + count))
+
+    def advance(self, chain_id, address, nonce):
+        """Record that `nonce` was used outside allocate(): the next one is at least nonce + 1."""
+        self.db.execute(
+            "INSERT INTO nonces VALUES (?, ?, ?, ?)"
+            " ON CONFLICT (chain_id, address) DO UPDATE SET"
+            "  next_nonce = MAX(next_nonce, excluded.next_nonce),"
+            "  updated = excluded.updated",
+            (chain_id, address.lower(), nonce + 1, time.time()),
+        )
+
+    def release(self, chain_id, address, nonces):
+        """
+        Give back nonces that were never broadcast.
+
+        Only rolls back if nothing was allocated after them, otherwise the
+        gap is left for the chain reconciliation to close.
+        """
+        if not nonces:
+            return
+        address = address.lower()
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            self.db.execute(
+                "UPDATE nonces SET next_nonce = ?, updated = ? "
+                "WHERE chain_id = ? AND address = ? AND next_nonce = ?",
+                (min(nonces), time.time(), chain_id, address, max(nonces) + 1),
+            )
+            self.db.execute("COMMIT")
+        except BaseException:
+            self.db.execute("ROLLBACK")
+            raise
+
+    def reset(self, address=None):
+        if address is None:
+            self.db.execute("DELETE FROM nonces")
+        else:
+            self.db.execute("DELETE FROM nonces WHERE address = ?", (address.lower(),))
+
+    def rows(self):
+        return self.db.execute(
+            "SELECT chain_id, address, next_nonce, updated FROM nonces ORDER BY updated DESC"
+        ).fetchall()
+
+
+def open_nonces():
+    """Open the default nonce store, or return None if it is unusable."""
+    try:
+        return NonceManager()
+    except (OSError, sqlite3.Error) as e:
+        print(f"Warning: local nonce tracking disabled ({e})", file=sys.stderr)
+        return None
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    cmd = sys.argv[1]
+    manager = NonceManager()
+
+    if cmd == 'show':
+        rows = manager.rows()
+        if not rows:
+            print("No nonces tracked")
+        for chain_id, address, next_nonce, updated in rows:
+            age = int(time.time() - updated)
+            print(f"chain {chain_id}  {address}  next {next_nonce}  ({age}s ago)")
+    elif cmd == 'reset':
+        manager.reset(sys.argv[2] if len(sys.argv) > 2 else None)
+        print("✓ Nonce state cleared")
+    else:
+        print(f"Unknown command: {cmd}")
+        print(__doc__)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
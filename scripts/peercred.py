@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Peer credential check for the Unix-socket servers (signer.py, daemon.py).
+
+Both sockets are created 0600, and on Linux the server also asks the
+kernel who connected (SO_PEERCRED) and drops clients running as another
+user. Stdlib only, so the daemon can import it on its fast path.
+
+Usage (as a library):
+    from peercred import peer_is_owner
+
+    if not peer_is_owner(self.request):
+        return
+"""
+
+import os
+import socket
+import struct
+
+# struct ucred: pid, uid, gid
+UCRED = struct.Struct("3i")
+
+
+def peer_is_owner(sock):
+    """Whether the process on the other end of a Unix socket runs as our uid."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return True  # The socket file's 0600 mode is the only check there
+    creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, UCRED.size)
+    _pid, uid, _gid = UCRED.unpack(creds)
+    return uid == os.getuid()
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Pre-signed bid for the next auction, broadcast the moment it starts.
+
+`qrcoin.py prepare <url> [name]` builds and signs
+createBid(tokenId + 1, url, name) ahead of time with the next nonce, a
+gas limit and EIP-1559 fees at "snipe" urgency (see fees.py), and stores
+the raw transaction in
+PREPARED_FILE. `qrcoin.py arm` then polls for the AuctionCreated log
+(emitted by settleCurrentAndCreateNewAuction in the same transaction)
+and sends the stored bytes as soon as it appears: no encoding, RPC
+reads or signing sit between noticing the new auction and broadcasting.
+
+The transaction is re-signed only when its parameters no longer hold:
+the new auction's tokenId differs from the prepared one, or the wallet's
+next nonce moved (checked every RECHECK_INTERVAL while armed, and after a
+nonce error on send). The signer (signer.py agent, or the key loaded
+once) is held while armed so re-signing stays fast. USDC must already be approved for the bid amount.
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from contracts import AUCTION, CHAIN_ID, DEFAULT_GAS_LIMIT, GAS_BUFFER
+from encode import encode_create_bid
+from events import TOPICS, decode_log
+from fastabi import decode_uint
+from fees import FeeHistory, tx_fees
+from gasmodel import GasModel
+from journal import open_journal
+from multicall import encode_call
+from nonces import open_nonces
+from rpc import RpcError
+
+PREPARED_FILE = Path.home() / ".clawdbot" / "skills" / "qrcoin" / "prepared-bid.json"
+ARM_POLL_INTERVAL = 0.25      # seconds between log polls while armed
+RECHECK_INTERVAL = 15         # seconds between nonce checks while armed
+
+AUCTION_CALL = {"to": AUCTION, "data": "0x" + encode_call("auction()").hex()}
+
+
+def save_prepared(record):
+    PREPARED_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(PREPARED_FILE, "w") as f:
+        json.dump(record, f, indent=2)
+    os.chmod(PREPARED_FILE, 0o600)
+
+
+def load_prepared():
+    if not PREPARED_FILE.exists():
+        return None
+    with open(PREPARED_FILE) as f:
+        return json.load(f)
+
+
+def next_nonce(manager, sender, pending):
+    """The nonce the next transaction would get, without reserving it."""
+    if manager is None:
+        return pending
+    rows = {(chain, addr): (n, updated) for chain, addr, n, updated in manager.rows()}
+    local = rows.get((CHAIN_ID, sender.lower()))
+    if local and local[0] > pending and time.time() - local[1] <= manager.stale_after:
+        return local[0]
+    return pending
+
+
+def sign_bid(signer, record):
+    """(Re-)sign the createBid described by `record`; updates raw/hash in place."""
+    data = "0x" + encode_create_bid(record["tokenId"], record["url"], record["name"])
+    signed = signer.sign_transaction({
+        "to": AUCTION,
+        "data": data,
+        "gas": record["gas"],
+        "type": 2,
+        "maxFeePerGas": record["maxFeePerGas"],
+        "maxPriorityFeePerGas": record["maxPriorityFeePerGas"],
+        "nonce": record["nonce"],
+        "chainId": CHAIN_ID,
+    })
+    record["raw"] = "0x" + bytes(signed.raw_transaction).hex()
+    record["hash"] = "0x" + bytes(signed.hash).hex()
+    record["signedAt"] = time.time()
+    return record
+
+
+def prepare(client, signer, url, name, max_fee=None, urgency="snipe"):
+    """
+    Sign createBid(current tokenId + 1) and store it in PREPARED_FILE.
+
+    The gas limit comes from the gas model, or from estimating the same
+    call against the current auction (the next one doesn't exist yet),
+    falling back to the default. `max_fee` (wei) caps maxFeePerGas: the
+    urgency level's fee is used when it is lower.
+    """
+    history = FeeHistory()
+    results = client.batch([
+        ("eth_call", [AUCTION_CALL, "latest"]),
+        ("eth_getTransactionCount", [signer.address, "pending"]),
+        history.request(),
+    ])
+    for value in results[:2]:
+        if isinstance(value, RpcError):
+            raise value
+    token_id = int(results[0][2:66], 16)
+    fees = tx_fees(history, urgency, results[2])
+    if fees is None:
+        raise results[2]
+    if max_fee is not None:
+        fees["maxFeePerGas"] = min(fees["maxFeePerGas"], max_fee)
+        fees["maxPriorityFeePerGas"] = min(fees["maxPriorityFeePerGas"], fees["maxFeePerGas"])
+
+    model = GasModel()
+    probe = "0x" + encode_create_bid(token_id, url, name)
+    gas = model.predict(probe)
+    estimate = None
+    if gas is None:
+        try:
+            gas = estimate = client.eth.estimate_gas({"from": signer.address, "to": AUCTION, "data": probe})
+        except RpcError:
+            gas = None
+    gas = int(gas * GAS_BUFFER) if gas is not None else DEFAULT_GAS_LIMIT
+
+    record = {
+        "tokenId": token_id + 1,
+        "url": url,
+        "name": name,
+        "from": signer.address,
+        "nonce": next_nonce(open_nonces(), signer.address, int(results[1], 16)),
+        "gas": gas,
+        "urgency": urgency,
+        "maxFeePerGas": fees["maxFeePerGas"],
+        "maxPriorityFeePerGas": fees["maxPriorityFeePerGas"],
+    }
+    if estimate is not None:
+        record["gasEstimate"] = estimate
+    sign_bid(signer, record)
+    save_prepared(record)
+    return record
+
+
+def _new_auction_logs(client, filter_id, last_block):
+    """
+    Poll for AuctionCreated; returns (logs, filter_id, last_block).
+
+    `filter_id` is None before the first poll and False once the node has
+    refused eth_newFilter, after which plain getLogs polling is used.
+    """
+    params = {"address": AUCTION, "topics": [TOPICS["AuctionCreated"]]}
+    if filter_id:
+        try:
+            return client.eth.get_filter_changes(filter_id), filter_id, last_block
+        except RpcError:
+            # Filter expired; fall through to a getLogs catch-up and recreate
+            filter_id = None
+    head = client.eth.block_number
+    logs = []
+    if head > last_block:
+        logs = client.eth.get_logs({**params, "fromBlock": last_block + 1, "toBlock": head})
+    if filter_id is None:
+        try:
+            filter_id = client.eth.new_filter({**params, "fromBlock": "latest"})
+        except RpcError:
+            filter_id = False
+    return logs, filter_id, head
+
+
+def wait_for_auction(client, signer, record, manager, interval=ARM_POLL_INTERVAL, timeout=None):
+    """
+    Block until an auction with tokenId >= the prepared one exists,
+    keeping the prepared nonce current meanwhile. Returns the live
+    tokenId, or None on timeout.
+    """
+    current = decode_uint(client.eth.call(AUCTION_CALL)[:32])
+    if current >= record["tokenId"]:
+        return current  # Already started; fire immediately
+
+    started = time.time()
+    last_check = 0.0
+    last_block = client.eth.block_number
+    filter_id = None
+    while timeout is None or time.time() - started < timeout:
+        if time.time() - last_check > RECHECK_INTERVAL:
+            pending = client.eth.get_transaction_count(signer.address, "pending")
+            nonce = next_nonce(manager, signer.address, pending)
+            if nonce != record["nonce"]:
+                print(f"Nonce moved {record['nonce']} -> {nonce}, re-signing", file=sys.stderr)
+                record["nonce"] = nonce
+                save_prepared(sign_bid(signer, record))
+            last_check = time.time()
+
+        logs, filter_id, last_block = _new_auction_logs(client, filter_id, last_block)
+        created = [e for e in map(decode_log, logs) if e and e["event"] == "AuctionCreated"]
+        if created:
+            return created[-1]["tokenId"]
+        time.sleep(interval)
+    return None
+
+
+def arm(client, signer, record, interval=ARM_POLL_INTERVAL, timeout=None):
+    """
+    Wait for the next AuctionCreated and broadcast the prepared bid.
+
+    Returns the transaction's journal entry, or None on timeout.
+    """
+    manager = open_nonces()
+
+    print(f"Armed: createBid #{record['tokenId']} for {record['url']} (nonce {record['nonce']})", file=sys.stderr)
+    token_id = wait_for_auction(client, signer, record, manager, interval, timeout)
+    if token_id is None:
+        return None
+
+    if token_id != record["tokenId"]:
+        print(f"Auction is #{token_id}, not #{record['tokenId']}; re-signing", file=sys.stderr)
+        record["tokenId"] = token_id
+        sign_bid(signer, record)
+
+    try:
+        tx_hash = client.eth.send_raw_transaction(record["raw"])
+    except RpcError as e:
+        if "nonce" not in str(e).lower():
+            raise
+        record["nonce"] = client.eth.get_transaction_count(signer.address, "pending")
+        print(f"Nonce rejected ({e}); re-signing with {record['nonce']}", file=sys.stderr)
+        tx_hash = client.eth.send_raw_transaction(sign_bid(signer, record)["raw"])
+
+    if manager is not None:
+        manager.advance(CHAIN_ID, signer.address, record["nonce"])
+    record["sentHash"] = tx_hash
+    record["sentAt"] = time.time()
+    save_prepared(record)
+
+    entry = {
+        "hash": tx_hash,
+        "chainId": CHAIN_ID,
+        "from": signer.address,
+        "nonce": record["nonce"],
+        "to": AUCTION,
+        "data": "0x" + encode_create_bid(record["tokenId"], record["url"], record["name"]),
+        "gas": record["gas"],
+        "maxFeePerGas": record["maxFeePerGas"],
+        "maxPriorityFeePerGas": record["maxPriorityFeePerGas"],
+        "urgency": record["urgency"],
+        "intent": f"Create bid {record['url']} (pre-signed)",
+        "sentAt": record["sentAt"],
+    }
+    if "gasEstimate" in record:
+        entry["gasEstimate"] = record["gasEstimate"]
+    journal = open_journal()
+    if journal is not None:
+        journal.record(entry)
+    return entry
@@ -0,0 +1,794 @@
+#!/usr/bin/env python3
+"""
+QR Coin auction CLI: approve, bid, contribute and status in one process.
+
+Replaces the build-tx.sh / submit-tx.sh process chains (jq, keychain.py,
+curl, encode.py and a heredoc Python per bid) with a single interpreter:
+config is parsed once, the key is read in-process and every RPC goes
+over one keep-alive connection. Both shell scripts now exec this.
+
+Usage:
+    qrcoin.py approve [amount_usdc] [--yes]        Sign and submit (submit-tx.sh)
+    qrcoin.py createBid <url> [name] [--yes]
+    qrcoin.py contributeToBid <url> [name] [--yes] (alias: contribute)
+    qrcoin.py createBid <url> --approve 50 --yes   Approve + bid pipelined (consecutive
+                                                   nonces, both receipts tracked)
+    qrcoin.py createBid <url> --urgency snipe      Fee level: low / normal / high / snipe
+                                                   (bids default to snipe in the last minutes)
+    qrcoin.py status                               Auction status (build-tx.sh status)
+    qrcoin.py prepare <url> [name]                 Pre-sign createBid for the next auction
+    qrcoin.py arm [--timeout S]                    Broadcast it when AuctionCreated appears
+    qrcoin.py track [--timeout S]                  Wait for receipts of journaled transactions,
+                                                   replacing stuck ones with higher fees
+    qrcoin.py --build <action> [args...]           Print calldata JSON for submit.html
+                                                   instead of signing (build-tx.sh)
+"""
+
+if __name__ == "__main__":
+    # Served by the resident daemon when it is running (see daemon.py)
+    from daemon import forward
+    forward("qrcoin.py")
+
+import tracing  # First, so the profile's import phase covers the rest
+
+import asyncio
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+
+from eth_utils import to_checksum_address
+
+from contracts import AUCTION, CHAIN_ID, DEFAULT_GAS_LIMIT, GAS_BUFFER, USDC
+from encode import SELECTORS, encode_approve, encode_contribute_to_bid, encode_create_bid
+from fastabi import decode_auction, decode_uint
+from fees import URGENCY, FeeHistory, tx_fees, urgency_for
+from gasmodel import GasModel
+from journal import open_journal
+from multicall import aggregate3, encode_call
+from nonces import open_nonces
+from reverts import revert_from_rpc_error
+from rpc import RpcError
+from rpcpool import connect
+from signer import SignerError, open_signer
+from tracker import BUMP_AFTER, RECEIPT_TIMEOUT, Replacer, track
+
+if __name__ == "__main__":
+    tracing.mark("import")
+
+CONFIG_FILE = Path.home() / ".clawdbot" / "skills" / "qrcoin" / "config.json"
+RPC_DEFAULT = "https://mainnet.base.org"
+
+RULE = "═" * 55
+
+
+class PreflightRevert(Exception):
+    """A call would revert in simulation; nothing was signed or sent."""
+
+    def __init__(self, index, revert):
+        self.index = index
+        self.revert = revert
+        super().__init__(str(revert))
+
+
+def load_settings(signing):
+    """
+    Resolve RPC URL, X handle and sender address from the skill config.
+
+    Signing follows submit-tx.sh (config required; a shared wallet's
+    rpcUrls.base and address win); building/status follow build-tx.sh
+    (config optional, qrcoin rpcUrl only).
+    """
+    if not CONFIG_FILE.exists():
+        if signing:
+            print("Error: No config found. Run setup.sh first.")
+            sys.exit(1)
+        return {"rpcUrl": RPC_DEFAULT, "rpcPool": [], "rpcHedge": False,
+                "xHandle": "Anonymous", "address": None}
+
+    with open(CONFIG_FILE) as f:
+        config = json.load(f)
+    settings = {
+        "rpcUrl": config.get("rpcUrl") or RPC_DEFAULT,
+        "rpcPool": list(config.get("rpcPool") or []),
+        "rpcHedge": bool(config.get("rpcHedge")),
+        "xHandle": config.get("xHandle") or "Anonymous",
+        "address": config.get("address"),
+    }
+    if signing and config.get("walletSource") == "shared":
+        wallet_config = Path(config.get("walletConfig") or "")
+        if not wallet_config.is_file():
+            print(f"Error: Shared wallet config not found: {config.get('walletConfig')}")
+            sys.exit(1)
+        with open(wallet_config) as f:
+            shared = json.load(f)
+        settings["address"] = shared.get("address")
+        settings["rpcUrl"] = (shared.get("rpcUrls") or {}).get("base") or RPC_DEFAULT
+    return settings
+
+
+def open_client(settings):
+    """RpcClient for rpcUrl, or an RpcPool when rpcPool lists more endpoints."""
+    return connect([settings["rpcUrl"]] + settings["rpcPool"], settings["rpcHedge"])
+
+
+def load_private_key():
+    """Read the signing key in-process (same as `keychain.py retrieve --internal`)."""
+    from keychain import retrieve_key
+
+    try:
+        key = retrieve_key()
+    except Exception:
+        key = None
+    if not key:
+        print("Error: Could not retrieve private key. Run setup.sh first.")
+        sys.exit(1)
+    return key
+
+
+def load_signer():
+    """The signer agent if one is running (signer.py start), else the key in-process."""
+    return open_signer(load_private_key)
+
+
+def usdc_to_wei(amount):
+    """Convert a decimal USDC string to 6-decimal units, truncating extra places."""
+    try:
+        value = Decimal(amount)
+    except InvalidOperation:
+        value = None
+    if value is None or not value.is_finite() or value < 0:
+        print(f"Error: Invalid USDC amount: {amount}", file=sys.stderr)
+        sys.exit(1)
+    return int(value * 1_000_000)
+
+
+def get_auction(client, required=False):
+    """
+    Current (token ID, end time); (0, 0) if the call fails, like build-tx.sh.
+    With `required` (anything that signs), a failed read exits instead.
+    """
+    try:
+        auction = decode_auction(client.eth.call({"to": AUCTION, "data": "0x" + encode_call("auction()").hex()}))
+        return auction[0], auction[3]
+    except Exception as e:
+        if required:
+            print(f"Error: Could not read the current auction ({e})")
+            sys.exit(1)
+        return 0, 0
+
+
+def confirm(yes):
+    if yes:
+        return True
+    try:
+        answer = input("Submit transaction? (y/N): ")
+    except EOFError:
+        answer = ""
+    if answer in ("y", "Y"):
+        return True
+    print("Cancelled.")
+    return False
+
+
+def prefetch_tx_params(client, sender, calls, fee_request, cold):
+    """
+    Fetch the pending and mined nonces, the fee history update, a
+    pre-flight eth_call per call and a gas estimate per cold call in one
+    JSON-RPC batch.
+
+    `calls` and `cold` are lists of (to, data); `cold` are the calls the
+    gas model can't predict yet. `fee_request` is FeeHistory.request().
+    Returns (pending_count, mined_count, fee_history, simulations,
+    estimates): each simulation is None or the RpcError the call failed
+    with, and the fee history and each estimate may also be an RpcError.
+    Falls back to serial calls if the provider rejects batches.
+    """
+    requests = [
+        ("eth_getTransactionCount", [sender, "pending"]),
+        ("eth_getTransactionCount", [sender, "latest"]),
+        fee_request,
+    ] + [
+        ("eth_call", [{"from": sender, "to": to, "data": data}, "latest"]) for to, data in calls
+    ] + [("eth_estimateGas", [{"from": sender, "to": to, "data": data}]) for to, data in cold]
+    try:
+        results = client.batch(requests)
+    except RpcError:
+        results = []
+        for method, params in requests:
+            try:
+                results.append(client.request(method, params))
+            except RpcError as e:
+                results.append(e)
+    for count in results[:2]:
+        if isinstance(count, RpcError):
+            raise count
+    split = 3 + len(calls)
+    simulations = [r if isinstance(r, RpcError) else None for r in results[3:split]]
+    estimates = [e if isinstance(e, RpcError) else int(e, 16) for e in results[split:]]
+    return int(results[0], 16), int(results[1], 16), results[2], simulations, estimates
+
+
+def unmined_approve(journal, sender, mined):
+    """
+    The journal entry of an approve from `sender` that is not mined yet
+    (nonce at or above `mined`, the sender's mined nonce count), or None.
+    """
+    if journal is None:
+        return None
+    for entry in journal.pending(sender):
+        if (entry["nonce"] >= mined and entry["to"].lower() == USDC.lower()
+                and entry["data"].startswith("0x" + SELECTORS["approve"])):
+            return entry
+    return None
+
+
+def check_simulations(simulations, log=print, approving=None):
+    """
+    Raise PreflightRevert for the first call whose simulation reverted.
+
+    Later calls in a pipeline run before the earlier ones (e.g. the
+    approve) have landed, so their allowance-dependent reverts are
+    expected and ignored. So are the first call's while `approving` (the
+    journal entry of an approve sent earlier, see unmined_approve) is
+    still unmined, with a warning. Non-revert RPC errors only warn.
+    """
+    for i, error in enumerate(simulations):
+        if error is None:
+            continue
+        revert = revert_from_rpc_error(error)
+        if revert is None:
+            log(f"Warning: pre-flight call failed ({error}), sending anyway")
+        elif i > 0 and revert.allowance:
+            continue
+        elif approving is not None and revert.allowance:
+            log(f"Warning: pre-flight reverted with {revert}, but approve {approving['hash']} "
+                f"(nonce {approving['nonce']}) is not mined yet; sending anyway")
+        else:
+            raise PreflightRevert(i, revert)
+
+
+def build_tx(to, data, gas, estimated, nonce, fees, log=print):
+    """
+    Unsigned transaction for one call; `gas` is the model's prediction,
+    or None and `estimated` is the eth_estimateGas result or RpcError.
+    """
+    # Predicted or estimated gas with 30% buffer to avoid out-of-gas
+    if gas is not None:
+        gas_limit = int(gas * GAS_BUFFER)
+        log(f"Gas model: {gas}, using: {gas_limit}")
+    elif isinstance(estimated, RpcError):
+        gas_limit = DEFAULT_GAS_LIMIT
+        log(f"Gas estimation failed ({estimated}), using default: {gas_limit}")
+    else:
+        gas_limit = int(estimated * GAS_BUFFER)
+        log(f"Estimated gas: {estimated}, using: {gas_limit}")
+    return {
+        "to": to,
+        "data": data,
+        "gas": gas_limit,
+        "nonce": nonce,
+        "chainId": CHAIN_ID,
+        **fees,
+    }
+
+
+def send_transactions(client, signer, calls, urgency="normal", intents=None, log=print):
+    """
+    Sign and broadcast type-2 transactions back-to-back with consecutive
+    nonces from the local nonce manager.
+
+    `calls` is a list of (to, data) and `signer` a signer.LocalSigner or,
+    when the agent runs, a signer.AgentSigner. The pre-send reads go out
+    as one batch on a worker thread while the signer loads (eth_account
+    is slow to import), so signing starts as soon as they return. Fees
+    come from the cached fee history at the given urgency level (legacy
+    gasPrice if no history is available). Gas limits come from the local
+    gas model; only calls it can't predict yet are estimated. If a
+    broadcast fails, its nonce and every later one are released; if
+    signing fails (e.g. the agent refuses under the wallet policy), all
+    of them are. Per-stage timings are printed at the end.
+
+    Each broadcast is recorded in the transaction journal with its
+    intent (`intents`, one label per call). Returns the journal entries
+    of the transactions sent. Progress goes through `log` (fleet.py
+    prefixes it with the wallet's name).
+
+    Every call is simulated in the same batch first; if one would revert,
+    PreflightRevert is raised before any nonce is used. A revert for lack
+    of allowance only warns while an approve sent earlier is unmined.
+    """
+    timings = {}
+    started = time.perf_counter()
+    sender = signer.address
+    calls = [
+        (to_checksum_address(to), data if data.startswith("0x") else "0x" + data)
+        for to, data in calls
+    ]
+
+    history = FeeHistory()
+    model = GasModel()
+    predicted = [model.predict(data) for _, data in calls]
+    cold = [call for call, gas in zip(calls, predicted) if gas is None]
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        prefetch = pool.submit(prefetch_tx_params, client, sender, calls, history.request(), cold)
+        signer.load()
+        timings["load signer"] = time.perf_counter() - started
+        journal = open_journal()
+        pending, mined, fee_history, simulations, estimates = prefetch.result()
+    # Signer load and prefetch overlap, so both are measured from the start
+    timings["prefetch"] = time.perf_counter() - started
+
+    # Merge the fee history even if we stop here, so the retry is incremental
+    fees = tx_fees(history, urgency, fee_history)
+    check_simulations(simulations, log, unmined_approve(journal, sender, mined))
+    if fees is None:
+        log(f"Fee history unavailable ({fee_history}), using legacy gas price")
+        fees = {"gasPrice": client.eth.gas_price}
+    else:
+        log(f"Fees ({urgency}): max {fees['maxFeePerGas'] / 10**9:.6f} gwei, "
+              f"tip {fees['maxPriorityFeePerGas'] / 10**9:.6f} gwei")
+
+    manager = open_nonces()
+    if manager is not None:
+        nonces = manager.allocate(CHAIN_ID, sender, pending, len(calls))
+    else:
+        nonces = list(range(pending, pending + len(calls)))
+
+    # Sign everything first so broadcasts go out back-to-back
+    mark = time.perf_counter()
+    txs, signed = [], []
+    estimates = iter(estimates)
+    estimated = [next(estimates) if gas is None else None for gas in predicted]
+    try:
+        for (to, data), gas, estimate, nonce in zip(calls, predicted, estimated, nonces):
+            txs.append(build_tx(to, data, gas, estimate, nonce, fees, log))
+            signed.append(signer.sign_transaction(txs[-1]))
+    except Exception:
+        if manager is not None:
+            manager.release(CHAIN_ID, sender, nonces)
+        raise
+    timings["sign"] = time.perf_counter() - mark
+
+    mark = time.perf_counter()
+    entries = []
+    for i, tx in enumerate(signed):
+        try:
+            tx_hash = client.eth.send_raw_transaction(tx.raw_transaction)
+        except Exception:
+            if manager is not None:
+                manager.release(CHAIN_ID, sender, nonces[i:])
+            raise
+        entry = {
+            **{k: v for k, v in txs[i].items() if k != "type"},
+            "hash": tx_hash,
+            "from": sender,
+            "urgency": urgency,
+            "intent": intents[i] if intents else f"tx to {txs[i]['to']}",
+            "sentAt": time.time(),
+        }
+        if isinstance(estimated[i], int):
+            # The gas model learns max(gasUsed, estimate) from the receipt
+            entry["gasEstimate"] = estimated[i]
+        if journal is not None:
+            journal.record(entry)
+        entries.append(entry)
+        log("Transaction sent!")
+        log(f"Nonce: {nonces[i]}")
+        log(f"Hash: {tx_hash}")
+        log(f"View: https://basescan.org/tx/{tx_hash}")
+    timings["send"] = time.perf_counter() - mark
+    timings["total"] = time.perf_counter() - started
+    # prefetch and send are RPC, which the profile already counts per call
+    for stage in ("load signer", "sign"):
+        tracing.record("phase", stage, timings[stage])
+
+    log("Timings: " + ", ".join(f"{stage} {seconds * 1000:.0f}ms" for stage, seconds in timings.items()))
+    return entries
+
+
+def send_tx(client, signer, to, data, urgency="normal", intent=None):
+    """Sign and broadcast one transaction; returns its journal entry."""
+    return send_transactions(client, signer, [(to, data)], urgency, [intent] if intent else None)[0]
+
+
+def report_revert(e):
+    """Print a pre-flight failure the way the error table describes it and exit."""
+    print(f"Error: Transaction would revert: {e.revert}")
+    if e.revert.hint:
+        print(e.revert.hint)
+    print("Nothing was sent.")
+    sys.exit(1)
+
+
+def wait_for_receipts(client, groups, signer=None, timeout=RECEIPT_TIMEOUT, bump_after=BUMP_AFTER):
+    """
+    Track receipts for journal entries with the async tracker.
+
+    `groups` is a list of attempt lists (one per nonce, see tracker.track),
+    or a plain list of entries. With a `signer` (or a dict of signers by
+    address, for entries from several wallets), transactions stuck for
+    `bump_after` seconds are replaced with higher fees. Receipt gasUsed
+    (or the send's gas estimate, if larger) feeds the gas model and a
+    revert sends that function back to estimate_gas. Returns tracker.track's [(entry, receipt)].
+    """
+    groups = [g if isinstance(g, list) else [g] for g in groups]
+    journal = open_journal()
+    if isinstance(signer, dict):
+        replacers = {address.lower(): Replacer(client, s) for address, s in signer.items()}
+        replace = lambda entry: replacers[entry["from"].lower()](entry)
+    else:
+        replace = Replacer(client, signer) if signer else None
+    count = len(groups)
+    print(f"Waiting for {count} receipt{'s' if count != 1 else ''}...")
+    results = asyncio.run(track(client, groups, journal, replace, bump_after=bump_after, timeout=timeout))
+
+    model = GasModel()
+    for entry, receipt in results:
+        if receipt is None:
+            continue
+        if receipt.get("status") == "0x1":
+            model.observe(entry["data"], max(int(receipt["gasUsed"], 16), entry.get("gasEstimate", 0)))
+        else:
+            model.invalidate(entry["data"])
+    return results
+
+
+def print_build(to, calldata, description):
+    """build-tx.sh's calldata block and submit.html JSON."""
+    print(f"To: {to}")
+    print(f"Chain: Base ({CHAIN_ID})")
+    print(f"Calldata: {calldata}")
+    print()
+    print(RULE)
+    print()
+    print("Copy this JSON to submit.html:")
+    print()
+    print("{")
+    print(f'  "to": "{to}",')
+    print(f'  "data": "{calldata}",')
+    print(f'  "chainId": "{CHAIN_ID}",')
+    print(f'  "description": "{description}"')
+    print("}")
+
+
+def cmd_approve(client, settings, args, build, yes, wait=False, urgency=None, bump_after=BUMP_AFTER):
+    amount = args[0] if args else ("10" if build else "30")
+    calldata = "0x" + encode_approve(AUCTION, usdc_to_wei(amount))
+
+    print(RULE)
+    print("  APPROVE USDC")
+    print(RULE)
+    print()
+    if build:
+        print(f"Action: Approve {amount} USDC for QR Coin auction")
+        print()
+        print_build(USDC, calldata, f"Approve {amount} USDC for QR Coin auction")
+        return
+    print(f"Amount: {amount} USDC")
+    print(f"From:   {settings['address']}")
+    print()
+    if confirm(yes):
+        signer = load_signer()
+        try:
+            entry = send_tx(client, signer, USDC, calldata, urgency or "normal", f"Approve {amount} USDC")
+        except PreflightRevert as e:
+            report_revert(e)
+        if wait:
+            wait_for_receipts(client, [entry], signer, bump_after=bump_after)
+
+
+def cmd_bid(client, settings, action, args, build, yes, approve=None, wait=False, urgency=None,
+            bump_after=BUMP_AFTER):
+    """
+    createBid / contributeToBid. With `approve` (USDC amount), the approve
+    and the bid are signed with consecutive nonces, broadcast back-to-back
+    and both receipts tracked together. Without an explicit `urgency`, bids
+    in the auction's last minutes use the "snipe" fee level.
+
+    A createBid whose pre-flight hits URL_ALREADY_HAS_BID is switched to
+    contributeToBid with the same URL and name.
+    """
+    create = action == "createBid"
+    if not args:
+        script = "build-tx.sh" if build else "submit-tx.sh"
+        print(f"Usage: {script} {'createBid' if create else 'contributeToBid'} <url> [name]")
+        sys.exit(1)
+    url = args[0]
+    name = args[1] if len(args) > 1 else settings["xHandle"]
+
+    token_id, end_time = get_auction(client, required=not build)
+    encoder = encode_create_bid if create else encode_contribute_to_bid
+    calldata = "0x" + encoder(token_id, url, name)
+
+    print(RULE)
+    print("  CREATE BID" if create else "  CONTRIBUTE TO BID")
+    print(RULE)
+    print()
+    if build:
+        print(f"Token ID: {token_id}")
+        print(f"URL: {url}")
+        print(f"Name: {name}")
+        print()
+        verb = "Create bid" if create else "Contribute to bid"
+        print_build(AUCTION, calldata, f"{verb} for {url} as {name}")
+        return
+    print(f"Token ID: {token_id}")
+    print(f"URL:      {url}")
+    print(f"Name:     {name}")
+    print(f"From:     {settings['address']}")
+    urgency = urgency or urgency_for(end_time)
+    print(f"Urgency:  {urgency}")
+    if approve is not None:
+        print(f"Approve:  {approve} USDC (same pipeline)")
+    print()
+    if not confirm(yes):
+        return
+    label = "Create bid" if create else "Contribute to bid"
+    signer = load_signer()
+    calls = [(AUCTION, calldata)]
+    intents = [f"{label} {url}"]
+    if approve is not None:
+        calls.insert(0, (USDC, "0x" + encode_approve(AUCTION, usdc_to_wei(approve))))
+        intents.insert(0, f"Approve {approve} USDC")
+
+    try:
+        entries = send_transactions(client, signer, calls, urgency, intents)
+    except PreflightRevert as e:
+        if not (create and e.revert.name == "URL_ALREADY_HAS_BID"):
+            report_revert(e)
+        print("URL already has a bid; switching to contributeToBid")
+        calls[-1] = (AUCTION, "0x" + encode_contribute_to_bid(token_id, url, name))
+        intents[-1] = f"Contribute to bid {url}"
+        try:
+            entries = send_transactions(client, signer, calls, urgency, intents)
+        except PreflightRevert as e:
+            report_revert(e)
+
+    if wait or approve is not None:
+        wait_for_receipts(client, entries, signer, bump_after=bump_after)
+
+
+def cmd_prepare(client, settings, args, max_fee_gwei=None, urgency=None):
+    from presign import PREPARED_FILE, prepare
+
+    if not args:
+        print("Usage: submit-tx.sh prepare <url> [name] [--max-fee-gwei N] [--urgency LEVEL]")
+        sys.exit(1)
+    url = args[0]
+    name = args[1] if len(args) > 1 else settings["xHandle"]
+    max_fee = int(Decimal(max_fee_gwei) * 10**9) if max_fee_gwei else None
+
+    record = prepare(client, load_signer(), url, name, max_fee, urgency or "snipe")
+    print(RULE)
+    print("  PREPARED NEXT-AUCTION BID")
+    print(RULE)
+    print()
+    print(f"Token ID:  {record['tokenId']}")
+    print(f"URL:       {record['url']}")
+    print(f"Name:      {record['name']}")
+    print(f"From:      {record['from']}")
+    print(f"Nonce:     {record['nonce']}")
+    print(f"Gas:       {record['gas']}")
+    print(f"Fees:      max {record['maxFeePerGas'] / 10**9:.6f} gwei, "
+          f"tip {record['maxPriorityFeePerGas'] / 10**9:.6f} gwei ({record['urgency']})")
+    print(f"Hash:      {record['hash']}")
+    print()
+    print(f"Saved to {PREPARED_FILE}")
+    print("Run `submit-tx.sh arm` to broadcast it when the auction starts.")
+
+
+def cmd_arm(client, timeout=None, bump_after=BUMP_AFTER):
+    from presign import arm, load_prepared
+
+    record = load_prepared()
+    if record is None or record.get("sentHash"):
+        print("Error: No prepared bid. Run `submit-tx.sh prepare <url>` first.")
+        sys.exit(1)
+    signer = load_signer()
+    try:
+        entry = arm(client, signer, record, timeout=timeout)
+    except KeyboardInterrupt:
+        print("Disarmed.")
+        return
+    if entry is None:
+        print(f"No new auction within {timeout}s; prepared bid kept.")
+        sys.exit(1)
+    print("Transaction sent!")
+    print(f"Token ID: {record['tokenId']}")
+    print(f"Hash: {entry['hash']}")
+    print(f"View: https://basescan.org/tx/{entry['hash']}")
+    wait_for_receipts(client, [entry], signer, bump_after=bump_after)
+
+
+def cmd_track(client, timeout=None, bump_after=BUMP_AFTER):
+    """Resolve every journaled transaction of this wallet that has no receipt yet."""
+    journal = open_journal()
+    if journal is None:
+        sys.exit(1)
+    signer = load_signer()
+    pending = journal.pending(signer.address)
+    if not pending:
+        print("No pending transactions.")
+        return
+    groups = [journal.attempts(entry) for entry in pending]
+    results = wait_for_receipts(client, groups, signer, timeout or RECEIPT_TIMEOUT, bump_after)
+    if any(receipt is None for _, receipt in results):
+        sys.exit(1)
+
+
+def cmd_status(client, settings):
+    print(RULE)
+    print("  AUCTION STATUS")
+    print(RULE)
+    print()
+    print(f"RPC: {settings['rpcUrl']}")
+    print(f"X Handle: {settings['xHandle']}")
+    print()
+
+    # auction() and both reserve prices in one Multicall3 round trip
+    try:
+        results = aggregate3(client, [
+            (AUCTION, encode_call("auction()")),
+            (AUCTION, encode_call("createBidReservePrice()")),
+            (AUCTION, encode_call("contributeBidReservePrice()")),
+        ])
+    except Exception:
+        results = [(False, b"")] * 3
+
+    (auction_ok, auction_data), (create_ok, create_data), (contrib_ok, contrib_data) = results
+    auction = decode_auction(auction_data) if auction_ok else None
+    print(f"Current Token ID: {auction[0] if auction else 0}")
+
+    if auction:
+        end_time = auction[3]
+        now = int(time.time())
+        if now < end_time:
+            remaining = end_time - now
+            print(f"Status: 🟢 ACTIVE ({remaining // 3600} h {(remaining % 3600) // 60} m remaining)")
+            print(f"End: {time.strftime('%a %b %d %H:%M:%S %Z %Y', time.localtime(end_time))}")
+        else:
+            print("Status: 🔴 ENDED")
+
+    if create_ok:
+        print()
+        print(f"Create Bid Reserve: {decode_uint(create_data) / 1_000_000:.2f} USDC")
+    if contrib_ok:
+        print(f"Contribute Reserve: {decode_uint(contrib_data) / 1_000_000:.2f} USDC")
+
+
+def print_help(build):
+    if build:
+        print("QR Coin Transaction Builder")
+        print()
+        print("Usage: build-tx.sh <action> [args...]")
+        print()
+        print("Actions:")
+        print("  approve <amount_usdc>           Approve USDC spending")
+        print("  createBid <url> [name]          Create new bid")
+        print("  contributeToBid <url> [name]    Contribute to existing bid")
+        print("  status                          Check auction status")
+        print()
+        print("The output JSON can be pasted into submit.html to send via MetaMask.")
+        print()
+        print("Examples:")
+        print("  build-tx.sh approve 50")
+        print("  build-tx.sh createBid https://example.com MerkleMoltBot")
+        print("  build-tx.sh contribute https://grokipedia.com/page/debtreliefbot")
+        print()
+        print(f"Config: {CONFIG_FILE}")
+        return
+    print("QR Coin Transaction Submitter")
+    print()
+    print("Usage: submit-tx.sh <action> [args...]")
+    print()
+    print("Actions:")
+    print("  approve <amount_usdc>           Approve USDC spending")
+    print("  createBid <url> [name]          Create new bid")
+    print("  contributeToBid <url> [name]    Contribute to existing bid")
+    print("  status                          Check auction status")
+    print("  prepare <url> [name]            Pre-sign createBid for the next auction")
+    print("  arm                             Broadcast the prepared bid when the auction starts")
+    print("  track                           Wait for pending transactions (fee-bumps stuck ones)")
+    print()
+    print("Options:")
+    print("  --yes, -y                       Skip confirmation prompt")
+    print("  --build                         Print calldata JSON instead of signing")
+    print("  --approve <amount_usdc>         With createBid/contribute: approve + bid in one")
+    print("                                  pipeline (consecutive nonces, both receipts tracked)")
+    print("  --wait                          Wait for the receipt after sending")
+    print("  --bump-after <seconds>          Replace a transaction with higher fees if it isn't")
+    print(f"                                  mined after this long (default {BUMP_AFTER})")
+    print("  --urgency <level>               Fee level: low, normal, high or snipe (default:")
+    print("                                  normal; snipe for bids in the last 5 minutes)")
+    print("  --max-fee-gwei <n>              With prepare: maxFeePerGas cap (default: snipe level)")
+    print("  --timeout <seconds>             With arm/track: give up after this long")
+    print("  --profile                       Print an import / RPC / sign time breakdown (stderr)")
+    print()
+    print("Examples:")
+    print("  submit-tx.sh approve 50")
+    print("  submit-tx.sh createBid https://example.com")
+    print("  submit-tx.sh contribute https://grokipedia.com/page/debtreliefbot --yes")
+
+
+def main():
+    yes = False
+    build = False
+    wait = False
+    approve = None
+    max_fee_gwei = None
+    timeout = None
+    urgency = None
+    bump_after = BUMP_AFTER
+    args = []
+    argv = iter(sys.argv[1:])
+    for arg in argv:
+        if arg in ("--yes", "-y"):
+            yes = True
+        elif arg == "--build":
+            build = True
+        elif arg == "--wait":
+            wait = True
+        elif arg == "--profile":
+            pass  # Read by tracing.configure()
+        elif arg == "--approve":
+            approve = next(argv, None)
+            if approve is None:
+                print("Error: --approve needs an amount in USDC", file=sys.stderr)
+                sys.exit(1)
+            usdc_to_wei(approve)  # validate before any network calls
+        elif arg == "--urgency":
+            urgency = next(argv, None)
+            if urgency not in URGENCY:
+                print(f"Error: --urgency must be one of {', '.join(URGENCY)}", file=sys.stderr)
+                sys.exit(1)
+        elif arg in ("--max-fee-gwei", "--timeout", "--bump-after"):
+            value = next(argv, None)
+            try:
+                number = float(value)
+            except (TypeError, ValueError):
+                print(f"Error: {arg} needs a number", file=sys.stderr)
+                sys.exit(1)
+            if arg == "--timeout":
+                timeout = number
+            elif arg == "--bump-after":
+                bump_after = number
+            else:
+                max_fee_gwei = value
+        else:
+            args.append(arg)
+
+    action = args[0] if args else "help"
+    args = args[1:]
+    if action == "contribute":
+        action = "contributeToBid"
+    if action not in ("approve", "createBid", "contributeToBid", "status", "prepare", "arm", "track"):
+        print_help(build)
+        return
+
+    signing = not build and action != "status"
+    settings = load_settings(signing)
+    client = open_client(settings)
+
+    try:
+        if action == "approve":
+            cmd_approve(client, settings, args, build, yes, wait, urgency, bump_after)
+        elif action == "status":
+            cmd_status(client, settings)
+        elif action == "prepare":
+            cmd_prepare(client, settings, args, max_fee_gwei, urgency)
+        elif action == "arm":
+            cmd_arm(client, timeout, bump_after)
+        elif action == "track":
+            cmd_track(client, timeout, bump_after)
+        else:
+            cmd_bid(client, settings, action, args, build, yes, approve, wait, urgency, bump_after)
+    except SignerError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,150 +5,65 @@ Usage:
     ./query-bids.py              # Full output with all bids
     ./query-bids.py --summary    # Just auction info and top 10
     ./query-bids.py --json       # JSON output for programmatic use
+    ./query-bids.py --ndjson     # Streaming JSON lines (add --contributions for per-contribution lines)
     ./query-bids.py --url URL    # Get specific bid by URL
+    ./query-bids.py --serial     # One RPC call per view (skip Multicall3)
+    ./query-bids.py --no-cache   # Bypass the block-keyed view-call cache
+    ./query-bids.py --watch      # Stream bid changes as NDJSON (runs until Ctrl-C)
+    ./query-bids.py --contributors  # Per-contributor totals across all bids
+    ./query-bids.py --rpc URL    # Use another JSON-RPC endpoint (e.g. benchmarks/mockchain.py)
+    ./query-bids.py --profile    # Also print an import / RPC / decode / render breakdown (stderr)
 """
 
+if __name__ == "__main__":
+    # Served by the resident daemon when it is running (see daemon.py)
+    from daemon import forward
+    forward("query-bids.py")
+
+import tracing  # First, so the profile's import phase covers the rest
+
 import argparse
 import json
+import os
 import sys
 from datetime import datetime, timezone
+from pathlib import Path
 
-try:
-    from web3 import Web3
-except ImportError:
-    print("Error: web3 not installed. Run: pip install web3", file=sys.stderr)
-    sys.exit(1)
+from bidbook import BidBook, as_book
+from fastabi import decode_auction, decode_bid, decode_bids, decode_uint
+from multicall import aggregate3, encode_call
+from records import ContributionColumns
+from readcache import BlockReader, open_cache
+from rpcpool import connect
+
+if __name__ == "__main__":
+    tracing.mark("import")
 
 # Contract addresses (Base Mainnet)
 CONTRACT_ADDR = "0x7309779122069EFa06ef71a45AE0DB55A259A176"
 RPC_URL = "https://mainnet.base.org"
+CONFIG_FILE = Path.home() / ".clawdbot" / "skills" / "qrcoin" / "config.json"
 
-# Minimal ABI for read operations
-ABI = [
-    {
-        "inputs": [],
-        "name": "auction",
-        "outputs": [
-            {"internalType": "uint256", "name": "tokenId", "type": "uint256"},
-            {
-                "components": [
-                    {"internalType": "uint256", "name": "totalAmount", "type": "uint256"},
-                    {"internalType": "string", "name": "urlString", "type": "string"},
-                    {
-                        "components": [
-                            {"internalType": "address", "name": "contributor", "type": "address"},
-                            {"internalType": "uint256", "name": "amount", "type": "uint256"},
-                            {"internalType": "uint256", "name": "timestamp", "type": "uint256"}
-                        ],
-                        "internalType": "struct AuctionTypesV5.BidContribution[]",
-                        "name": "contributions",
-                        "type": "tuple[]"
-                    }
-                ],
-                "internalType": "struct AuctionTypesV5.Bid",
-                "name": "highestBid",
-                "type": "tuple"
-            },
-            {"internalType": "uint256", "name": "startTime", "type": "uint256"},
-            {"internalType": "uint256", "name": "endTime", "type": "uint256"},
-            {"internalType": "bool", "name": "settled", "type": "bool"},
-            {
-                "components": [
-                    {"internalType": "uint256", "name": "validUntil", "type": "uint256"},
-                    {"internalType": "string", "name": "urlString", "type": "string"}
-                ],
-                "internalType": "struct AuctionTypesV5.QRData",
-                "name": "qrMetadata",
-                "type": "tuple"
-            }
-        ],
-        "stateMutability": "view",
-        "type": "function"
-    },
-    {
-        "inputs": [],
-        "name": "getAllBids",
-        "outputs": [
-            {
-                "components": [
-                    {"internalType": "uint256", "name": "totalAmount", "type": "uint256"},
-                    {"internalType": "string", "name": "urlString", "type": "string"},
-                    {
-                        "components": [
-                            {"internalType": "address", "name": "contributor", "type": "address"},
-                            {"internalType": "uint256", "name": "amount", "type": "uint256"},
-                            {"internalType": "uint256", "name": "timestamp", "type": "uint256"}
-                        ],
-                        "internalType": "struct AuctionTypesV5.BidContribution[]",
-                        "name": "contributions",
-                        "type": "tuple[]"
-                    }
-                ],
-                "internalType": "struct AuctionTypesV5.Bid[]",
-                "name": "",
-                "type": "tuple[]"
-            }
-        ],
-        "stateMutability": "view",
-        "type": "function"
-    },
-    {
-        "inputs": [{"internalType": "string", "name": "_urlString", "type": "string"}],
-        "name": "getBid",
-        "outputs": [
-            {
-                "components": [
-                    {"internalType": "uint256", "name": "totalAmount", "type": "uint256"},
-                    {"internalType": "string", "name": "urlString", "type": "string"},
-                    {
-                        "components": [
-                            {"internalType": "address", "name": "contributor", "type": "address"},
-                            {"internalType": "uint256", "name": "amount", "type": "uint256"},
-                            {"internalType": "uint256", "name": "timestamp", "type": "uint256"}
-                        ],
-                        "internalType": "struct AuctionTypesV5.BidContribution[]",
-                        "name": "contributions",
-                        "type": "tuple[]"
-                    }
-                ],
-                "internalType": "struct AuctionTypesV5.Bid",
-                "name": "",
-                "type": "tuple"
-            }
-        ],
-        "stateMutability": "view",
-        "type": "function"
-    },
-    {
-        "inputs": [],
-        "name": "getBidCount",
-        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
-        "stateMutability": "view",
-        "type": "function"
-    },
-    {
-        "inputs": [],
-        "name": "createBidReservePrice",
-        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
-        "stateMutability": "view",
-        "type": "function"
-    },
-    {
-        "inputs": [],
-        "name": "contributeBidReservePrice",
-        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
-        "stateMutability": "view",
-        "type": "function"
-    }
-]
+DRB_URL = "https://grokipedia.com/page/debtreliefbot"
 
 
-def get_contract():
-    w3 = Web3(Web3.HTTPProvider(RPC_URL))
-    if not w3.is_connected():
-        print("Error: Cannot connect to Base RPC", file=sys.stderr)
-        sys.exit(1)
-    return w3.eth.contract(address=Web3.to_checksum_address(CONTRACT_ADDR), abi=ABI)
+def get_client(rpc_url=None):
+    if rpc_url:
+        client = connect(rpc_url)
+    else:
+        # Extra endpoints from the config's rpcPool are pooled with RPC_URL (see rpcpool.py)
+        config = {}
+        if CONFIG_FILE.exists():
+            with open(CONFIG_FILE) as f:
+                config = json.load(f)
+        client = connect([RPC_URL] + list(config.get("rpcPool") or []), bool(config.get("rpcHedge")))
+    # No is_connected() probe: the first read reports an unreachable RPC (see main)
+    return client
+
+
+def _call(reader, signature, arg_types=(), args=()):
+    """eth_call one auction view function at the reader's block (through its cache); returns the raw return data."""
+    return reader.call(CONTRACT_ADDR, encode_call(signature, arg_types, args))
 
 
 def format_time_remaining(end_time):
@@ -172,22 +87,11 @@ def format_time_remaining(end_time):
         return f"{minutes}m"
 
 
-def get_auction_info(contract):
-    """Get current auction state."""
-    auction = contract.functions.auction().call()
-    create_reserve = contract.functions.createBidReservePrice().call()
-    contribute_reserve = contract.functions.contributeBidReservePrice().call()
-    
+def _auction_dict(auction, create_reserve, contribute_reserve):
+    """Convert the auction() tuple (highestBid as a Bid) plus reserve prices to a dict."""
     return {
         "tokenId": auction[0],
-        "highestBid": {
-            "totalAmount": auction[1][0],
-            "urlString": auction[1][1],
-            "contributions": [
-                {"contributor": c[0], "amount": c[1], "timestamp": c[2]}
-                for c in auction[1][2]
-            ]
-        },
+        "highestBid": auction[1],
         "startTime": auction[2],
         "endTime": auction[3],
         "settled": auction[4],
@@ -200,42 +104,87 @@ def get_auction_info(contract):
     }
 
 
-def get_all_bids(contract):
+def get_auction_info(reader):
+    """Get current auction state."""
+    auction = decode_auction(_call(reader, "auction()"))
+    create_reserve = decode_uint(_call(reader, "createBidReservePrice()"))
+    contribute_reserve = decode_uint(_call(reader, "contributeBidReservePrice()"))
+    
+    return _auction_dict(auction, create_reserve, contribute_reserve)
+
+
+def get_all_bids(reader):
     """Get all current bids."""
-    bids = contract.functions.getAllBids().call()
-    return [
-        {
-            "totalAmount": bid[0],
-            "urlString": bid[1],
-            "contributions": [
-                {"contributor": c[0], "amount": c[1], "timestamp": c[2]}
-                for c in bid[2]
-            ]
-        }
-        for bid in bids
-    ]
+    return decode_bids(_call(reader, "getAllBids()"))
 
 
-def get_bid_by_url(contract, url):
+def get_bid_by_url(reader, url):
     """Get a specific bid by URL."""
     try:
-        bid = contract.functions.getBid(url).call()
-        if bid[0] == 0:  # No bid found
+        bid = decode_bid(_call(reader, "getBid(string)", ["string"], [url]))
+        if bid.totalAmount == 0:  # No bid found
             return None
-        return {
-            "totalAmount": bid[0],
-            "urlString": bid[1],
-            "contributions": [
-                {"contributor": c[0], "amount": c[1], "timestamp": c[2]}
-                for c in bid[2]
-            ]
-        }
+        return bid
     except Exception:
         return None
 
 
+def get_snapshot(client, include_bids=True, include_count=False, urls=(), reader=None):
+    """
+    Read auction state, reserve prices and (optionally) all bids, the bid
+    count and specific bids by URL in a single Multicall3 round trip.
+
+    Returns a dict with "auction" (same shape as get_auction_info), "bids"
+    (same as get_all_bids, or None), "bidCount" (int or None) and
+    "urlBids" mapping each requested URL to a Bid or None.
+
+    Pass a readcache.BlockReader to pin the batch to its block and serve
+    it from the view-call cache.
+    """
+    addr = CONTRACT_ADDR
+    calls = [
+        (addr, encode_call("auction()"), False),
+        (addr, encode_call("createBidReservePrice()"), False),
+        (addr, encode_call("contributeBidReservePrice()"), False),
+    ]
+    if include_bids:
+        calls.append((addr, encode_call("getAllBids()"), False))
+    if include_count:
+        calls.append((addr, encode_call("getBidCount()"), False))
+    for url in urls:
+        calls.append((addr, encode_call("getBid(string)", ["string"], [url]), True))
+
+    results = iter(aggregate3(client, calls, reader=reader))
+
+    with tracing.phase("decode"):
+        auction = decode_auction(next(results)[1])
+        create_reserve = decode_uint(next(results)[1])
+        contribute_reserve = decode_uint(next(results)[1])
+
+        snapshot = {
+            "auction": _auction_dict(auction, create_reserve, contribute_reserve),
+            "bids": None,
+            "bidCount": None,
+            "urlBids": {},
+        }
+        if include_bids:
+            snapshot["bids"] = decode_bids(next(results)[1])
+        if include_count:
+            snapshot["bidCount"] = decode_uint(next(results)[1])
+        for url in urls:
+            success, data = next(results)
+            bid = None
+            if success:
+                raw = decode_bid(data)
+                if raw.totalAmount != 0:  # No bid found
+                    bid = raw
+            snapshot["urlBids"][url] = bid
+    return snapshot
+
+
 def print_summary(auction_info, bids):
     """Print auction summary."""
+    book = as_book(bids)
     token_id = auction_info["tokenId"]
     end_time = auction_info["endTime"]
     settled = auction_info["settled"]
@@ -252,23 +201,20 @@ def print_summary(auction_info, bids):
         print(f"Time Remaining: {time_remaining}")
         end_dt = datetime.fromtimestamp(end_time, timezone.utc)
         print(f"Ends: {end_dt.strftime('%Y-%m-%d %H:%M UTC')}")
-    print(f"Total Bids: {len(bids)}")
+    print(f"Total Bids: {len(book)}")
     print(f"Create Reserve: ${auction_info['createReserve'] / 1_000_000:.2f} USDC")
     print(f"Contribute Reserve: ${auction_info['contributeReserve'] / 1_000_000:.2f} USDC")
     print()
     
-    # Sort bids by amount
-    sorted_bids = sorted(bids, key=lambda x: x["totalAmount"], reverse=True)
-    
     # Top 10
     print("─" * 55)
     print("  TOP 10 BIDS")
     print("─" * 55)
     
-    for rank, bid in enumerate(sorted_bids[:10], 1):
-        amount = bid["totalAmount"] / 1_000_000
-        url = bid["urlString"]
-        contributors = len(bid["contributions"])
+    for rank, bid in enumerate(book.top(10), 1):
+        amount = bid.totalAmount / 1_000_000
+        url = bid.urlString
+        contributors = len(bid.contributions)
         
         # Truncate URL for display
         display_url = url if len(url) <= 45 else url[:42] + "..."
@@ -279,125 +225,268 @@ def print_summary(auction_info, bids):
     print()
     
     # Check for DRB bid
-    drb_url = "https://grokipedia.com/page/debtreliefbot"
-    drb_bid = next((b for b in bids if b["urlString"] == drb_url), None)
+    drb_bid = book.get(DRB_URL)
     
     if drb_bid:
-        drb_rank = next(i for i, b in enumerate(sorted_bids, 1) if b["urlString"] == drb_url)
-        drb_amount = drb_bid["totalAmount"] / 1_000_000
-        leader_amount = sorted_bids[0]["totalAmount"] / 1_000_000
-        gap = leader_amount - drb_amount
+        drb_rank = book.rank(DRB_URL)
+        drb_amount = drb_bid.totalAmount / 1_000_000
+        gap = book.gap_to_leader(DRB_URL) / 1_000_000
         
         print("─" * 55)
         print("  🌿 $DRB BID STATUS")
         print("─" * 55)
-        print(f"Rank: #{drb_rank} of {len(bids)}")
+        print(f"Rank: #{drb_rank} of {len(book)}")
         print(f"Amount: ${drb_amount:.2f} USDC")
         print(f"Gap to Leader: ${gap:.2f} USDC")
-        print(f"Contributors: {len(drb_bid['contributions'])}")
+        print(f"Contributors: {len(drb_bid.contributions)}")
         print()
 
 
 def print_full(auction_info, bids):
     """Print full bid details."""
-    print_summary(auction_info, bids)
-    
-    sorted_bids = sorted(bids, key=lambda x: x["totalAmount"], reverse=True)
+    book = as_book(bids)
+    print_summary(auction_info, book)
     
     print("─" * 55)
     print("  ALL BIDS")
     print("─" * 55)
     
-    for rank, bid in enumerate(sorted_bids, 1):
-        amount = bid["totalAmount"] / 1_000_000
-        url = bid["urlString"]
+    for rank, bid in book.ranked():
+        amount = bid.totalAmount / 1_000_000
+        url = bid.urlString
         
         print(f"\n#{rank} | ${amount:.2f} USDC")
         print(f"   URL: {url}")
-        print(f"   Contributors: {len(bid['contributions'])}")
-        for c in bid["contributions"]:
-            addr = c["contributor"][:8] + "..." + c["contributor"][-4:]
-            c_amount = c["amount"] / 1_000_000
+        print(f"   Contributors: {len(bid.contributions)}")
+        for c in bid.contributions:
+            addr = c.contributor[:8] + "..." + c.contributor[-4:]
+            c_amount = c.amount / 1_000_000
             print(f"      - {addr}: ${c_amount:.2f}")
 
 
+def _auction_json(auction_info):
+    """Auction fields shared by the JSON and NDJSON outputs."""
+    return {
+        "tokenId": auction_info["tokenId"],
+        "endTime": auction_info["endTime"],
+        "settled": auction_info["settled"],
+        "status": "ended" if auction_info["settled"] or format_time_remaining(auction_info["endTime"]) == "ENDED" else "active",
+        "timeRemaining": format_time_remaining(auction_info["endTime"]),
+        "createReserveUsdc": auction_info["createReserve"] / 1_000_000,
+        "contributeReserveUsdc": auction_info["contributeReserve"] / 1_000_000
+    }
+
+
 def print_json(auction_info, bids):
     """Print JSON output."""
+    book = as_book(bids)
     output = {
-        "auction": {
-            "tokenId": auction_info["tokenId"],
-            "endTime": auction_info["endTime"],
-            "settled": auction_info["settled"],
-            "status": "ended" if auction_info["settled"] or format_time_remaining(auction_info["endTime"]) == "ENDED" else "active",
-            "timeRemaining": format_time_remaining(auction_info["endTime"]),
-            "createReserveUsdc": auction_info["createReserve"] / 1_000_000,
-            "contributeReserveUsdc": auction_info["contributeReserve"] / 1_000_000
-        },
-        "bidCount": len(bids),
+        "auction": _auction_json(auction_info),
+        "bidCount": len(book),
         "bids": [
             {
                 "rank": rank,
-                "totalUsdc": bid["totalAmount"] / 1_000_000,
-                "url": bid["urlString"],
-                "contributorCount": len(bid["contributions"]),
+                "totalUsdc": bid.totalAmount / 1_000_000,
+                "url": bid.urlString,
+                "contributorCount": len(bid.contributions),
                 "contributions": [
                     {
-                        "address": c["contributor"],
-                        "amountUsdc": c["amount"] / 1_000_000,
-                        "timestamp": c["timestamp"]
+                        "address": c.contributor,
+                        "amountUsdc": c.amount / 1_000_000,
+                        "timestamp": c.timestamp
                     }
-                    for c in bid["contributions"]
+                    for c in bid.contributions
                 ]
             }
-            for rank, bid in enumerate(sorted(bids, key=lambda x: x["totalAmount"], reverse=True), 1)
+            for rank, bid in book.ranked()
         ]
     }
     print(json.dumps(output, indent=2))
 
 
+def print_ndjson(auction_info, bids, contributions=False, out=None):
+    """
+    Stream NDJSON: one auction header line, then one compact line per bid
+    in rank order (and one per contribution if requested).
+    
+    Lines are written as they are produced, so `| head` or `| jq` can
+    start before the whole book is serialized.
+    """
+    out = out or sys.stdout  # Looked up per call: the daemon redirects sys.stdout
+    book = as_book(bids)
+    dumps = json.JSONEncoder(separators=(",", ":")).encode
+    write = out.write
+    
+    header = {"type": "auction", **_auction_json(auction_info), "bidCount": len(book)}
+    write(dumps(header) + "\n")
+    out.flush()
+    
+    for rank, bid in book.ranked():
+        write(dumps({
+            "type": "bid",
+            "rank": rank,
+            "totalUsdc": bid.totalAmount / 1_000_000,
+            "url": bid.urlString,
+            "contributorCount": len(bid.contributions)
+        }) + "\n")
+        if contributions:
+            for c in bid.contributions:
+                write(dumps({
+                    "type": "contribution",
+                    "rank": rank,
+                    "url": bid.urlString,
+                    "address": c.contributor,
+                    "amountUsdc": c.amount / 1_000_000,
+                    "timestamp": c.timestamp
+                }) + "\n")
+    out.flush()
+
+
+def print_contributors(bids, as_json=False):
+    """Print per-contributor totals and an amount histogram (columnar)."""
+    columns = ContributionColumns(bids)
+    totals = sorted(columns.totals_by_contributor().items(), key=lambda x: x[1], reverse=True)
+    edges = [0, 1_000_000, 5_000_000, 10_000_000, 25_000_000, 100_000_000, 2**63]
+    labels = ["<$1", "$1-5", "$5-10", "$10-25", "$25-100", "$100+"]
+    histogram = columns.amount_histogram(edges)
+    
+    if as_json:
+        print(json.dumps({
+            "contributionCount": len(columns),
+            "contributorCount": len(totals),
+            "contributors": [
+                {"address": addr, "totalUsdc": total / 1_000_000}
+                for addr, total in totals
+            ],
+            "histogram": dict(zip(labels, histogram))
+        }, indent=2))
+        return
+    
+    print("─" * 55)
+    print(f"  TOP CONTRIBUTORS ({len(totals)} addresses, {len(columns)} contributions)")
+    print("─" * 55)
+    for addr, total in totals[:20]:
+        print(f"{addr[:8]}...{addr[-4:]}  ${total / 1_000_000:>10.2f} USDC")
+    print()
+    print("─" * 55)
+    print("  CONTRIBUTION SIZES")
+    print("─" * 55)
+    for label, count in zip(labels, histogram):
+        print(f"{label:>8}: {count}")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Query QR Coin auction bids from contract")
     parser.add_argument("--summary", action="store_true", help="Show summary only (auction info + top 10)")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--ndjson", action="store_true", help="Stream one JSON line per bid (header line first)")
+    parser.add_argument("--contributions", action="store_true", help="With --ndjson, also emit one line per contribution")
     parser.add_argument("--url", type=str, help="Get specific bid by URL")
+    parser.add_argument("--serial", action="store_true", help="One RPC call per view function instead of a Multicall3 batch")
+    parser.add_argument("--no-cache", action="store_true", help="Don't read or write the block-keyed view-call cache")
+    parser.add_argument("--watch", action="store_true", help="Stream bid changes as NDJSON until interrupted")
+    parser.add_argument("--ws", type=str, help="WebSocket RPC URL for --watch (default: config wsUrl, else HTTP polling)")
+    parser.add_argument("--track", action="append", help="URL whose rank changes --watch reports (repeatable, default: DRB)")
+    parser.add_argument("--contributors", action="store_true", help="Show per-contributor totals and an amount histogram")
+    parser.add_argument("--rpc", type=str, help="JSON-RPC endpoint to use instead of Base mainnet (and rpcPool)")
+    parser.add_argument("--profile", action="store_true", help="Print a time breakdown (import / RPC / decode / render) to stderr")
     args = parser.parse_args()
     
-    contract = get_contract()
+    client = get_client(args.rpc)
+    try:
+        run(args, client)
+    except BrokenPipeError:
+        raise
+    except OSError as e:
+        print(f"Error: Cannot connect to Base RPC ({e})", file=sys.stderr)
+        sys.exit(1)
+
+
+def run(args, client):
+    if args.watch:
+        from watch import watch
+        
+        def load_snapshot():
+            reader = BlockReader(client)
+            snapshot = get_snapshot(client, reader=reader)
+            return snapshot["auction"], snapshot["bids"], reader.block
+        
+        ws_url = args.ws
+        if ws_url is None and CONFIG_FILE.exists():
+            with open(CONFIG_FILE) as f:
+                ws_url = json.load(f).get("wsUrl")
+        watch(client, CONTRACT_ADDR, load_snapshot, args.track or [DRB_URL], ws_url)
+        return
+    
+    reader = BlockReader(client, cache=None if args.no_cache else open_cache())
     
     if args.url:
-        bid = get_bid_by_url(contract, args.url)
+        try:
+            bid = get_snapshot(client, include_bids=False, urls=[args.url], reader=reader)["urlBids"][args.url]
+        except OSError:
+            raise
+        except Exception as e:
+            print(f"Warning: Multicall3 read failed ({e}), falling back to a direct call", file=sys.stderr)
+            bid = get_bid_by_url(reader, args.url)
         if bid:
             if args.json:
                 print(json.dumps({
-                    "url": bid["urlString"],
-                    "totalUsdc": bid["totalAmount"] / 1_000_000,
-                    "contributorCount": len(bid["contributions"]),
+                    "url": bid.urlString,
+                    "totalUsdc": bid.totalAmount / 1_000_000,
+                    "contributorCount": len(bid.contributions),
                     "contributions": [
-                        {"address": c["contributor"], "amountUsdc": c["amount"] / 1_000_000}
-                        for c in bid["contributions"]
+                        {"address": c.contributor, "amountUsdc": c.amount / 1_000_000}
+                        for c in bid.contributions
                     ]
                 }, indent=2))
             else:
-                print(f"URL: {bid['urlString']}")
-                print(f"Total: ${bid['totalAmount'] / 1_000_000:.2f} USDC")
-                print(f"Contributors: {len(bid['contributions'])}")
-                for c in bid["contributions"]:
-                    addr = c["contributor"][:8] + "..." + c["contributor"][-4:]
-                    print(f"  - {addr}: ${c['amount'] / 1_000_000:.2f}")
+                print(f"URL: {bid.urlString}")
+                print(f"Total: ${bid.totalAmount / 1_000_000:.2f} USDC")
+                print(f"Contributors: {len(bid.contributions)}")
+                for c in bid.contributions:
+                    addr = c.contributor[:8] + "..." + c.contributor[-4:]
+                    print(f"  - {addr}: ${c.amount / 1_000_000:.2f}")
         else:
             print(f"No bid found for URL: {args.url}", file=sys.stderr)
             sys.exit(1)
         return
     
-    auction_info = get_auction_info(contract)
-    bids = get_all_bids(contract)
-    
-    if args.json:
-        print_json(auction_info, bids)
-    elif args.summary:
-        print_summary(auction_info, bids)
+    if args.serial:
+        auction_info = get_auction_info(reader)
+        bids = get_all_bids(reader)
     else:
-        print_full(auction_info, bids)
+        try:
+            snapshot = get_snapshot(client, reader=reader)
+            auction_info = snapshot["auction"]
+            bids = snapshot["bids"]
+        except OSError:
+            raise
+        except Exception as e:
+            print(f"Warning: Multicall3 read failed ({e}), falling back to serial calls", file=sys.stderr)
+            auction_info = get_auction_info(reader)
+            bids = get_all_bids(reader)
+    
+    if args.contributors:
+        with tracing.phase("render"):
+            print_contributors(bids, args.json)
+        return
+    
+    with tracing.phase("rank"):
+        book = BidBook(bids)
+    
+    with tracing.phase("render"):
+        if args.ndjson:
+            try:
+                print_ndjson(auction_info, book, args.contributions)
+            except BrokenPipeError:
+                # Reader (e.g. `head`) went away; silence the flush at exit
+                sys.stdout = open(os.devnull, "w")
+        elif args.json:
+            print_json(auction_info, book)
+        elif args.summary:
+            print_summary(auction_info, book)
+        else:
+            print_full(auction_info, book)
 
 
 if __name__ == "__main__":
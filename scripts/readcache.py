@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Block-pinned read layer with an on-disk view-call cache.
+
+Every read in one invocation goes against a single block number, resolved
+once, so two calls can never straddle a new block. Results are
+cached in SQLite keyed by (contract, calldata, block): while the chain head
+hasn't moved, repeat invocations are served locally without an eth_call.
+
+Entries expire after CACHE_TTL seconds and the cache is trimmed to
+CACHE_MAX_ENTRIES by least-recent access.
+
+Usage:
+    readcache.py stats     Show cache size and location
+    readcache.py clear     Delete all cached entries
+"""
+
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+import tracing
+
+CACHE_DIR = Path.home() / ".clawdbot" / "skills" / "qrcoin" / "cache"
+CACHE_FILE = CACHE_DIR / "view-calls.sqlite"
+CACHE_TTL = 600  # seconds
+CACHE_MAX_ENTRIES = 2000
+
+
+class ViewCache:
+    """SQLite-backed (contract, calldata, block) -> return data cache."""
+
+    def __init__(self, path=CACHE_FILE, ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(path), timeout=5)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS calls ("
+            " contract TEXT NOT NULL,"
+            " calldata TEXT NOT NULL,"
+            " block INTEGER NOT NULL,"
+            " result BLOB NOT NULL,"
+            " created REAL NOT NULL,"
+            " accessed REAL NOT NULL,"
+            " PRIMARY KEY (contract, calldata, block))"
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS calls_accessed ON calls (accessed)")
+
+    def get(self, contract, calldata, block):
+        now = time.time()
+        row = self.db.execute(
+            "SELECT result, created FROM calls WHERE contract = ? AND calldata = ? AND block = ?",
+            (contract.lower(), calldata, block),
+        ).fetchone()
+        if row is None or now - row[1] > self.ttl:
+            self.misses += 1
+            return None
+        self.db.execute(
+            "UPDATE calls SET accessed = ? WHERE contract = ? AND calldata = ? AND block = ?",
+            (now, contract.lower(), calldata, block),
+        )
+        self.db.commit()
+        self.hits += 1
+        return bytes(row[0])
+
+    def put(self, contract, calldata, block, result):
+        now = time.time()
+        self.db.execute(
+            "INSERT OR REPLACE INTO calls VALUES (?, ?, ?, ?, ?, ?)",
+            (contract.lower(), calldata, block, bytes(result), now, now),
+        )
+        self.evict(now)
+        self.db.commit()
+
+    def evict(self, now=None):
+        """Drop expired entries, then the least recently used beyond the cap."""
+        now = now or time.time()
+        self.db.execute("DELETE FROM calls WHERE created < ?", (now - self.ttl,))
+        self.db.execute(
+            "DELETE FROM calls WHERE rowid IN ("
+            " SELECT rowid FROM calls ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+    def clear(self):
+        self.db.execute("DELETE FROM calls")
+        self.db.commit()
+
+    def count(self):
+        return self.db.execute("SELECT COUNT(*) FROM calls").fetchone()[0]
+
+
+class BlockReader:
+    """
+    Issue every read against one block, going through the cache when given.
+
+    The block is resolved on first use unless passed explicitly. Without
+    a cache the first call() sends eth_blockNumber and its eth_call (at
+    "latest") as one JSON-RPC batch, so a single read is one round trip;
+    with a cache the block has to be known before the lookup, so it is
+    fetched on its own.
+    """
+
+    def __init__(self, client, block=None, cache=None):
+        self.client = client
+        self.cache = cache
+        self._block = block
+
+    @property
+    def block(self):
+        if self._block is None:
+            self._block = self.client.eth.block_number
+        return self._block
+
+    def call(self, to, data):
+        """eth_call `data` (bytes) on `to` at the pinned block; returns bytes."""
+        calldata = "0x" + bytes(data).hex()
+        if self._block is None and self.cache is None:
+            return self._first_call(to, calldata)
+        if self.cache is not None:
+            started = time.perf_counter()
+            cached = self.cache.get(to, calldata, self.block)
+            tracing.cache("eth_call", cached is not None, time.perf_counter() - started)
+            if cached is not None:
+                return cached
+        result = bytes(self.client.eth.call({"to": to, "data": calldata}, self.block))
+        if self.cache is not None:
+            self.cache.put(to, calldata, self.block, result)
+        return result
+
+    def _first_call(self, to, calldata):
+        number, result = self.client.batch([
+            ("eth_blockNumber", []),
+            ("eth_call", [{"to": to, "data": calldata}, "latest"]),
+        ])
+        for reply in (number, result):
+            if isinstance(reply, Exception):
+                raise reply
+        self._block = int(number, 16)
+        return bytes.fromhex(result[2:] if result.startswith("0x") else result)
+
+
+_default = None
+
+
+def open_cache():
+    """
+    Open the default cache, or return None if the cache dir is unusable.
+
+    The cache is opened once per process, so repeated commands in the
+    resident daemon (daemon.py) share one connection and its page cache.
+    """
+    global _default
+    if _default is None:
+        try:
+            _default = ViewCache()
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: view-call cache disabled ({e})", file=sys.stderr)
+            return None
+    return _default
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    cmd = sys.argv[1]
+    cache = ViewCache()
+
+    if cmd == 'stats':
+        print(f"Cache:   {CACHE_FILE}")
+        print(f"Entries: {cache.count()} (max {cache.max_entries}, TTL {cache.ttl}s)")
+    elif cmd == 'clear':
+        cache.clear()
+        print("✓ Cache cleared")
+    else:
+        print(f"Unknown command: {cmd}")
+        print(__doc__)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Compact record types for auction bids and contributions.
+
+Bid and Contribution mirror the contract's AuctionTypesV5 structs and use
+__slots__, so a contribution costs one small fixed-size object instead of
+a dict. The read paths build them directly: fastabi.py from getAllBids /
+getBid / auction return data (stdlib RPC or Multicall3), bidbook.py and
+indexer.py from event logs. bid_from_raw() converts an eth_abi-decoded
+tuple, for code that still decodes generically (bench_decode.py uses it
+as the reference).
+
+ContributionColumns is an optional columnar view over all contributions:
+contributor ids, amounts and timestamps as flat arrays plus per-bid
+offsets. Aggregates over it (per-contributor totals, amount histograms)
+are vectorized with NumPy when installed, and fall back to loops over
+array.array columns otherwise.
+"""
+
+from array import array
+from bisect import bisect_right
+
+from eth_utils import to_checksum_address
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class Contribution:
+    """One BidContribution: (contributor, amount, timestamp)."""
+
+    __slots__ = ("contributor", "amount", "timestamp")
+
+    def __init__(self, contributor, amount, timestamp=None):
+        self.contributor = contributor
+        self.amount = amount
+        self.timestamp = timestamp
+
+    def __repr__(self):
+        return f"Contribution({self.contributor!r}, {self.amount}, {self.timestamp})"
+
+
+class Bid:
+    """One Bid: (totalAmount, urlString, contributions)."""
+
+    __slots__ = ("totalAmount", "urlString", "contributions")
+
+    def __init__(self, totalAmount, urlString, contributions=None):
+        self.totalAmount = totalAmount
+        self.urlString = urlString
+        self.contributions = contributions if contributions is not None else []
+
+    def __repr__(self):
+        return f"Bid({self.totalAmount}, {self.urlString!r}, {len(self.contributions)} contributions)"
+
+
+def bid_from_raw(raw, checksum=False):
+    """
+    Build a Bid from a decoded (totalAmount, urlString, contributions) tuple.
+
+    eth_abi returns lowercase addresses; pass checksum=True to match web3's
+    checksummed output.
+    """
+    if checksum:
+        contributions = [Contribution(to_checksum_address(c[0]), c[1], c[2]) for c in raw[2]]
+    else:
+        contributions = [Contribution(c[0], c[1], c[2]) for c in raw[2]]
+    return Bid(raw[0], raw[1], contributions)
+
+
+def bids_from_raw(raws, checksum=False):
+    return [bid_from_raw(raw, checksum) for raw in raws]
+
+
+class ContributionColumns:
+    """
+    Columnar view of every contribution across a list of bids.
+
+    Bid i's contributions are rows offsets[i]:offsets[i + 1]. Contributor
+    addresses are interned: contributor_ids[row] indexes `contributors`.
+    """
+
+    def __init__(self, bids):
+        self.urls = []
+        self.contributors = []
+        index = {}
+        ids = array("q")
+        amounts = array("Q")
+        timestamps = array("Q")
+        offsets = array("Q", [0])
+
+        for bid in bids:
+            self.urls.append(bid.urlString)
+            for c in bid.contributions:
+                cid = index.get(c.contributor)
+                if cid is None:
+                    cid = index[c.contributor] = len(self.contributors)
+                    self.contributors.append(c.contributor)
+                ids.append(cid)
+                amounts.append(c.amount)
+                timestamps.append(c.timestamp or 0)
+            offsets.append(len(amounts))
+
+        if np is not None:
+            self.contributor_ids = np.frombuffer(ids, dtype=np.int64)
+            self.amounts = np.frombuffer(amounts, dtype=np.uint64)
+            self.timestamps = np.frombuffer(timestamps, dtype=np.uint64)
+            self.offsets = np.frombuffer(offsets, dtype=np.uint64)
+        else:
+            self.contributor_ids = ids
+            self.amounts = amounts
+            self.timestamps = timestamps
+            self.offsets = offsets
+
+    def __len__(self):
+        return len(self.amounts)
+
+    def totals_by_contributor(self):
+        """{address: total amount contributed across all bids}."""
+        if np is not None:
+            totals = np.zeros(len(self.contributors), dtype=np.uint64)
+            np.add.at(totals, self.contributor_ids, self.amounts)
+            return dict(zip(self.contributors, totals.tolist()))
+        totals = [0] * len(self.contributors)
+        for cid, amount in zip(self.contributor_ids, self.amounts):
+            totals[cid] += amount
+        return dict(zip(self.contributors, totals))
+
+    def amount_histogram(self, edges):
+        """Counts of contribution amounts in [edges[i], edges[i + 1])."""
+        if np is not None:
+            counts, _ = np.histogram(self.amounts, bins=np.asarray(edges, dtype=np.uint64))
+            return counts.tolist()
+        counts = [0] * (len(edges) - 1)
+        for amount in self.amounts:
+            # np.histogram's last bin is closed on the right
+            i = bisect_right(edges, amount) - 1 if amount != edges[-1] else len(edges) - 2
+            if 0 <= i < len(counts):
+                counts[i] += 1
+        return counts
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Decode revert data from the auction contract and USDC.
+
+ERRORS maps each 4-byte error selector from references/auction-abi.json
+(plus Error(string), Panic(uint256) and USDC's ERC20 errors) to its name and
+argument types, so decoding a failed eth_call / eth_estimateGas is a dict
+lookup.
+
+Usage:
+    reverts.py <revert data hex>   Decode revert data
+    reverts.py table               List known error selectors
+"""
+
+import json
+import re
+import sys
+
+from eth_abi import decode
+from eth_utils import keccak
+
+from events import ABI_FILE, abi_type
+
+# Errors that aren't in the auction ABI: Solidity's built-ins and the
+# ERC-6093 ones USDC's transferFrom may bubble up
+EXTRA_ERRORS = (
+    "Error(string)",
+    "Panic(uint256)",
+    "ERC20InsufficientAllowance(address,uint256,uint256)",
+    "ERC20InsufficientBalance(address,uint256,uint256)",
+)
+
+
+def _load_errors():
+    """keccak256("NAME(args)")[:4] -> (name, arg types)"""
+    with open(ABI_FILE) as f:
+        abi = json.load(f)
+    signatures = list(EXTRA_ERRORS)
+    for entry in abi:
+        if entry.get("type") == "error":
+            signatures.append(f"{entry['name']}({','.join(abi_type(i) for i in entry['inputs'])})")
+    errors = {}
+    for signature in signatures:
+        name, _, args = signature[:-1].partition("(")
+        errors[keccak(text=signature)[:4].hex()] = (name, args.split(",") if args else [])
+    return errors
+
+
+ERRORS = _load_errors()
+
+# What to do about the errors a bid can hit (SKILL.md "Error Codes")
+HINTS = {
+    "RESERVE_PRICE_NOT_MET": "Bid amount too low; approve more USDC",
+    "URL_ALREADY_HAS_BID": "Use contributeToBid instead",
+    "BID_NOT_FOUND": "URL doesn't have a bid yet; use createBid",
+    "AUCTION_OVER": "Auction has ended; wait for the next one",
+    "AUCTION_NOT_STARTED": "Auction hasn't begun",
+    "USDC_TOKEN_TRANSFER_FAILED": "Not enough USDC balance or allowance",
+    "EnforcedPause": "Auction contract is paused",
+}
+
+# Errors that depend on the USDC allowance, which a pipelined approve
+# hasn't set yet when the bid is simulated
+ALLOWANCE_ERRORS = {
+    "RESERVE_PRICE_NOT_MET",
+    "USDC_TOKEN_TRANSFER_FAILED",
+    "ERC20InsufficientAllowance",
+    "ERC20InsufficientBalance",
+}
+# Error(string) reasons from USDC's transferFrom for the same cases
+ALLOWANCE_REASONS = ("exceeds allowance", "exceeds balance")
+
+
+class Revert:
+    """A decoded revert: error name, decoded args and raw data."""
+
+    def __init__(self, name, args, data):
+        self.name = name
+        self.args = args
+        self.data = data
+
+    @property
+    def hint(self):
+        return HINTS.get(self.name)
+
+    @property
+    def allowance(self):
+        """Whether this revert is down to the USDC allowance or balance."""
+        if self.name == "Error":
+            return bool(self.args) and any(r in self.args[0].lower() for r in ALLOWANCE_REASONS)
+        return self.name in ALLOWANCE_ERRORS
+
+    def __str__(self):
+        if self.name == "Error":
+            return self.args[0]
+        if self.args:
+            return f"{self.name}({', '.join(str(a) for a in self.args)})"
+        return self.name
+
+
+def decode_revert(data):
+    """Decode revert bytes; unknown selectors come back as their hex."""
+    data = bytes(data)
+    if len(data) < 4:
+        return Revert("execution reverted", (), data)
+    selector = data[:4].hex()
+    if selector not in ERRORS:
+        return Revert("0x" + selector, (), data)
+    name, types = ERRORS[selector]
+    try:
+        args = decode(types, data[4:]) if types else ()
+    except Exception:
+        args = ()
+    return Revert(name, tuple(args), data)
+
+
+def revert_from_rpc_error(error):
+    """
+    Pull revert data out of an rpc.RpcError from eth_call/eth_estimateGas.
+
+    Providers put it in `data` as hex, as {"data": hex}, or only in the
+    message. Returns a Revert, or None if the error isn't a revert.
+    """
+    data = error.data
+    if isinstance(data, dict):
+        data = data.get("data")
+    if not isinstance(data, str):
+        match = re.search(r"0x[0-9a-fA-F]{8,}", error.message or "")
+        data = match.group(0) if match else None
+    if data:
+        return decode_revert(bytes.fromhex(data[2:] if data.startswith("0x") else data))
+    if "revert" in (error.message or "").lower():
+        return Revert("execution reverted", (), b"")
+    return None
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    if sys.argv[1] == 'table':
+        for selector, (name, types) in ERRORS.items():
+            print(f"0x{selector}  {name}({','.join(types)})")
+        return
+
+    raw = sys.argv[1]
+    try:
+        revert = decode_revert(bytes.fromhex(raw[2:] if raw.startswith("0x") else raw))
+    except ValueError:
+        print(f"Error: not hex: {raw}")
+        sys.exit(1)
+    print(revert)
+    if revert.hint:
+        print(revert.hint)
+
+
+if __name__ == '__main__':
+    main()
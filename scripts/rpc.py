@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Minimal JSON-RPC client for the read-only commands.
+
+Importing web3 dominates the startup time of every script, but the
+read paths only need eth_call, eth_getLogs and a few other methods.
+RpcClient speaks JSON-RPC over one keep-alive http.client connection
+(stdlib only) and exposes a small `eth` namespace with web3-like method
+names, so callers written against w3.eth work unchanged:
+
+    client = RpcClient("https://mainnet.base.org")
+    client.eth.block_number
+    client.eth.call({"to": addr, "data": "0x..."}, block)   # -> bytes
+    client.batch([("eth_chainId", []), ("eth_blockNumber", [])])
+
+web3 / eth_account are only imported by the code paths that sign.
+"""
+
+import http.client
+import json
+import ssl
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import tracing
+
+DEFAULT_TIMEOUT = 30
+RPC_URL = "https://mainnet.base.org"
+CONFIG_FILE = Path.home() / ".clawdbot" / "skills" / "qrcoin" / "config.json"
+
+# Per-thread connections shared by every RpcClient for the same endpoint,
+# once share_connections() is called (the resident daemon, daemon.py)
+_shared = None
+
+
+class RpcError(Exception):
+    """JSON-RPC error response."""
+
+    def __init__(self, code, message, data=None):
+        self.code = code
+        self.message = message
+        self.data = data
+        super().__init__(f"{message} (code {code})")
+
+
+def to_block(block):
+    """Format a block number or tag as a JSON-RPC block parameter."""
+    return hex(block) if isinstance(block, int) else block
+
+
+def load_rpc_url():
+    """RPC URL from the skill config, matching submit-tx.sh."""
+    if CONFIG_FILE.exists():
+        with open(CONFIG_FILE) as f:
+            config = json.load(f)
+        if config.get("walletSource") == "shared" and config.get("walletConfig"):
+            wallet_config = Path(config["walletConfig"])
+            if wallet_config.exists():
+                with open(wallet_config) as f:
+                    return json.load(f).get("rpcUrls", {}).get("base", RPC_URL)
+        return config.get("rpcUrl", RPC_URL)
+    return RPC_URL
+
+
+def load_rpc_urls():
+    """
+    ([primary] + rpcPool URLs, rpcHedge) from the skill config; the
+    endpoints rpcpool.RpcPool routes between.
+    """
+    config = {}
+    if CONFIG_FILE.exists():
+        with open(CONFIG_FILE) as f:
+            config = json.load(f)
+    return [load_rpc_url()] + list(config.get("rpcPool") or []), bool(config.get("rpcHedge"))
+
+
+def share_connections():
+    """
+    Make RpcClient instances reuse one connection per endpoint and thread,
+    so a long-running process keeps its TLS sessions across commands.
+    """
+    global _shared
+    if _shared is None:
+        _shared = threading.local()
+
+
+def _hex_bytes(value):
+    value = value or "0x"
+    return bytes.fromhex(value[2:] if value.startswith("0x") else value)
+
+
+class RpcClient:
+    """
+    JSON-RPC over a persistent HTTP(S) connection.
+
+    Each thread gets its own connection, so one client can be shared by
+    a thread pool (backfill.py does).
+    """
+
+    def __init__(self, url, timeout=DEFAULT_TIMEOUT):
+        self.url = url
+        self.timeout = timeout
+        parts = urlsplit(url)
+        self._https = parts.scheme == "https"
+        self._host = parts.hostname
+        self._port = parts.port
+        self._path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        self._local = threading.local()
+        self._id_lock = threading.Lock()
+        self._id = 0
+        self.eth = Eth(self)
+
+    def _slot(self):
+        if _shared is None:
+            return self._local, "conn"
+        return _shared, f"{self._https}:{self._host}:{self._port}"
+
+    def _connection(self):
+        holder, name = self._slot()
+        conn = getattr(holder, name, None)
+        if conn is None:
+            if self._https:
+                conn = http.client.HTTPSConnection(
+                    self._host, self._port, timeout=self.timeout,
+                    context=ssl.create_default_context(),
+                )
+            else:
+                conn = http.client.HTTPConnection(self._host, self._port, timeout=self.timeout)
+            setattr(holder, name, conn)
+        return conn
+
+    def close(self):
+        """Close this thread's connection (reopened on next use)."""
+        holder, name = self._slot()
+        conn = getattr(holder, name, None)
+        if conn is not None:
+            conn.close()
+            setattr(holder, name, None)
+
+    def _post(self, payload):
+        if not tracing.enabled:
+            return self._send(payload)
+        started = time.perf_counter()
+        stats = {}
+        try:
+            return self._send(payload, stats)
+        except Exception as e:
+            stats["error"] = type(e).__name__
+            raise
+        finally:
+            tracing.rpc(payload, time.perf_counter() - started, stats.get("sent"), stats.get("received"),
+                        self._host, stats.get("error"))
+
+    def _send(self, payload, stats=None):
+        body = json.dumps(payload, separators=(",", ":")).encode()
+        headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+        # One retry, only when a reused keep-alive connection turns out to
+        # have been closed by the server before it read this request. Any
+        # other failure (a timeout above all) may come after the node acted
+        # on the request, e.g. a broadcast, so it is never resent.
+        for attempt in range(2):
+            conn = self._connection()
+            retry = conn.sock is not None and not attempt
+            try:
+                try:
+                    conn.request("POST", self._path, body, headers)
+                except (BrokenPipeError, ConnectionResetError):
+                    if retry:
+                        self.close()
+                        continue
+                    raise
+                try:
+                    response = conn.getresponse()
+                except http.client.RemoteDisconnected:
+                    if retry:
+                        self.close()
+                        continue
+                    raise
+                data = response.read()
+            except BaseException:
+                self.close()
+                raise
+            if stats is not None:
+                stats["sent"], stats["received"] = len(body), len(data)
+            if response.status >= 400 and not data.startswith((b"{", b"[")):
+                raise RpcError(response.status, f"HTTP {response.status}: {data[:200].decode(errors='replace')}")
+            return json.loads(data)
+
+    def _next_ids(self, n=1):
+        with self._id_lock:
+            first = self._id + 1
+            self._id += n
+        return first
+
+    def request(self, method, params=()):
+        """Send one call and return its result, raising RpcError on error."""
+        reply = self._post({"jsonrpc": "2.0", "id": self._next_ids(), "method": method, "params": list(params)})
+        if "error" in reply:
+            error = reply["error"]
+            raise RpcError(error.get("code"), error.get("message"), error.get("data"))
+        return reply.get("result")
+
+    def batch(self, calls):
+        """
+        Send [(method, params), ...] as one JSON-RPC batch.
+
+        Returns results in call order; failed entries are RpcError
+        instances rather than raising, so one error doesn't lose the rest.
+        """
+        if not calls:
+            return []
+        first = self._next_ids(len(calls))
+        payload = [
+            {"jsonrpc": "2.0", "id": first + i, "method": method, "params": list(params)}
+            for i, (method, params) in enumerate(calls)
+        ]
+        replies = self._post(payload)
+        if isinstance(replies, dict):
+            # Some providers answer a rejected batch with a single error
+            error = replies.get("error", {})
+            raise RpcError(error.get("code"), error.get("message", "batch rejected"), error.get("data"))
+        by_id = {reply.get("id"): reply for reply in replies}
+        results = []
+        for i in range(len(calls)):
+            reply = by_id.get(first + i, {"error": {"code": None, "message": "missing batch reply"}})
+            if "error" in reply:
+                error = reply["error"]
+                results.append(RpcError(error.get("code"), error.get("message"), error.get("data")))
+            else:
+                results.append(reply.get("result"))
+        return results
+
+    def is_connected(self):
+        try:
+            self.request("eth_chainId")
+            return True
+        except Exception:
+            return False
+
+
+class Eth:
+    """web3-style eth namespace over RpcClient. Raw JSON in, Python values out."""
+
+    def __init__(self, client):
+        self.client = client
+
+    @property
+    def block_number(self):
+        return int(self.client.request("eth_blockNumber"), 16)
+
+    @property
+    def chain_id(self):
+        return int(self.client.request("eth_chainId"), 16)
+
+    @property
+    def gas_price(self):
+        return int(self.client.request("eth_gasPrice"), 16)
+
+    def call(self, tx, block="latest"):
+        return _hex_bytes(self.client.request("eth_call", [tx, to_block(block)]))
+
+    def get_balance(self, address, block="latest"):
+        return int(self.client.request("eth_getBalance", [address, to_block(block)]), 16)
+
+    def get_code(self, address, block="latest"):
+        return _hex_bytes(self.client.request("eth_getCode", [address, to_block(block)]))
+
+    def get_block(self, block="latest", full_transactions=False):
+        return self.client.request("eth_getBlockByNumber", [to_block(block), full_transactions])
+
+    def get_logs(self, params):
+        params = dict(params)
+        for key in ("fromBlock", "toBlock"):
+            if key in params:
+                params[key] = to_block(params[key])
+        return self.client.request("eth_getLogs", [params])
+
+    def get_transaction_count(self, address, block="latest"):
+        return int(self.client.request("eth_getTransactionCount", [address, to_block(block)]), 16)
+
+    def estimate_gas(self, tx):
+        return int(self.client.request("eth_estimateGas", [tx]), 16)
+
+    def send_raw_transaction(self, raw):
+        if not isinstance(raw, str):
+            raw = "0x" + bytes(raw).hex()
+        return self.client.request("eth_sendRawTransaction", [raw])
+
+    def get_transaction_receipt(self, tx_hash):
+        return self.client.request("eth_getTransactionReceipt", [tx_hash])
+
+    def new_filter(self, params):
+        return self.client.request("eth_newFilter", [params])
+
+    def get_filter_changes(self, filter_id):
+        return self.client.request("eth_getFilterChanges", [filter_id])
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Pool of JSON-RPC endpoints with health scoring, failover and hedging.
+
+One slow or rate-limited provider otherwise stalls every script. RpcPool
+is a drop-in for rpc.RpcClient (same request / batch / eth interface)
+over several endpoints. Each endpoint keeps an EWMA of its latency and
+error rate, persisted in HEALTH_FILE between runs, and calls go to the
+healthiest one:
+
+    score = latency EWMA x (1 + ERROR_PENALTY x error EWMA)
+
+Transport failures, HTTP errors and rate limits fail over to the next
+endpoint and put the failing one in a growing cooldown. So does "header
+not found" from a node that lags behind the one that returned the block
+a read is pinned to (readcache.BlockReader). JSON-RPC errors such as
+reverts are answers, not failures, and are raised as usual.
+
+With hedging on, eth_sendRawTransaction goes to the two best endpoints
+at once, and latency-critical reads (HEDGED_READS and batches) go to the
+second one if the first hasn't answered after HEDGE_FACTOR x its usual
+latency. The first answer wins, so tail latency follows the better
+provider instead of the worse one. Filters are pinned to the endpoint
+that created them.
+
+Configure extra endpoints in the skill config:
+
+    "rpcUrl": "https://mainnet.base.org",
+    "rpcPool": ["https://base.llamarpc.com", "https://base-rpc.publicnode.com"],
+    "rpcHedge": true
+
+Usage:
+    rpcpool.py              Show endpoint health (from HEALTH_FILE)
+    rpcpool.py probe        Time eth_blockNumber on every configured endpoint
+"""
+
+import http.client
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+from rpc import DEFAULT_TIMEOUT, Eth, RpcClient, RpcError, load_rpc_urls
+
+HEALTH_FILE = Path.home() / ".clawdbot" / "skills" / "qrcoin" / "rpc-health.json"
+EWMA_ALPHA = 0.3
+ERROR_PENALTY = 4
+UNKNOWN_LATENCY = 0.25   # seconds assumed for an endpoint not measured yet
+COOLDOWN = 5             # seconds after a failure, doubling per consecutive failure
+MAX_COOLDOWN = 300
+HEDGE_FACTOR = 2
+HEDGE_MIN_DELAY = 0.05   # seconds
+
+HEDGED_READS = {
+    "eth_call", "eth_blockNumber", "eth_getTransactionCount", "eth_getTransactionReceipt",
+    "eth_estimateGas", "eth_feeHistory", "eth_getBlockByNumber", "eth_getBalance",
+}
+FILTER_METHODS = {"eth_getFilterChanges", "eth_getFilterLogs", "eth_uninstallFilter"}
+# Rate-limit error codes; -32005 is also "too many results" for getLogs, hence the message check
+RATE_LIMIT_CODES = {-32005, -32090}
+# A node behind the others answers calls pinned to a newer block with these (geth, erigon/reth, nethermind)
+UNKNOWN_BLOCK_MESSAGES = ("header not found", "block not found", "unknown block")
+
+_pools = {}  # connect() pools by (urls, hedge, timeout)
+
+
+def failover_error(error):
+    """True if `error` says the endpoint failed (try another), not the call."""
+    if isinstance(error, (OSError, http.client.HTTPException, ValueError)):
+        return True
+    if isinstance(error, RpcError) and isinstance(error.code, int):
+        if error.code >= 400:
+            return True
+        message = str(error.message).lower()
+        if any(m in message for m in UNKNOWN_BLOCK_MESSAGES):
+            return True
+        return error.code in RATE_LIMIT_CODES and "rate" in message
+    return False
+
+
+class Endpoint:
+    """One pool member: its client and health."""
+
+    def __init__(self, url, timeout):
+        self.url = url
+        self.client = RpcClient(url, timeout)
+        self.latency = None   # seconds, EWMA of successful calls
+        self.errors = 0.0     # EWMA of failures, 0..1
+        self.failures = 0     # consecutive
+        self.down_until = 0.0
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def score(self):
+        latency = self.latency if self.latency is not None else UNKNOWN_LATENCY
+        return latency * (1 + ERROR_PENALTY * self.errors)
+
+    def succeeded(self, elapsed):
+        with self.lock:
+            self.calls += 1
+            self.latency = elapsed if self.latency is None else \
+                EWMA_ALPHA * elapsed + (1 - EWMA_ALPHA) * self.latency
+            self.errors *= 1 - EWMA_ALPHA
+            self.failures = 0
+            self.down_until = 0.0
+
+    def failed(self):
+        with self.lock:
+            self.calls += 1
+            self.errors = EWMA_ALPHA + (1 - EWMA_ALPHA) * self.errors
+            self.failures += 1
+            self.down_until = time.time() + min(MAX_COOLDOWN, COOLDOWN * 2 ** (self.failures - 1))
+
+    def state(self):
+        return {"latency": self.latency, "errors": self.errors, "failures": self.failures,
+                "downUntil": self.down_until}
+
+
+class RpcPool:
+    """RpcClient-compatible client over several endpoints."""
+
+    def __init__(self, urls, hedge=False, timeout=DEFAULT_TIMEOUT, health_file=HEALTH_FILE):
+        urls = list(dict.fromkeys(u for u in urls if u))
+        if not urls:
+            raise ValueError("RpcPool needs at least one URL")
+        self.endpoints = [Endpoint(url, timeout) for url in urls]
+        self.url = urls[0]
+        self.hedge = hedge
+        self.health_file = Path(health_file) if health_file else None
+        self._filters = {}
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self.eth = Eth(self)
+        self._load_health()
+
+    def _load_health(self):
+        if self.health_file is None:
+            return
+        try:
+            with open(self.health_file) as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        for endpoint in self.endpoints:
+            state = saved.get(endpoint.url)
+            if state:
+                endpoint.latency = state.get("latency")
+                endpoint.errors = state.get("errors", 0.0)
+                endpoint.failures = state.get("failures", 0)
+                endpoint.down_until = state.get("downUntil", 0.0)
+
+    def save(self):
+        """Merge this process's endpoint health into HEALTH_FILE."""
+        if self.health_file is None:
+            return
+        try:
+            with open(self.health_file) as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            saved = {}
+        saved.update({e.url: e.state() for e in self.endpoints if e.calls})
+        try:
+            self.health_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.health_file.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+            with open(tmp, "w") as f:
+                json.dump(saved, f)
+            os.replace(tmp, self.health_file)
+        except OSError as e:
+            print(f"Warning: could not save RPC health ({e})", file=sys.stderr)
+
+    def ranked(self):
+        """Endpoints best first; ones cooling down after failures go last."""
+        now = time.time()
+        return sorted(self.endpoints, key=lambda e: (e.down_until > now, e.score()))
+
+    def _pool(self):
+        with self._executor_lock:
+            if self._executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+
+                self._executor = ThreadPoolExecutor(max_workers=2 * len(self.endpoints) + 2)
+            return self._executor
+
+    def _call(self, endpoint, fn):
+        started = time.perf_counter()
+        try:
+            result = fn(endpoint.client)
+        except Exception as e:
+            if failover_error(e):
+                endpoint.failed()
+            else:
+                endpoint.succeeded(time.perf_counter() - started)  # It answered
+            raise
+        endpoint.succeeded(time.perf_counter() - started)
+        return result
+
+    def _failover(self, endpoints, fn):
+        error = None
+        for endpoint in endpoints:
+            try:
+                return endpoint, self._call(endpoint, fn)
+            except Exception as e:
+                if not failover_error(e):
+                    raise
+                error = e
+        raise error
+
+    def _hedged(self, endpoints, fn, delay, prefer_success=False):
+        """
+        Call the best endpoint, and the second as well once `delay`
+        passes without an answer (or at once for delay 0). The first
+        answer wins; if both fail, the rest are tried in turn.
+        """
+        from concurrent.futures import FIRST_COMPLETED, wait
+
+        pool = self._pool()
+        futures = {pool.submit(self._call, endpoints[0], fn): endpoints[0]}
+        if delay:
+            done, _ = wait(futures, timeout=delay)
+            hedge = not done or next(iter(done)).exception() is not None
+        else:
+            hedge = True
+        if hedge:
+            futures[pool.submit(self._call, endpoints[1], fn)] = endpoints[1]
+
+        error = answer = None
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                e = future.exception()
+                if e is None:
+                    return futures[future], future.result()
+                if failover_error(e):
+                    error = error or e
+                elif not prefer_success:
+                    raise e
+                else:
+                    answer = answer or e
+        if answer is not None:
+            raise answer
+        if len(endpoints) > 2:
+            return self._failover(endpoints[2:], fn)
+        raise error
+
+    def _route(self, fn, hedge, delay=None, prefer_success=False):
+        endpoints = self.ranked()
+        if not hedge or len(endpoints) < 2:
+            return self._failover(endpoints, fn)
+        if delay is None:
+            usual = endpoints[0].latency if endpoints[0].latency is not None else UNKNOWN_LATENCY
+            delay = max(HEDGE_MIN_DELAY, HEDGE_FACTOR * usual)
+        return self._hedged(endpoints, fn, delay, prefer_success)
+
+    def request(self, method, params=()):
+        """Send one call and return its result, raising RpcError on error."""
+        params = list(params)
+
+        def fn(client):
+            return client.request(method, params)
+
+        if method in FILTER_METHODS and params:
+            # Filters only exist on the node that created them: no failover
+            endpoint = self._filters.get(params[0], self.endpoints[0])
+            return self._call(endpoint, fn)
+        if method == "eth_sendRawTransaction":
+            # Broadcast to two at once; "already known" from one isn't a failure
+            _, result = self._route(fn, self.hedge, delay=0, prefer_success=True)
+            return result
+        endpoint, result = self._route(fn, self.hedge and method in HEDGED_READS)
+        if method == "eth_newFilter":
+            self._filters[result] = endpoint
+        return result
+
+    def batch(self, calls):
+        """As RpcClient.batch, from the healthiest endpoint (hedged if enabled)."""
+        if not calls:
+            return []
+        calls = [(method, list(params)) for method, params in calls]
+        hedge = self.hedge and not any(m in FILTER_METHODS or m == "eth_newFilter" for m, _ in calls)
+        _, results = self._route(lambda client: client.batch(calls), hedge)
+        return results
+
+    def is_connected(self):
+        try:
+            self.request("eth_chainId")
+            return True
+        except Exception:
+            return False
+
+    def close(self):
+        for endpoint in self.endpoints:
+            endpoint.client.close()
+
+
+def connect(urls, hedge=False, timeout=DEFAULT_TIMEOUT):
+    """
+    An RpcClient for a single URL, else an RpcPool over all of them
+    that saves its endpoint health when the process exits. Pools are
+    reused per process, so the resident daemon keeps learning.
+    """
+    if isinstance(urls, str):
+        urls = [urls]
+    urls = list(dict.fromkeys(u for u in urls if u))
+    if len(urls) == 1:
+        return RpcClient(urls[0], timeout)
+    key = (tuple(urls), hedge, timeout)
+    if key not in _pools:
+        import atexit
+
+        _pools[key] = RpcPool(urls, hedge, timeout)
+        atexit.register(_pools[key].save)
+    return _pools[key]
+
+
+def load_rpc_client():
+    """RPC client for the configured endpoint(s): an RpcPool if rpcPool is set."""
+    urls, hedge = load_rpc_urls()
+    return connect(urls, hedge)
+
+
+def main():
+    urls, _ = load_rpc_urls()
+    if len(sys.argv) > 1 and sys.argv[1] == 'probe':
+        pool = RpcPool(urls)
+        for endpoint in pool.endpoints:
+            try:
+                pool._call(endpoint, lambda client: client.request("eth_blockNumber"))
+                print(f"{endpoint.url:<50} {endpoint.latency * 1000:>7.0f}ms")
+            except Exception as e:
+                print(f"{endpoint.url:<50}  failed: {e}")
+        pool.save()
+        return
+    elif len(sys.argv) > 1:
+        print(f"Unknown command: {sys.argv[1]}")
+        print(__doc__)
+        sys.exit(1)
+
+    pool = RpcPool(urls)
+    now = time.time()
+    for endpoint in pool.ranked():
+        latency = "-" if endpoint.latency is None else f"{endpoint.latency * 1000:.0f}ms"
+        down = f"  cooling down {int(endpoint.down_until - now)}s" if endpoint.down_until > now else ""
+        print(f"{endpoint.url:<50} latency {latency:>7}  errors {endpoint.errors:.2f}{down}")
+
+
+if __name__ == '__main__':
+    main()
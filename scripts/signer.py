@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Signer agent: holds the unlocked wallet key in memory, ssh-agent style.
+
+`signer.py start` retrieves the key once (the keychain prompt, or the
+password and PBKDF2 for the encrypted-file backend), then serves signing
+requests on a Unix socket until the TTL runs out or it is stopped.
+Clients get signed transactions back, never the key. Every request is
+checked against ~/.clawdbot/config/wallet-policy.json (re-read each
+time) and may only target the auction or USDC:
+
+  - chain must be Base, no ETH value
+  - USDC: approve(auction, amount) only, amount <= maxTxValueUSD
+  - auction: createBid / contributeToBid only
+
+qrcoin.py (submit-tx.sh) uses the agent automatically when it is running
+and falls back to reading the key itself otherwise. Confirmation prompts
+stay with the client (--yes), since the agent has no terminal.
+
+Usage:
+    signer.py start [--ttl SECONDS] [--foreground]   Unlock and serve (default TTL 3600)
+    signer.py status                                 Show address and time left
+    signer.py stop                                   Drop the key and exit
+"""
+
+import json
+import os
+import socket
+import socketserver
+import sys
+import time
+from collections import namedtuple
+from pathlib import Path
+
+from eth_abi import decode
+
+from contracts import AUCTION, CHAIN_ID, USDC
+from encode import SELECTORS
+from peercred import peer_is_owner
+from wallet import address_from_key, load_policy
+
+SOCKET_FILE = Path.home() / ".clawdbot" / "skills" / "qrcoin" / "signer.sock"
+DEFAULT_TTL = 3600  # seconds
+CLIENT_TIMEOUT = 10  # seconds a connected client may stay silent
+
+SignedTx = namedtuple("SignedTx", "raw_transaction hash")
+
+
+class SignerError(Exception):
+    """The agent refused or failed a request."""
+
+
+def check_tx(tx, policy):
+    """Return why `tx` may not be signed under `policy`, or None if it may."""
+    policies = policy.get("policies", {})
+    if int(tx.get("chainId", 0)) != CHAIN_ID:
+        return f"chainId must be {CHAIN_ID}"
+    if int(tx.get("value", 0)):
+        return "ETH transfers are not signed by the agent"
+    to = str(tx.get("to", "")).lower()
+    data = str(tx.get("data", "0x"))
+    data = data[2:] if data.startswith("0x") else data
+    selector = data[:8].lower()
+
+    if to == USDC.lower():
+        if selector != SELECTORS["approve"]:
+            return "only approve() is allowed on USDC"
+        try:
+            spender, amount = decode(["address", "uint256"], bytes.fromhex(data[8:]))
+        except Exception:
+            return "malformed approve() calldata"
+        if spender.lower() != AUCTION.lower():
+            return "approve() spender must be the auction contract"
+        limit = policies.get("maxTxValueUSD")
+        if limit is not None and amount / 1_000_000 > limit:
+            return f"approve of {amount / 1_000_000:.2f} USDC exceeds maxTxValueUSD ({limit})"
+        return None
+    if to == AUCTION.lower():
+        if selector not in (SELECTORS["createBid"], SELECTORS["contributeToBid"]):
+            return "only createBid() and contributeToBid() are allowed on the auction"
+        return None
+    return f"target {tx.get('to')} is not allowed"
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        agent = self.server.agent
+        if not peer_is_owner(self.request):
+            return
+        # The agent serves one client at a time: an idle or half-open one
+        # must not keep it (and the key) alive past the TTL
+        try:
+            while not agent.expired():
+                timeout = CLIENT_TIMEOUT
+                if agent.expires is not None:
+                    timeout = max(0.1, min(timeout, agent.expires - time.time()))
+                self.request.settimeout(timeout)
+                line = self.rfile.readline()
+                if not line:
+                    return
+                try:
+                    reply = agent.dispatch(json.loads(line))
+                except Exception as e:
+                    reply = {"error": str(e)}
+                self.wfile.write(json.dumps(reply).encode() + b"\n")
+                self.wfile.flush()
+        except OSError:  # Timed out or went away
+            return
+
+
+class Agent:
+    """In-memory signer served over a Unix socket until `expires`."""
+
+    def __init__(self, account, ttl):
+        self.account = account
+        self.started = time.time()
+        self.expires = self.started + ttl if ttl else None
+        self.signed = 0
+        self.running = True
+
+    def remaining(self):
+        return None if self.expires is None else max(0, int(self.expires - time.time()))
+
+    def expired(self):
+        return self.expires is not None and time.time() >= self.expires
+
+    def dispatch(self, request):
+        op = request.get("op")
+        if op == "address":
+            return {"address": self.account.address}
+        if op == "status":
+            return {"address": self.account.address, "expiresIn": self.remaining(),
+                    "signed": self.signed, "pid": os.getpid()}
+        if op == "sign":
+            tx = request.get("tx") or {}
+            reason = check_tx(tx, load_policy())
+            if reason:
+                return {"error": f"policy: {reason}"}
+            signed = self.account.sign_transaction(tx)
+            self.signed += 1
+            return {"raw": "0x" + bytes(signed.raw_transaction).hex(), "hash": "0x" + bytes(signed.hash).hex()}
+        if op == "stop":
+            self.running = False
+            return {"stopped": True}
+        return {"error": f"unknown op: {op}"}
+
+    def serve(self, path=SOCKET_FILE):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists():
+            path.unlink()
+        old_umask = os.umask(0o077)
+        try:
+            server = socketserver.UnixStreamServer(str(path), _Handler)
+        finally:
+            os.umask(old_umask)
+        server.agent = self
+        try:
+            while self.running and not self.expired():
+                server.timeout = None if self.expires is None else max(0.1, self.expires - time.time())
+                server.handle_request()
+        finally:
+            server.server_close()
+            self.account = None
+            if path.exists():
+                path.unlink()
+
+
+class AgentSigner:
+    """Client for a running agent; signs like an eth_account LocalAccount."""
+
+    def __init__(self, path=SOCKET_FILE):
+        self.path = str(path)
+        address = self.request({"op": "address"}).get("address")
+        if not address:
+            raise SignerError("Signer agent did not report an address")
+        self.address = address
+
+    def request(self, message):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(self.path)
+            sock.sendall(json.dumps(message).encode() + b"\n")
+            line = sock.makefile("rb").readline()
+        if not line:
+            raise SignerError("Signer agent closed the connection")
+        reply = json.loads(line)
+        if not isinstance(reply, dict):
+            raise SignerError(f"Malformed reply from signer agent: {line[:80]!r}")
+        if "error" in reply:
+            raise SignerError(f"Signer agent refused: {reply['error']}")
+        return reply
+
+    def load(self):
+        pass
+
+    def sign_transaction(self, tx):
+        reply = self.request({"op": "sign", "tx": tx})
+        return SignedTx(bytes.fromhex(reply["raw"][2:]), bytes.fromhex(reply["hash"][2:]))
+
+
+class LocalSigner:
+    """Signs in-process with the raw key; eth_account is imported on load()."""
+
+    def __init__(self, private_key):
+        self.address = address_from_key(private_key)
+        self._key = private_key
+        self._account = None
+
+    def load(self):
+        if self._account is None:
+            from eth_account import Account
+            self._account = Account.from_key(self._key)
+
+    def sign_transaction(self, tx):
+        self.load()
+        return self._account.sign_transaction(tx)
+
+
+def connect_agent(path=SOCKET_FILE):
+    """An AgentSigner if an agent is listening at `path`, else None."""
+    if not Path(path).exists():
+        return None
+    try:
+        return AgentSigner(path)
+    except (OSError, ValueError, SignerError):
+        return None
+
+
+def open_signer(load_key):
+    """The running agent if there is one, else a LocalSigner over load_key()."""
+    return connect_agent() or LocalSigner(load_key())
+
+
+def start(ttl, foreground):
+    from eth_account import Account
+    from keychain import retrieve_key
+
+    if connect_agent() is not None:
+        print(f"Signer agent already running ({SOCKET_FILE})")
+        sys.exit(1)
+
+    key = retrieve_key()
+    if not key:
+        print("Error: Could not retrieve private key. Run setup.sh first.")
+        sys.exit(1)
+    agent = Agent(Account.from_key(key), ttl)
+    del key
+
+    if not foreground:
+        pid = os.fork()
+        if pid:
+            print(f"✓ Signer agent running (pid {pid})")
+            print(f"Address: {agent.account.address}")
+            print(f"Socket:  {SOCKET_FILE}")
+            print(f"Expires: {'never' if not ttl else f'in {ttl}s'}")
+            return
+        os.setsid()
+        devnull = os.open(os.devnull, os.O_RDWR)
+        for fd in (0, 1, 2):
+            os.dup2(devnull, fd)
+    agent.serve()
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    cmd = sys.argv[1]
+
+    if cmd == 'start':
+        ttl = DEFAULT_TTL
+        if '--ttl' in sys.argv:
+            try:
+                ttl = int(sys.argv[sys.argv.index('--ttl') + 1])
+            except (IndexError, ValueError):
+                print("Error: --ttl needs a number of seconds (0 = no expiry)")
+                sys.exit(1)
+        start(ttl, '--foreground' in sys.argv)
+    elif cmd in ('status', 'stop'):
+        agent = connect_agent()
+        if agent is None:
+            print("No signer agent running")
+            sys.exit(1)
+        reply = agent.request({"op": cmd})
+        if cmd == 'stop':
+            print("✓ Signer agent stopped")
+        else:
+            expires = "never" if reply["expiresIn"] is None else f"in {reply['expiresIn']}s"
+            print(f"Address: {reply['address']}")
+            print(f"PID:     {reply['pid']}")
+            print(f"Signed:  {reply['signed']} transactions")
+            print(f"Expires: {expires}")
+    else:
+        print(f"Unknown command: {cmd}")
+        print(__doc__)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Lightweight spans for profiling the scripts: where does a command spend
+its time (import, RPC, decode, render)?
+
+Tracing is off unless the command line has --profile or QRCOIN_TRACE is
+set, and costs one flag check per RPC call when off. When on:
+
+  - rpc.RpcClient records every JSON-RPC request (method, bytes sent and
+    received, latency, endpoint)
+  - readcache.BlockReader records view-call cache hits and misses
+  - scripts record phases (import, decode, render, and the submit stages)
+
+--profile prints a breakdown table to stderr when the command finishes;
+QRCOIN_TRACE=PATH appends every span as a JSON line to PATH, so runs can
+be aggregated later (`tracing.py summary PATH`).
+
+Usage:
+    query-bids.py --summary --profile
+    QRCOIN_TRACE=/tmp/qrcoin-spans.jsonl wallet.py balance
+    tracing.py summary PATH    Aggregate a span file per script, phase and method
+"""
+
+import atexit
+import json
+import os
+import sys
+import time
+
+TRACE_ENV = "QRCOIN_TRACE"
+
+enabled = False
+profile = False
+_spans = []
+_script = None
+_argv = []
+_started = time.perf_counter()
+
+
+def configure(argv=None):
+    """(Re)start tracing for one command; the daemon calls this per request."""
+    global enabled, profile, _script, _argv, _started
+    argv = sys.argv if argv is None else argv
+    profile = "--profile" in argv
+    enabled = profile or bool(os.environ.get(TRACE_ENV))
+    _script = os.path.basename(argv[0]) if argv else None
+    _argv = [arg for arg in argv[1:] if arg != "--profile"]
+    _started = time.perf_counter()
+    _spans.clear()
+
+
+def record(kind, name, seconds, **fields):
+    if enabled:
+        _spans.append(dict(fields, kind=kind, name=name, ms=round(seconds * 1000, 3)))
+
+
+class phase:
+    """Context manager timing one phase of a command."""
+
+    __slots__ = ("name", "started")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record("phase", self.name, time.perf_counter() - self.started)
+        return False
+
+
+def mark(name):
+    """Record phase `name` as running from the start of the command until now (e.g. "import")."""
+    record("phase", name, time.perf_counter() - _started)
+
+
+def rpc(payload, seconds, sent, received, endpoint=None, error=None):
+    """Record one JSON-RPC POST (a single request or a batch)."""
+    if isinstance(payload, list):
+        record("rpc", "batch", seconds, sent=sent, received=received, endpoint=endpoint,
+               methods=[call["method"] for call in payload], error=error)
+    else:
+        record("rpc", payload["method"], seconds, sent=sent, received=received,
+               endpoint=endpoint, error=error)
+
+
+def cache(method, hit, seconds):
+    """Record one cache lookup."""
+    record("cache", method, seconds, hit=hit)
+
+
+def summarize(spans):
+    """Aggregate spans into {"phases": {name: ms}, "methods": {name: {...}}}."""
+    phases = {}
+    methods = {}
+    for span in spans:
+        kind, name = span["kind"], span["name"]
+        if kind == "phase":
+            phases[name] = phases.get(name, 0.0) + span["ms"]
+            continue
+        if kind not in ("rpc", "cache"):
+            continue
+        row = methods.setdefault(name, {"calls": 0, "errors": 0, "sent": 0, "received": 0, "ms": 0.0,
+                                        "hits": 0, "lookups": 0})
+        if kind == "rpc":
+            row["calls"] += 1
+            row["errors"] += bool(span.get("error"))
+            row["sent"] += span.get("sent") or 0
+            row["received"] += span.get("received") or 0
+            row["ms"] += span["ms"]
+        else:
+            row["lookups"] += 1
+            row["hits"] += bool(span.get("hit"))
+    return {"phases": phases, "methods": methods}
+
+
+def _size(n):
+    for unit in ("B", "KB", "MB"):
+        if n < 1024 or unit == "MB":
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+
+
+def print_table(summary, total_ms=None, file=None):
+    file = file or sys.stderr
+    phases = dict(summary["phases"])
+    rpc_ms = sum(row["ms"] for row in summary["methods"].values())
+    if rpc_ms:
+        phases["rpc"] = rpc_ms
+    if total_ms:
+        phases["other"] = max(0.0, total_ms - sum(phases.values()))
+    print(f"{'phase':<24}{'ms':>10}{'%':>7}", file=file)
+    for name, ms in phases.items():
+        share = f"{ms / total_ms * 100:.1f}" if total_ms else "-"
+        print(f"{name:<24}{ms:>10.1f}{share:>7}", file=file)
+    if not summary["methods"]:
+        return
+    print(file=file)
+    print(f"{'method':<24}{'calls':>11}{'cached':>8}{'sent':>10}{'received':>10}{'ms':>10}{'mean':>8}",
+          file=file)
+    for name, row in sorted(summary["methods"].items(), key=lambda item: -item[1]["ms"]):
+        cached = f"{row['hits']}/{row['lookups']}" if row["lookups"] else "-"
+        mean = f"{row['ms'] / row['calls']:.1f}" if row["calls"] else "-"
+        calls = f"{row['calls']}" + (f" ({row['errors']} err)" if row["errors"] else "")
+        print(f"{name:<24}{calls:>11}{cached:>8}{_size(row['sent']):>10}{_size(row['received']):>10}"
+              f"{row['ms']:>10.1f}{mean:>8}", file=file)
+
+
+def report(file=None):
+    """Print the --profile breakdown of the current command."""
+    total_ms = (time.perf_counter() - _started) * 1000
+    file = file or sys.stderr
+    print(file=file)
+    print(f"Profile: {' '.join([_script or '?'] + _argv)} ({total_ms:.0f}ms)", file=file)
+    print_table(summarize(_spans), total_ms, file)
+
+
+def write(path):
+    """Append this command's spans, and a "run" span with its total, to `path` as JSON lines."""
+    total = time.perf_counter() - _started
+    base = {"ts": round(time.time(), 3), "pid": os.getpid(), "script": _script}
+    spans = _spans + [{"kind": "run", "name": _script, "ms": round(total * 1000, 3), "argv": _argv}]
+    try:
+        with open(path, "a") as f:
+            f.write("".join(json.dumps(dict(base, **span)) + "\n" for span in spans))
+    except OSError as e:
+        print(f"Warning: could not write spans to {path} ({e})", file=sys.stderr)
+
+
+def finish():
+    """End the current command: print the profile and/or append the spans, then reset."""
+    global enabled
+    if enabled:
+        if profile:
+            report()
+        if os.environ.get(TRACE_ENV):
+            write(os.environ[TRACE_ENV])
+    _spans.clear()
+    enabled = False
+
+
+def summarize_file(path):
+    """Per script: run count, summed run time and spans of a QRCOIN_TRACE file."""
+    scripts = {}
+    with open(path) as f:
+        for line in f:
+            try:
+                span = json.loads(line)
+            except ValueError:
+                continue
+            entry = scripts.setdefault(span.get("script"), {"runs": 0, "ms": 0.0, "spans": []})
+            if span["kind"] == "run":
+                entry["runs"] += 1
+                entry["ms"] += span["ms"]
+            else:
+                entry["spans"].append(span)
+    return scripts
+
+
+def main():
+    if len(sys.argv) != 3 or sys.argv[1] != 'summary':
+        print(__doc__)
+        sys.exit(1)
+    try:
+        scripts = summarize_file(sys.argv[2])
+    except OSError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    for script, entry in scripts.items():
+        mean = entry["ms"] / entry["runs"] if entry["runs"] else 0
+        print(f"{script}: {entry['runs']} runs, {mean:.0f}ms mean (totals across runs below)")
+        print_table(summarize(entry["spans"]), entry["ms"], sys.stdout)
+        print()
+
+
+configure()
+atexit.register(finish)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Asynchronous receipt tracker with fee-bump replacement.
+
+Watches any number of broadcast transactions (journal entries, see
+journal.py) until each has a receipt. Every poll is one JSON-RPC batch of
+eth_getTransactionReceipt for all outstanding hashes plus the latest
+block header, and the next poll is timed for just after the next block is
+due (Base produces one every BLOCK_TIME seconds) instead of a fixed
+interval.
+
+A transaction still pending BUMP_AFTER seconds after its last broadcast
+is re-signed with the same nonce and fees raised by at least
+REPLACE_BUMP (nodes require +10% on both fee fields), up to MAX_BUMPS
+times. Earlier attempts stay tracked, since any of them may be the one
+that gets mined.
+
+Usage (as a library):
+    from tracker import Replacer, track
+
+    results = asyncio.run(track(client, [[entry]], journal, Replacer(client, signer)))
+"""
+
+import asyncio
+import math
+import time
+
+from fees import BLOCK_TIME, FeeHistory
+from rpc import RpcError
+
+BUMP_AFTER = 20          # seconds without a receipt before replacing
+MAX_BUMPS = 3
+REPLACE_BUMP = 1.125     # fee multiplier per replacement
+RECEIPT_TIMEOUT = 120    # seconds
+RECEIPT_LAG = 0.3        # seconds after a block is due before polling
+MIN_POLL = 0.25
+
+
+class Replacer:
+    """Re-sign a stuck transaction with the same nonce and higher fees."""
+
+    def __init__(self, client, signer):
+        self.client = client
+        self.signer = signer
+        self.history = FeeHistory()
+
+    def fees(self, entry):
+        """Bumped fee fields: the old fees x REPLACE_BUMP or today's level, whichever is higher."""
+        if "maxFeePerGas" not in entry:
+            bumped = math.ceil(entry["gasPrice"] * REPLACE_BUMP)
+            return {"gasPrice": max(bumped, self.client.eth.gas_price)}
+        try:
+            self.history.refresh(self.client)
+            current_fee, current_tip = self.history.fees(entry.get("urgency", "normal"))
+        except (RpcError, OSError, ValueError):
+            current_fee, current_tip = 0, 0
+        tip = max(math.ceil(entry["maxPriorityFeePerGas"] * REPLACE_BUMP), current_tip)
+        max_fee = max(math.ceil(entry["maxFeePerGas"] * REPLACE_BUMP), current_fee, tip)
+        return {"type": 2, "maxFeePerGas": max_fee, "maxPriorityFeePerGas": tip}
+
+    def __call__(self, entry):
+        fees = self.fees(entry)
+        signed = self.signer.sign_transaction({
+            "to": entry["to"],
+            "data": entry["data"],
+            "gas": entry["gas"],
+            "nonce": entry["nonce"],
+            "chainId": entry["chainId"],
+            **fees,
+        })
+        tx_hash = self.client.eth.send_raw_transaction(signed.raw_transaction)
+        fees.pop("type", None)
+        replacement = {
+            **{k: v for k, v in entry.items() if k not in ("maxFeePerGas", "maxPriorityFeePerGas", "gasPrice")},
+            **fees,
+            "hash": tx_hash,
+            "sentAt": time.time(),
+            "replaces": entry["hash"],
+            "status": "pending",
+        }
+        return replacement
+
+
+def next_poll_delay(head, now):
+    """Seconds until just after the block following `head` is due."""
+    if not isinstance(head, dict) or "timestamp" not in head:
+        return BLOCK_TIME
+    due = int(head["timestamp"], 16) + BLOCK_TIME + RECEIPT_LAG
+    return min(BLOCK_TIME, max(MIN_POLL, due - now))
+
+
+def report(message):
+    print(message, flush=True)
+
+
+async def track(client, groups, journal=None, replace=None, bump_after=BUMP_AFTER,
+                max_bumps=MAX_BUMPS, timeout=RECEIPT_TIMEOUT, log=report):
+    """
+    Wait for one receipt per group.
+
+    `groups` is a list of attempt lists, oldest first, each holding the
+    entries broadcast for one nonce; replacements are appended in place.
+    `replace` (e.g. a Replacer) is called in a worker thread with the
+    latest attempt of a stuck group and returns the replacement entry.
+    Replacements and outcomes are written to `journal`.
+
+    Returns a list of (entry, receipt) per group; receipt is None for
+    groups that weren't mined before `timeout`.
+    """
+    done = [None] * len(groups)
+    bumps = [0] * len(groups)
+    deadline = time.time() + timeout
+
+    while time.time() < deadline and None in done:
+        live = [(i, entry) for i, attempts in enumerate(groups) if done[i] is None for entry in attempts]
+        try:
+            results = await asyncio.to_thread(
+                client.batch,
+                [("eth_getBlockByNumber", ["latest", False])]
+                + [("eth_getTransactionReceipt", [entry["hash"]]) for _, entry in live],
+            )
+        except (RpcError, OSError) as e:
+            log(f"⚠️  Receipt poll failed ({e}), retrying")
+            results = [None]
+
+        for (i, entry), receipt in zip(live, results[1:]):
+            if done[i] is not None or not isinstance(receipt, dict):
+                continue
+            done[i] = (entry, receipt)
+            ok = receipt.get("status") == "0x1"
+            block = int(receipt["blockNumber"], 16)
+            gas_used = int(receipt["gasUsed"], 16)
+            if journal is not None:
+                journal.resolve(entry["hash"], "confirmed" if ok else "reverted", block, gas_used)
+                for other in groups[i]:
+                    if other is not entry:
+                        journal.resolve(other["hash"], "replaced")
+            mark, verdict = ("✓", "confirmed") if ok else ("✗", "REVERTED")
+            log(f"{mark} {entry.get('intent', entry['hash'])} {verdict} in block {block} (gas used {gas_used})")
+
+        now = time.time()
+        for i, attempts in enumerate(groups):
+            latest = attempts[-1]
+            if done[i] is not None or replace is None or bumps[i] >= max_bumps:
+                continue
+            if now - latest["sentAt"] < bump_after:
+                continue
+            bumps[i] += 1
+            try:
+                replacement = await asyncio.to_thread(replace, latest)
+            except Exception as e:
+                # Typically "nonce too low": an earlier attempt was just mined
+                log(f"⚠️  Could not replace {latest['hash']}: {e}")
+                bumps[i] = max_bumps
+                continue
+            attempts.append(replacement)
+            if journal is not None:
+                journal.record(replacement)
+            log(f"↑ {latest.get('intent', latest['hash'])} pending {int(now - latest['sentAt'])}s; "
+                f"replaced with higher fees: {replacement['hash']}")
+
+        if None in done:
+            delay = next_poll_delay(results[0], time.time())
+            await asyncio.sleep(max(0, min(delay, deadline - time.time())))
+
+    for i, attempts in enumerate(groups):
+        if done[i] is None:
+            latest = attempts[-1]
+            log(f"⚠️  {latest.get('intent', latest['hash'])} not mined after {timeout}s: {latest['hash']}")
+    return [done[i] or (attempts[-1], None) for i, attempts in enumerate(groups)]
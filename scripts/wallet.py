@@ -7,24 +7,42 @@ Usage:
   wallet.py create                  Create new wallet (shows seed phrase)
   wallet.py export                  Export private key from config
   wallet.py address                 Show wallet address
-  wallet.py balance                 Check ETH and USDC balance
+  wallet.py balance                 Check ETH and USDC balance and auction allowance
+  wallet.py balances <addr>... [--file PATH] [--json]
+                                    Same for many wallets in one Multicall3 read
+                                    (--file: one address per line)
+
+  Add --profile to balance / balances for an import / RPC / render breakdown (stderr).
 """
 
+if __name__ == "__main__":
+    # Served by the resident daemon when it is running (see daemon.py)
+    from daemon import forward
+    forward("wallet.py")
+
+import tracing  # First, so the profile's import phase covers the rest
+
 import sys
 import os
 import json
+from decimal import Decimal
 from pathlib import Path
 
 try:
-    from eth_account import Account
-    from web3 import Web3
+    from eth_keys import keys
+    from eth_utils import decode_hex, to_checksum_address
 except ImportError:
     print("Error: Required packages not installed.")
-    print("Run: pip install eth-account web3")
+    print("Run: pip install eth-account")
     sys.exit(1)
 
-# Enable mnemonic features
-Account.enable_unaudited_hdwallet_features()
+from daemon import SERVING_ENV
+from multicall import aggregate3, encode_call
+from readcache import BlockReader, open_cache
+from rpcpool import connect
+
+if __name__ == "__main__":
+    tracing.mark("import")
 
 CONFIG_DIR = Path.home() / ".clawdbot" / "skills" / "wallet"
 CONFIG_FILE = CONFIG_DIR / "config.json"
@@ -55,14 +73,24 @@ def check_policy(action: str) -> bool:
 
 # Contract addresses
 USDC = "0x833589fCD6eDb6E08f4c7c32D4f71b54bdA02913"
+AUCTION = "0x7309779122069EFa06ef71a45AE0DB55A259A176"
+MULTICALL3 = "0xcA11bde05977b3631167028862bE2a173976CA11"
 RPC_DEFAULT = "https://mainnet.base.org"
 
+# Addresses per aggregate3 call (3 reads each); larger fleets take a few calls
+BALANCES_CHUNK = 200
+
 def load_config():
     if CONFIG_FILE.exists():
         with open(CONFIG_FILE) as f:
             return json.load(f)
     return {}
 
+def open_client(config):
+    """RPC client for rpcUrl, or an RpcPool when rpcPool lists more endpoints."""
+    urls = [config.get('rpcUrl', RPC_DEFAULT)] + list(config.get('rpcPool') or [])
+    return connect(urls, bool(config.get('rpcHedge')))
+
 def get_private_key():
     """Get private key from keychain or config (internal use for signing)."""
     import subprocess
@@ -83,6 +111,26 @@ def get_private_key():
     config = load_config()
     return config.get('privateKey')
 
+def address_from_key(private_key):
+    """Derive the checksum address without importing eth_account (slow to load)."""
+    return keys.PrivateKey(decode_hex(private_key)).public_key.to_checksum_address()
+
+def wallet_address(prompt=True):
+    """
+    Address of the running signer agent, else derived from the stored key
+    (None if neither). With prompt=False the keychain, which may prompt,
+    is skipped for the address saved in config.
+    """
+    from signer import connect_agent
+
+    agent = connect_agent()
+    if agent is not None:
+        return agent.address
+    if not prompt:
+        return load_config().get('address')
+    pk = get_private_key()
+    return address_from_key(pk) if pk else None
+
 def save_config(config):
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
     with open(CONFIG_FILE, 'w') as f:
@@ -92,6 +140,7 @@ def save_config(config):
 def create_wallet():
     """Generate a new wallet with mnemonic seed phrase."""
     # Generate mnemonic and derive account
+    from eth_account import Account
     Account.enable_unaudited_hdwallet_features()
     acct, mnemonic = Account.create_with_mnemonic()
     
@@ -140,13 +189,13 @@ def export_key():
         print("No wallet configured. Run setup.sh first.")
         return None
     
-    acct = Account.from_key(pk)
+    address = address_from_key(pk)
     
     print("═" * 60)
     print("  WALLET EXPORT")
     print("═" * 60)
     print()
-    print(f"ADDRESS:      {acct.address}")
+    print(f"ADDRESS:      {address}")
     print(f"PRIVATE KEY:  {pk}")
     print()
     print("⚠️  Keep this private key secure!")
@@ -163,70 +212,131 @@ def get_address():
         print(config['address'])
         return config['address']
     
-    # Derive from key
-    pk = get_private_key()
-    if not pk:
+    # Ask the signer agent, or derive from key
+    address = wallet_address()
+    if not address:
         print("No wallet configured. Run setup.sh first.")
         return None
     
-    acct = Account.from_key(pk)
-    print(acct.address)
-    return acct.address
+    print(address)
+    return address
+
+def read_balances(reader, addresses):
+    """
+    ETH balance, USDC balance and USDC allowance to the auction for each
+    address via Multicall3 (getEthBalance / balanceOf / allowance), all
+    pinned to the reader's block. Values are ints, or None if a read failed.
+    """
+    rows = []
+    for i in range(0, len(addresses), BALANCES_CHUNK):
+        chunk = addresses[i:i + BALANCES_CHUNK]
+        calls = []
+        for address in chunk:
+            calls += [
+                (MULTICALL3, encode_call("getEthBalance(address)", ["address"], [address])),
+                (USDC, encode_call("balanceOf(address)", ["address"], [address])),
+                (USDC, encode_call("allowance(address,address)", ["address", "address"], [address, AUCTION])),
+            ]
+        results = aggregate3(reader.client, calls, reader=reader)
+        with tracing.phase("decode"):
+            for j, address in enumerate(chunk):
+                values = [
+                    int.from_bytes(data[:32], "big") if ok and len(data) >= 32 else None
+                    for ok, data in results[3 * j:3 * j + 3]
+                ]
+                rows.append({"address": address, "eth": values[0], "usdc": values[1], "allowance": values[2]})
+    return rows
+
+def _format(value, decimals, places):
+    return "?" if value is None else f"{Decimal(value) / Decimal(10**decimals):.{places}f}"
 
 def check_balance():
-    """Check ETH and USDC balance."""
+    """Check ETH and USDC balance and the USDC allowance to the auction."""
     config = load_config()
-    pk = get_private_key()
+    serving = os.environ.get(SERVING_ENV)
+    address = wallet_address(prompt=not serving)
     
-    if not pk:
+    if not address:
+        if serving:
+            sys.exit(1)  # Needs the keychain; daemon.forward() runs this directly
         print("No wallet configured. Run setup.sh first.")
         return
     
-    rpc_url = config.get('rpcUrl', RPC_DEFAULT)
-    acct = Account.from_key(pk)
+    # One Multicall3 read pinned to one block; served from the view-call cache if unchanged
+    reader = BlockReader(open_client(config), cache=open_cache())
+    row = read_balances(reader, [address])[0]
     
-    w3 = Web3(Web3.HTTPProvider(rpc_url))
-    
-    # ETH balance
-    eth_balance = w3.eth.get_balance(acct.address)
-    eth_formatted = w3.from_wei(eth_balance, 'ether')
+    with tracing.phase("render"):
+        print("═" * 60)
+        print("  WALLET BALANCE")
+        print("═" * 60)
+        print()
+        print(f"Address: {address}")
+        print(f"Chain:   Base")
+        print()
+        print(f"ETH:       {_format(row['eth'], 18, 6)} ETH")
+        print(f"USDC:      ${_format(row['usdc'], 6, 2)}")
+        print(f"Allowance: ${_format(row['allowance'], 6, 2)} (auction)")
+        print()
     
-    # USDC balance
-    usdc_contract = w3.eth.contract(
-        address=Web3.to_checksum_address(USDC),
-        abi=[{
-            "constant": True,
-            "inputs": [{"name": "_owner", "type": "address"}],
-            "name": "balanceOf",
-            "outputs": [{"name": "balance", "type": "uint256"}],
-            "type": "function"
-        }]
-    )
-    usdc_balance = usdc_contract.functions.balanceOf(acct.address).call()
-    usdc_formatted = usdc_balance / 1_000_000
+        if row['eth'] == 0:
+            print("⚠️  No ETH for gas! Send some ETH to this address.")
+        if row['usdc'] == 0:
+            print("⚠️  No USDC for bidding! Send USDC to this address.")
+
+def load_addresses(path):
+    """Addresses from a file, one per line (blank lines and # comments skipped)."""
+    with open(path) as f:
+        lines = [line.split('#')[0].strip() for line in f]
+    return [line for line in lines if line]
+
+def check_balances(addresses, as_json=False):
+    """ETH, USDC and auction allowance for many wallets (table or JSON)."""
+    try:
+        addresses = [to_checksum_address(a) for a in addresses]
+    except ValueError as e:
+        print(f"Error: Invalid address: {e}")
+        sys.exit(1)
+    config = load_config()
+    reader = BlockReader(open_client(config), cache=open_cache())
+    rows = read_balances(reader, addresses)
+    totals = {
+        key: sum(row[key] or 0 for row in rows)
+        for key in ("eth", "usdc", "allowance")
+    }
     
-    print("═" * 60)
-    print("  WALLET BALANCE")
-    print("═" * 60)
-    print()
-    print(f"Address: {acct.address}")
-    print(f"Chain:   Base")
-    print()
-    print(f"ETH:     {eth_formatted:.6f} ETH")
-    print(f"USDC:    ${usdc_formatted:.2f}")
-    print()
+    with tracing.phase("render"):
+        if as_json:
+            def amounts(row):
+                return {
+                    "eth": None if row["eth"] is None else row["eth"] / 10**18,
+                    "usdc": None if row["usdc"] is None else row["usdc"] / 1_000_000,
+                    "allowanceUsdc": None if row["allowance"] is None else row["allowance"] / 1_000_000,
+                }
+            print(json.dumps({
+                "block": reader.block,
+                "wallets": [{"address": row["address"], **amounts(row)} for row in rows],
+                "totals": amounts(totals),
+            }, indent=2))
+            return
     
-    if eth_balance == 0:
-        print("⚠️  No ETH for gas! Send some ETH to this address.")
-    if usdc_balance == 0:
-        print("⚠️  No USDC for bidding! Send USDC to this address.")
+        print(f"{'Address':<42}  {'ETH':>12}  {'USDC':>12}  {'Allowance':>12}")
+        print("─" * 84)
+        for row in rows:
+            flag = "  ⚠️ no ETH" if row["eth"] == 0 else ""
+            print(f"{row['address']:<42}  {_format(row['eth'], 18, 6):>12}  "
+                  f"{_format(row['usdc'], 6, 2):>12}  {_format(row['allowance'], 6, 2):>12}{flag}")
+        print("─" * 84)
+        print(f"{f'Total ({len(rows)} wallets)':<42}  {_format(totals['eth'], 18, 6):>12}  "
+              f"{_format(totals['usdc'], 6, 2):>12}  {_format(totals['allowance'], 6, 2):>12}")
+        print(f"Block {reader.block}")
 
 def import_key(private_key):
     """Import an existing private key."""
     try:
-        acct = Account.from_key(private_key)
-        print(f"Imported wallet: {acct.address}")
-        return private_key, acct.address
+        address = address_from_key(private_key)
+        print(f"Imported wallet: {address}")
+        return private_key, address
     except Exception as e:
         print(f"Invalid private key: {e}")
         return None, None
@@ -263,6 +373,24 @@ def main():
     elif cmd == 'balance':
         check_balance()
     
+    elif cmd == 'balances':
+        addresses = []
+        args = iter(sys.argv[2:])
+        for arg in args:
+            if arg == '--file':
+                path = next(args, None)
+                try:
+                    addresses += load_addresses(path)
+                except (TypeError, OSError) as e:
+                    print(f"Error: --file needs a readable file of addresses ({e})")
+                    sys.exit(1)
+            elif arg not in ('--json', '--profile'):
+                addresses.append(arg)
+        if not addresses:
+            print("Usage: wallet.py balances <address>... [--file PATH] [--json]")
+            sys.exit(1)
+        check_balances(addresses, '--json' in sys.argv)
+    
     elif cmd == 'import':
         if len(sys.argv) < 3:
             print("Usage: wallet.py import <private_key>")
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Push-based bid watcher used by `query-bids.py --watch`.
+
+Keeps an in-memory bid book seeded from one snapshot and updated from
+AuctionBid / BidContributionMade / AuctionCreated / AuctionSettled logs.
+Logs arrive over a WebSocket `eth_subscribe("logs")` subscription when a
+WebSocket URL is configured, otherwise through `eth_getFilterChanges`
+polling over HTTP (or plain eth_getLogs polling if the provider doesn't
+support filters). After WS_MAX_FAILURES failed WebSocket connections in
+a row the watcher falls back to HTTP polling.
+
+The snapshot is pinned to one block N and taken after the subscription
+or filter exists, so nothing is missed in between; logs at or below N
+are already in the snapshot and are dropped, so nothing is counted twice.
+
+Every change is written to stdout as one compact JSON line (NDJSON):
+
+    {"type": "snapshot", "tokenId": 332, "bidCount": 12, "block": ..., ...}
+    {"type": "bid", "event": "BidContributionMade", "url": ..., "rank": 2, ...}
+    {"type": "rank", "url": ..., "oldRank": 3, "newRank": 2, ...}
+    {"type": "auction", "event": "AuctionCreated", "tokenId": 333, ...}
+"""
+
+import asyncio
+import json
+import sys
+import time
+
+from eth_utils import to_checksum_address
+
+from bidbook import BidBook
+from events import TOPICS, decode_log
+
+WATCHED_TOPICS = [TOPICS[name] for name in ("AuctionBid", "BidContributionMade", "AuctionCreated", "AuctionSettled")]
+POLL_INTERVAL = 2.0  # seconds; Base produces a block every 2s
+WS_MAX_FAILURES = 5
+
+
+def emit(record):
+    """Write one NDJSON line and flush so pipes see it immediately."""
+    sys.stdout.write(json.dumps(record, separators=(",", ":")) + "\n")
+    sys.stdout.flush()
+
+
+class LiveBids:
+    """In-memory bid book for the current auction (empty until the first reset())."""
+
+    def __init__(self, tracked=()):
+        self.tracked = list(tracked)
+        self.block = -1
+        self.reset(0, 0)
+
+    def reset(self, token_id, end_time, bids=(), block=None):
+        """Start over from `bids`, a snapshot at `block` (kept if None)."""
+        self.token_id = token_id
+        self.end_time = end_time
+        self.book = BidBook(bids)
+        self.ranks = self.tracked_ranks()
+        self.seen = set()
+        if block is not None:
+            self.block = block
+
+    def tracked_ranks(self):
+        return {url: self.book.rank(url) for url in self.tracked}
+
+    def snapshot_record(self):
+        leader = self.book.leader()
+        return {
+            "type": "snapshot",
+            "tokenId": self.token_id,
+            "endTime": self.end_time,
+            "bidCount": len(self.book),
+            "leader": leader.urlString if leader else None,
+            "leaderUsdc": leader.totalAmount / 1_000_000 if leader else 0,
+            "tracked": self.ranks,
+            "block": self.block,
+            "ts": time.time(),
+        }
+
+    def apply(self, event):
+        """Apply a decoded event; returns the NDJSON records it produced."""
+        if event["blockNumber"] <= self.block:
+            return []  # Already in the snapshot
+        key = (event["transactionHash"], event["logIndex"])
+        if key in self.seen:
+            return []
+        self.seen.add(key)
+
+        name = event["event"]
+        records = []
+
+        if name == "AuctionCreated":
+            if event["tokenId"] > self.token_id:
+                self.reset(event["tokenId"], event["endTime"])
+                self.seen = {key}
+            records.append({
+                "type": "auction", "event": name, "tokenId": event["tokenId"],
+                "startTime": event["startTime"], "endTime": event["endTime"],
+                "block": event["blockNumber"], "ts": time.time(),
+            })
+            return records
+
+        if name == "AuctionSettled":
+            records.append({
+                "type": "auction", "event": name, "tokenId": event["tokenId"],
+                "winningUrl": event["winningBid"][1],
+                "winningUsdc": event["winningBid"][0] / 1_000_000,
+                "block": event["blockNumber"], "ts": time.time(),
+            })
+            return records
+
+        if event["tokenId"] != self.token_id:
+            return records
+
+        url = event["urlString"]
+        if name == "AuctionBid":
+            who = event["bidder"]
+            bid = self.book.contribute(url, who, event["amount"])
+        else:
+            who = event["contributor"]
+            bid = self.book.contribute(url, who, event["amount"], total=event["totalAmount"])
+        self.end_time = max(self.end_time, event["endTime"])
+
+        records.append({
+            "type": "bid", "event": name, "tokenId": self.token_id, "url": url,
+            "from": who, "amountUsdc": event["amount"] / 1_000_000,
+            "totalUsdc": bid.totalAmount / 1_000_000, "rank": self.book.rank(url),
+            "extended": event["extended"], "endTime": self.end_time,
+            "block": event["blockNumber"], "tx": event["transactionHash"], "ts": time.time(),
+        })
+
+        new_ranks = self.tracked_ranks()
+        for tracked_url, new_rank in new_ranks.items():
+            old_rank = self.ranks.get(tracked_url)
+            if new_rank != old_rank:
+                records.append({
+                    "type": "rank", "url": tracked_url, "oldRank": old_rank,
+                    "newRank": new_rank, "block": event["blockNumber"], "ts": time.time(),
+                })
+        self.ranks = new_ranks
+        return records
+
+
+def handle_log(book, log, resync):
+    if log.get("removed"):
+        # Reorged out; rebuild from a fresh snapshot rather than unwinding
+        resync()
+        return
+    event = decode_log(log)
+    if event is None:
+        return
+    for record in book.apply(event):
+        emit(record)
+
+
+async def watch_ws(ws_url, address, book, resync, max_failures=WS_MAX_FAILURES):
+    """
+    Subscribe to logs over WebSocket; reconnects with backoff. Returns
+    after `max_failures` failed connections in a row, so the caller can
+    fall back to HTTP polling.
+    """
+    try:
+        import websockets
+    except ImportError:
+        print("Warning: websockets is not installed, polling over HTTP instead", file=sys.stderr)
+        return
+
+    params = ["logs", {"address": address, "topics": [WATCHED_TOPICS]}]
+    backoff = 1
+    failures = 0
+    while True:
+        try:
+            async with websockets.connect(ws_url, max_size=None) as ws:
+                await ws.send(json.dumps({"jsonrpc": "2.0", "id": 1, "method": "eth_subscribe", "params": params}))
+                reply = json.loads(await ws.recv())
+                if "error" in reply:
+                    raise RuntimeError(reply["error"].get("message", reply["error"]))
+                backoff = 1
+                failures = 0
+                # Snapshot once subscribed: logs arriving meanwhile wait in
+                # the socket and are dropped if the snapshot already has them
+                resync()
+                async for message in ws:
+                    payload = json.loads(message)
+                    if payload.get("method") == "eth_subscription":
+                        handle_log(book, payload["params"]["result"], resync)
+                error = "connection closed"
+        except (OSError, asyncio.TimeoutError, RuntimeError) as e:
+            error = e
+        except Exception as e:
+            if not type(e).__module__.startswith("websockets"):
+                raise
+            error = e
+        failures += 1
+        if failures >= max_failures:
+            print(f"Warning: WebSocket failed {failures} times ({error}), falling back to HTTP polling",
+                  file=sys.stderr)
+            return
+        print(f"Warning: WebSocket error ({error}), reconnecting in {backoff}s", file=sys.stderr)
+        await asyncio.sleep(backoff)
+        backoff = min(backoff * 2, 30)
+
+
+def watch_http(client, address, book, resync, interval=POLL_INTERVAL):
+    """
+    Poll eth_getFilterChanges, or eth_getLogs from the snapshot block on
+    when filters are unsupported.
+    """
+    params = {"address": address, "topics": [WATCHED_TOPICS]}
+    try:
+        filter_id = client.eth.new_filter({**params, "fromBlock": "latest"})
+    except Exception as e:
+        print(f"Warning: eth_newFilter unsupported ({e}), polling eth_getLogs", file=sys.stderr)
+        filter_id = None
+    resync()
+
+    last_block = book.block
+    while True:
+        time.sleep(interval)
+        try:
+            if filter_id is not None:
+                logs = client.eth.get_filter_changes(filter_id)
+            else:
+                head = client.eth.block_number
+                last_block = max(last_block, book.block)
+                if head <= last_block:
+                    continue
+                logs = client.eth.get_logs({**params, "fromBlock": last_block + 1, "toBlock": head})
+                last_block = head
+        except Exception as e:
+            # Filters expire on some providers after inactivity; recreate
+            # before the new snapshot so no log falls between the two
+            print(f"Warning: poll failed ({e}), resyncing", file=sys.stderr)
+            if filter_id is not None:
+                try:
+                    filter_id = client.eth.new_filter({**params, "fromBlock": "latest"})
+                except Exception:
+                    filter_id = None
+            resync()
+            last_block = book.block
+            continue
+        for log in logs:
+            handle_log(book, dict(log), resync)
+
+
+def watch(client, address, load_snapshot, tracked=(), ws_url=None, interval=POLL_INTERVAL):
+    """
+    Run the watcher forever.
+
+    `load_snapshot()` returns (auction_info, bids, block) in query-bids.py's
+    shapes, read at `block`; it seeds the book once the subscription is
+    up and is called again after reconnects or reorgs to resynchronize.
+    """
+    address = to_checksum_address(address)
+    book = LiveBids(tracked)
+
+    def resync():
+        auction_info, bids, block = load_snapshot()
+        book.reset(auction_info["tokenId"], auction_info["endTime"], bids, block)
+        emit(book.snapshot_record())
+
+    try:
+        if ws_url:
+            asyncio.run(watch_ws(ws_url, address, book, resync))
+        watch_http(client, address, book, resync, interval)
+    except KeyboardInterrupt:
+        pass
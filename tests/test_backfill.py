@@ -0,0 +1,92 @@
+import pytest
+
+import backfill
+from indexer import Indexer
+from mockchain import FIRST_LOG_BLOCK, HEAD_BLOCK, MockChain
+from rpc import RpcClient
+
+
+@pytest.fixture
+def chain():
+    # 60 bids x 3 contributions + AuctionCreated = 181 logs over 46 blocks
+    with MockChain(bids=60, contributions=3, max_logs=20) as chain:
+        yield chain
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(backfill.time, "sleep", lambda seconds: None)
+
+
+def counts(indexer):
+    return indexer.db.execute("SELECT COUNT(*) FROM contributions").fetchone()[0]
+
+
+def chunks(indexer):
+    return indexer.db.execute("SELECT start_block, end_block, log_count FROM backfill_chunks").fetchall()
+
+
+def test_bisects_ranges_over_the_result_cap(chain, tmp_path):
+    indexer = Indexer(tmp_path / "index.sqlite")
+    applied = backfill.backfill(indexer, RpcClient(chain.url), FIRST_LOG_BLOCK, HEAD_BLOCK,
+                                workers=3, chunk=1_000, quiet=True)
+
+    assert applied == len(chain.logs())
+    assert counts(indexer) == 180
+    done = chunks(indexer)
+    assert all(count <= 20 for _, _, count in done)
+    assert sum(count for _, _, count in done) == len(chain.logs())
+    assert backfill.missing_ranges(FIRST_LOG_BLOCK, HEAD_BLOCK, [c[:2] for c in done]) == []
+    # The first 1000-block chunk holds every log, so it had to be split
+    assert chain.stats["methods"]["eth_getLogs"] > len(done)
+
+
+def test_resumes_from_checkpoints(chain, tmp_path):
+    indexer = Indexer(tmp_path / "index.sqlite")
+    client = RpcClient(chain.url)
+    start, end = FIRST_LOG_BLOCK, FIRST_LOG_BLOCK + 99
+    # Five chunks; the third keeps failing, so the run stops part-way
+    chain.max_logs = None
+    chain.inject("eth_getLogs", -32000, "internal error", times=backfill.MAX_RETRIES, after=2)
+    with pytest.raises(Exception, match="internal error"):
+        backfill.backfill(indexer, client, start, end, workers=1, chunk=20, quiet=True)
+    first = chunks(indexer)
+    assert [c[:2] for c in first] == [(start, start + 19), (start + 20, start + 39)]
+
+    chain.reset_stats()
+    applied = backfill.backfill(indexer, client, start, end, workers=1, chunk=20, quiet=True)
+
+    # Only the three missing chunks are fetched again
+    assert chain.stats["methods"]["eth_getLogs"] == 3
+    assert applied == len(chain.logs()) - sum(count for _, _, count in first)
+    assert counts(indexer) == 180
+
+
+def test_rate_limits_back_off_without_splitting(chain, tmp_path, monkeypatch):
+    slept = []
+    monkeypatch.setattr(backfill.time, "sleep", slept.append)
+    indexer = Indexer(tmp_path / "index.sqlite")
+    chain.max_logs = None
+    chain.inject("eth_getLogs", -32005, "daily request count exceeded, request rate limited", times=3)
+
+    applied = backfill.backfill(indexer, RpcClient(chain.url), FIRST_LOG_BLOCK, HEAD_BLOCK,
+                                workers=1, chunk=50_000, quiet=True)
+
+    assert applied == len(chain.logs())
+    assert [c[:2] for c in chunks(indexer)] == [(FIRST_LOG_BLOCK, HEAD_BLOCK)]
+    assert chain.stats["methods"]["eth_getLogs"] == 4
+    assert slept == [backfill.RATE_LIMIT_BACKOFF * 2 ** i for i in range(3)]
+
+
+@pytest.mark.parametrize("message, too_many, limited", [
+    ("query returned more than 10000 results", True, False),
+    ("Log response size exceeded. You can make eth_getLogs requests with up to a 2K block range", True, False),
+    ("eth_getLogs is limited to a 10,000 range", True, False),
+    ("daily request count exceeded, request rate limited", False, True),
+    ("Too Many Requests", False, True),
+    ("limit exceeded", False, False),
+])
+def test_classifies_provider_errors(message, too_many, limited):
+    error = Exception(message)
+    assert backfill.is_too_many_results(error) == too_many
+    assert backfill.is_rate_limited(error) == limited
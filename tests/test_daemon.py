@@ -0,0 +1,139 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from bench_e2e import BENCH_KEY, setup_home
+from mockchain import MockChain
+from wallet import address_from_key
+
+SCRIPTS = Path(__file__).resolve().parent.parent / "scripts"
+
+# Runs each (script, argv[, trace, cwd]) through Daemon.run in one daemon process
+DAEMON_RUNNER = """
+import json, sys
+from daemon import Daemon
+daemon = Daemon()
+print(json.dumps([daemon.run(*case) for case in json.loads(sys.argv[1])]))
+"""
+
+# Serves on the socket given in argv, with a short client read timeout
+DAEMON_SERVER = """
+import sys
+import daemon
+daemon.READ_TIMEOUT = 0.5
+daemon.Daemon().serve(sys.argv[1])
+"""
+
+
+def served_cases(chain):
+    url = chain.bids[0][1]
+    address = address_from_key(BENCH_KEY)
+    rpc = ["--rpc", chain.url]
+    cases = [("query-bids.py", mode + rpc) for mode in
+             ([], ["--summary"], ["--json"], ["--ndjson"], ["--ndjson", "--contributions"],
+              ["--contributors"], ["--serial"], ["--url", url])]
+    cases += [
+        ("wallet.py", ["balance"]),
+        ("wallet.py", ["balances", address, "--json"]),
+        ("qrcoin.py", ["status"]),
+        ("qrcoin.py", ["--build", "approve", "25"]),
+        ("qrcoin.py", ["--build", "createBid", "https://example.com/new", "test"]),
+        ("qrcoin.py", ["--build", "contributeToBid", url, "test"]),
+    ]
+    return cases
+
+
+def run_daemon(env, cases):
+    proc = subprocess.run([sys.executable, "-c", DAEMON_RUNNER, json.dumps(cases)],
+                          cwd=SCRIPTS, env=env, capture_output=True, text=True, check=True)
+    return json.loads(proc.stdout)
+
+
+def run_direct(env, script, argv):
+    return subprocess.run([sys.executable, script, *argv], cwd=SCRIPTS,
+                          env={**env, "QRCOIN_DIRECT": "1"}, capture_output=True, text=True)
+
+
+@pytest.fixture
+def chain():
+    with MockChain(20, 2, 0) as chain:
+        yield chain
+
+
+def home_env(home, chain, wallet_address=True):
+    setup_home(home, chain.url)
+    wallet = {"rpcUrl": chain.url}
+    if wallet_address:
+        wallet["address"] = address_from_key(BENCH_KEY)
+    wallet_dir = Path(home) / ".clawdbot" / "skills" / "wallet"
+    wallet_dir.mkdir(parents=True)
+    (wallet_dir / "config.json").write_text(json.dumps(wallet))
+    env = {**os.environ, "HOME": str(home)}
+    for name in ("QRCOIN_DIRECT", "QRCOIN_TRACE"):
+        env.pop(name, None)
+    return env
+
+
+def test_served_output_matches_direct(tmp_path, chain):
+    env = home_env(tmp_path, chain)
+    cases = served_cases(chain)
+    for (script, argv), served in zip(cases, run_daemon(env, cases)):
+        direct = run_direct(env, script, argv)
+        assert direct.returncode == 0, (script, argv, direct.stderr)
+        assert served["code"] == 0, (script, argv, served["stderr"])
+        assert served["stdout"] == direct.stdout, (script, argv)
+        assert served["stdout"]
+
+
+def test_balance_needing_the_key_is_not_served(tmp_path, chain):
+    env = home_env(tmp_path, chain, wallet_address=False)
+    (served,) = run_daemon(env, [("wallet.py", ["balance"])])
+    assert served["code"] != 0
+    assert served["stdout"] == ""
+
+
+def test_relative_paths_use_the_client_cwd(tmp_path, chain):
+    env = home_env(tmp_path / "home", chain)
+    work = tmp_path / "work"
+    work.mkdir()
+    address = address_from_key(BENCH_KEY)
+    (work / "wallets.txt").write_text(address + "\n")
+    argv = ["balances", "--file", "wallets.txt", "--json"]
+    served, elsewhere = run_daemon(env, [("wallet.py", argv, None, str(work)), ("wallet.py", argv)])
+    assert served["code"] == 0, served["stderr"]
+    assert address in served["stdout"]
+    assert elsewhere["code"] == 1  # Not in the daemon's own cwd
+
+
+def daemon_request(path, message):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(10)
+        sock.connect(str(path))
+        sock.sendall(json.dumps(message).encode() + b"\n")
+        return json.loads(sock.makefile("rb").readline())
+
+
+def test_silent_client_does_not_block_others(tmp_path, chain):
+    env = home_env(tmp_path / "home", chain)
+    path = tmp_path / "daemon.sock"
+    proc = subprocess.Popen([sys.executable, "-c", DAEMON_SERVER, str(path)], cwd=SCRIPTS, env=env)
+    try:
+        deadline = time.time() + 30
+        while not path.exists():
+            assert time.time() < deadline and proc.poll() is None
+            time.sleep(0.05)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as silent:
+            silent.connect(str(path))  # and never sends its request
+            started = time.perf_counter()
+            assert daemon_request(path, {"op": "status"})["served"] == 0
+            assert time.perf_counter() - started < 5
+        assert daemon_request(path, {"op": "stop"}) == {"stopped": True}
+        proc.wait(10)
+    finally:
+        proc.kill()
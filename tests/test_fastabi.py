@@ -0,0 +1,93 @@
+import pytest
+from eth_abi import decode, encode
+
+from fastabi import AUCTION_TYPES, BID_TYPE, decode_auction, decode_bid, decode_bids, decode_uint
+from mockchain import AUCTION, MULTICALL3, MockChain
+from multicall import AGGREGATE3, encode_call
+from records import bid_from_raw, bids_from_raw
+
+MAX_UINT = 2**256 - 1
+LONG_URL = "https://example.com/" + "ü€𝄞x" * 2_000  # multi-byte UTF-8, spans many words
+
+
+def plain(value):
+    """Comparable form of Bid / Contribution records and tuples."""
+    if isinstance(value, (list, tuple)):
+        return [plain(v) for v in value]
+    if hasattr(value, "__slots__"):
+        return [plain(getattr(value, name)) for name in value.__slots__]
+    return value
+
+
+def reference_bids(data):
+    (bids,) = decode([BID_TYPE + "[]"], data)
+    return bids_from_raw(bids, checksum=True)
+
+
+def reference_bid(data):
+    (bid,) = decode([BID_TYPE], data)
+    return bid_from_raw(bid, checksum=True)
+
+
+def reference_auction(data):
+    auction = decode(AUCTION_TYPES, data)
+    return (auction[0], bid_from_raw(auction[1], checksum=True)) + tuple(auction[2:])
+
+
+BIDS = [
+    (0, "", []),
+    (5_000_000, "https://example.com/a", [("0x" + "ab" * 20, 5_000_000, 1_700_000_000)]),
+    (MAX_UINT, LONG_URL, [("0x%040x" % (i + 1), MAX_UINT if i == 0 else i, i) for i in range(40)]),
+    (7, "https://example.com/" + "a" * 32, [("0x" + "ff" * 20, 7, 0)]),  # exactly one word of padding
+]
+
+
+@pytest.mark.parametrize("bids", [[], BIDS[:1], BIDS], ids=["empty", "one-empty-bid", "mixed"])
+def test_get_all_bids(bids):
+    data = encode([BID_TYPE + "[]"], [bids])
+    assert plain(decode_bids(data)) == plain(reference_bids(data))
+
+
+@pytest.mark.parametrize("bid", BIDS, ids=["empty", "single", "long", "aligned"])
+def test_get_bid(bid):
+    data = encode([BID_TYPE], [bid])
+    assert plain(decode_bid(data)) == plain(reference_bid(data))
+
+
+@pytest.mark.parametrize("bid", BIDS, ids=["empty", "single", "long", "aligned"])
+def test_auction(bid):
+    data = encode(AUCTION_TYPES, [332, bid, 1_700_000_000, MAX_UINT, True, (0, LONG_URL)])
+    assert plain(decode_auction(data)) == plain(reference_auction(data))
+
+
+def test_contract_payloads():
+    """The mock encodes getAllBids by hand like the contract, not with eth_abi."""
+    chain = MockChain(bids=50, contributions=4)
+    data = chain.all_bids()
+    assert plain(decode_bids(data)) == plain(reference_bids(data))
+
+    # Sub-results of an aggregate3 call, as query-bids.py decodes them
+    calls = [(AUCTION, True, encode_call(sig, types, args)) for sig, types, args in (
+        ("auction()", (), ()),
+        ("getBid(string)", ["string"], [chain.bids[3][1]]),
+        ("getBid(string)", ["string"], ["https://example.com/missing"]),
+        ("getBidCount()", (), ()),
+    )]
+    raw = chain.contract_call(MULTICALL3, AGGREGATE3 + encode(["(address,bool,bytes)[]"], [calls]))
+    (results,) = decode(["(bool,bytes)[]"], raw)
+    (_, auction), (_, bid), (_, missing), (_, count) = results
+    assert plain(decode_auction(auction)) == plain(reference_auction(auction))
+    assert plain(decode_bid(bid)) == plain(reference_bid(bid))
+    assert plain(decode_bid(missing)) == plain(reference_bid(missing))
+    assert decode_uint(count) == decode(["uint256"], count)[0] == 50
+
+
+@pytest.mark.parametrize("decoder, data", [
+    (decode_bids, encode([BID_TYPE + "[]"], [BIDS])),
+    (decode_bid, encode([BID_TYPE], [BIDS[2]])),
+    (decode_auction, encode(AUCTION_TYPES, [1, BIDS[1], 0, 0, False, (0, "x")])),
+])
+def test_truncated_data_raises(decoder, data):
+    for cut in (len(data) - 32, len(data) // 2, 31):
+        with pytest.raises(ValueError):
+            decoder(data[:cut])
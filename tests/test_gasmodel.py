@@ -0,0 +1,40 @@
+from gasmodel import MIN_SAMPLES, GasModel
+from journal import Journal
+
+APPROVE = "0x095ea7b3"
+CREATE_BID = "0xabcdef01"
+
+
+def calldata(selector, length):
+    return selector + "00" * (length - 4)
+
+
+def test_predicts_the_line_plus_the_worst_miss(tmp_path):
+    model = GasModel(tmp_path / "gas-model.json")
+    for length, gas in ((100, 150_000), (164, 152_000), (228, 155_000)):
+        assert model.predict(calldata(CREATE_BID, length)) is None
+        model.observe(calldata(CREATE_BID, length), gas)
+    predicted = model.predict(calldata(CREATE_BID, 164))
+    assert predicted >= 152_000
+    assert predicted == GasModel(tmp_path / "gas-model.json").predict(calldata(CREATE_BID, 164))
+
+
+def test_state_dependent_costs_keep_estimating(tmp_path):
+    # approve from a zero allowance writes a fresh slot; later ones only change it
+    model = GasModel(tmp_path / "gas-model.json")
+    for gas in [46_000] + [29_000] * MIN_SAMPLES:
+        model.observe(calldata(APPROVE, 68), gas)
+    assert model.predict(calldata(APPROVE, 68)) is None
+
+    model.reset()
+    for _ in range(MIN_SAMPLES):
+        model.observe(calldata(APPROVE, 68), 29_000)
+    assert model.predict(calldata(APPROVE, 68)) == 29_000
+
+
+def test_journal_keeps_the_gas_estimate(tmp_path):
+    journal = Journal(tmp_path / "journal.sqlite")
+    entry = {"hash": "0x01", "chainId": 8453, "from": "0x" + "11" * 20, "nonce": 0, "to": "0x" + "22" * 20,
+             "data": APPROVE, "gas": 60_000, "gasEstimate": 46_000, "sentAt": 1.0}
+    journal.record(entry)
+    assert journal.pending()[0]["gasEstimate"] == 46_000
@@ -0,0 +1,87 @@
+import pytest
+
+from indexer import REORG_REWIND, Indexer
+from mockchain import FIRST_LOG_BLOCK, TOKEN_ID, MockChain
+from rpc import RpcClient, RpcError
+
+HEAD = FIRST_LOG_BLOCK + 30
+TARGET = HEAD - 3  # default confirmations
+
+
+@pytest.fixture
+def chain():
+    # 20 bids x 2 contributions + AuctionCreated = 41 logs over 11 blocks
+    with MockChain(bids=20, contributions=2) as chain:
+        chain.block = HEAD
+        yield chain
+
+
+def sync(indexer, chain, **kwargs):
+    return indexer.sync(RpcClient(chain.url), from_block=FIRST_LOG_BLOCK, max_range=5, quiet=True, **kwargs)
+
+
+def contributions(indexer):
+    return indexer.db.execute("SELECT COUNT(*) FROM contributions").fetchone()[0]
+
+
+def add_orphan(indexer, block):
+    """A contribution from a block that the reorg below replaces."""
+    indexer.db.execute(
+        "INSERT INTO contributions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        ("0xorphan", 0, block, TOKEN_ID, "https://example.com/orphan", "0x" + "22" * 20, 1, "x", "create", 0),
+    )
+    indexer.db.commit()
+
+
+def test_sync_stops_confirmations_behind_head(chain, tmp_path):
+    indexer = Indexer(tmp_path / "index.sqlite")
+    assert sync(indexer, chain) == len(chain.logs())
+    assert contributions(indexer) == 40
+    assert indexer.cursor() == TARGET
+    assert indexer.get_meta("cursor_hash") == chain.block_hash(TARGET)
+    assert chain.stats["methods"]["eth_getLogs"] == 6  # 28 blocks in ranges of 5
+
+    chain.block += 10
+    assert sync(indexer, chain) == 0
+    assert indexer.cursor() == TARGET + 10
+
+
+def test_reorg_rewinds_and_reindexes(chain, tmp_path):
+    indexer = Indexer(tmp_path / "index.sqlite")
+    sync(indexer, chain)
+    add_orphan(indexer, TARGET)
+
+    chain.reorg(TARGET)
+    chain.block += 5
+    sync(indexer, chain)
+
+    rows = indexer.db.execute("SELECT COUNT(*) FROM contributions WHERE tx_hash = '0xorphan'").fetchone()[0]
+    assert rows == 0
+    assert contributions(indexer) == 40
+    assert indexer.cursor() == TARGET + 5
+    assert indexer.get_meta("cursor_hash") == chain.block_hash(TARGET + 5)
+
+
+def test_interrupted_sync_still_checks_for_reorgs(chain, tmp_path):
+    indexer = Indexer(tmp_path / "index.sqlite")
+    chain.inject("eth_getLogs", -32000, "upstream error", after=2)
+    with pytest.raises(RpcError):
+        sync(indexer, chain)
+    cursor = indexer.cursor()
+    assert cursor == FIRST_LOG_BLOCK + 9
+    assert indexer.get_meta("cursor_hash") == chain.block_hash(cursor)
+
+    add_orphan(indexer, cursor)
+    chain.reorg(cursor)
+    sync(indexer, chain)
+    assert contributions(indexer) == 40
+    assert indexer.cursor() == TARGET
+
+
+def test_rewind_moves_the_cursor(chain, tmp_path):
+    indexer = Indexer(tmp_path / "index.sqlite")
+    sync(indexer, chain)
+    chain.reorg(TARGET)
+    assert indexer.check_reorg(RpcClient(chain.url))
+    assert indexer.cursor() == TARGET - REORG_REWIND
+    assert contributions(indexer) == 0  # Every log is within the rewound blocks
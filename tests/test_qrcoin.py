@@ -0,0 +1,44 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from bench_e2e import setup_home
+from mockchain import MockChain
+
+SCRIPTS = Path(__file__).resolve().parent.parent / "scripts"
+
+
+@pytest.fixture
+def chain():
+    with MockChain(5, 1) as chain:
+        yield chain
+
+
+def submit(home, *argv):
+    env = {**os.environ, "HOME": str(home), "QRCOIN_DIRECT": "1"}
+    env.pop("QRCOIN_TRACE", None)
+    return subprocess.run([sys.executable, "qrcoin.py", *argv, "--yes"],
+                          cwd=SCRIPTS, env=env, capture_output=True, text=True)
+
+
+def test_bid_right_after_approve(chain, tmp_path):
+    """submit-tx.sh approve 30, then createBid before the approve is mined."""
+    setup_home(tmp_path, chain.url)
+    chain.allowance = 0
+    assert submit(tmp_path, "approve", "30").returncode == 0
+
+    proc = submit(tmp_path, "createBid", "https://example.com/new", "bench")
+    assert proc.returncode == 0, proc.stdout + proc.stderr
+    assert "is not mined yet; sending anyway" in proc.stdout
+    assert len(chain.sent) == 2
+
+    # Once the approve is mined, a missing allowance is a real revert again
+    chain.block += 1
+    proc = submit(tmp_path, "createBid", "https://example.com/other", "bench")
+    assert proc.returncode == 1
+    assert "USDC_TOKEN_TRANSFER_FAILED" in proc.stdout
+    assert "Nothing was sent." in proc.stdout
+    assert len(chain.sent) == 2
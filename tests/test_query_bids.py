@@ -0,0 +1,51 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from mockchain import MockChain
+
+SCRIPTS = Path(__file__).resolve().parent.parent / "scripts"
+
+
+@pytest.fixture
+def chain():
+    with MockChain(10, 2) as chain:
+        yield chain
+
+
+def query(chain, home, *argv):
+    env = {**os.environ, "HOME": str(home), "QRCOIN_DIRECT": "1"}
+    env.pop("QRCOIN_TRACE", None)
+    chain.reset_stats()
+    proc = subprocess.run([sys.executable, "query-bids.py", *argv, "--rpc", chain.url],
+                          cwd=SCRIPTS, env=env, capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    return proc.stdout
+
+
+def test_summary_is_one_round_trip(chain, tmp_path):
+    assert "QR AUCTION" in query(chain, tmp_path, "--summary", "--no-cache")
+    assert chain.stats["requests"] == 1
+    assert chain.stats["methods"]["eth_chainId"] == 0
+    assert chain.stats["methods"]["eth_call"] == 1
+
+
+def test_cached_summary(chain, tmp_path):
+    first = query(chain, tmp_path, "--summary")
+    # Pin first (the cache lookup needs it), then the aggregate3 call
+    assert chain.stats["requests"] == 2
+    assert query(chain, tmp_path, "--summary") == first
+    assert chain.stats["requests"] == 1
+    assert chain.stats["methods"]["eth_call"] == 0
+
+
+def test_unreachable_rpc(tmp_path):
+    env = {**os.environ, "HOME": str(tmp_path), "QRCOIN_DIRECT": "1"}
+    proc = subprocess.run([sys.executable, "query-bids.py", "--summary", "--rpc", "http://127.0.0.1:1"],
+                          cwd=SCRIPTS, env=env, capture_output=True, text=True)
+    assert proc.returncode == 1
+    assert "Error: Cannot connect to Base RPC" in proc.stderr
+    assert "Traceback" not in proc.stderr
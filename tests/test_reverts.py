@@ -0,0 +1,41 @@
+from eth_abi import encode
+from eth_utils import keccak
+
+from contracts import AUCTION
+from reverts import ERRORS, decode_revert
+
+
+def revert_data(signature, types=(), args=()):
+    return keccak(text=signature)[:4] + encode(list(types), list(args))
+
+
+def test_errors_cover_the_abi():
+    names = {name for name, _ in ERRORS.values()}
+    assert {"Error", "Panic", "RESERVE_PRICE_NOT_MET", "URL_ALREADY_HAS_BID", "OwnableInvalidOwner"} <= names
+    assert ERRORS["3412a953"] == ("RESERVE_PRICE_NOT_MET", [])
+    assert ERRORS["1e4fbdf7"] == ("OwnableInvalidOwner", ["address"])
+
+
+def test_allowance_reverts():
+    allowance = [
+        revert_data("RESERVE_PRICE_NOT_MET()"),
+        revert_data("USDC_TOKEN_TRANSFER_FAILED()"),
+        revert_data("ERC20InsufficientAllowance(address,uint256,uint256)",
+                    ["address", "uint256", "uint256"], [AUCTION, 0, 10**6]),
+        revert_data("Error(string)", ["string"], ["ERC20: transfer amount exceeds allowance"]),
+        revert_data("Error(string)", ["string"], ["ERC20: transfer amount exceeds balance"]),
+    ]
+    for data in allowance:
+        assert decode_revert(data).allowance, decode_revert(data)
+
+
+def test_other_reverts_are_not_exempt():
+    other = [
+        revert_data("URL_ALREADY_HAS_BID()"),
+        revert_data("AUCTION_OVER()"),
+        revert_data("Error(string)", ["string"], ["Pausable: paused"]),
+        revert_data("Panic(uint256)", ["uint256"], [0x11]),
+        b"",
+    ]
+    for data in other:
+        assert not decode_revert(data).allowance, decode_revert(data)
@@ -0,0 +1,101 @@
+import json
+import socket
+import socketserver
+import threading
+import time
+
+import pytest
+
+from rpc import RpcClient
+
+
+class RawServer(socketserver.ThreadingTCPServer):
+    """HTTP/1.1 JSON-RPC server whose connection handling each test scripts."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, mode):
+        self.mode = mode
+        self.requests = []
+        self.connections = 0
+        super().__init__(("127.0.0.1", 0), RawHandler)
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class RawHandler(socketserver.StreamRequestHandler):
+    def read_request(self):
+        length = 0
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return None
+            if line.lower().startswith(b"content-length:"):
+                length = int(line.split(b":")[1])
+            if line in (b"\r\n", b"\n"):
+                return json.loads(self.rfile.read(length))
+
+    def reply(self, request):
+        body = json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": "0x1"}).encode()
+        self.wfile.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                         b"Content-Length: %d\r\n\r\n" % len(body) + body)
+        self.wfile.flush()
+
+    def handle(self):
+        server = self.server
+        server.connections += 1
+        while True:
+            request = self.read_request()
+            if request is None:
+                return
+            server.requests.append(request["method"])
+            if server.mode == "stall":
+                time.sleep(1)
+                return
+            self.reply(request)
+            if server.mode == "close-after-reply":
+                # Advertised keep-alive, then dropped: like an idle timeout on the provider
+                self.request.shutdown(socket.SHUT_RDWR)
+                return
+
+
+@pytest.fixture
+def server(request):
+    srv = RawServer(request.param)
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.mark.parametrize("server", ["close-after-reply"], indirect=True)
+def test_resends_on_a_stale_keep_alive_connection(server):
+    client = RpcClient(server.url)
+    assert client.request("eth_blockNumber") == "0x1"
+    time.sleep(0.1)  # Let the server's close reach us
+    assert client.request("eth_blockNumber") == "0x1"
+    assert server.requests == ["eth_blockNumber", "eth_blockNumber"]
+    assert server.connections == 2
+
+
+@pytest.mark.parametrize("server", ["stall"], indirect=True)
+def test_never_resends_after_a_timeout(server):
+    client = RpcClient(server.url, timeout=0.3)
+    with pytest.raises(TimeoutError):
+        client.request("eth_sendRawTransaction", ["0x00"])
+    time.sleep(0.2)
+    assert server.requests == ["eth_sendRawTransaction"]
+
+
+@pytest.mark.parametrize("server", ["stall"], indirect=True)
+def test_never_resends_on_a_fresh_connection(server):
+    # The server drops the connection without answering (after a 1s stall);
+    # the request may have been acted on, so the client gives up
+    client = RpcClient(server.url, timeout=5)
+    with pytest.raises(ConnectionError):
+        client.request("eth_sendRawTransaction", ["0x00"])
+    assert server.requests == ["eth_sendRawTransaction"]
+    assert server.connections == 1
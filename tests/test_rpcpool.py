@@ -0,0 +1,172 @@
+import time
+
+import pytest
+
+import rpcpool
+from mockchain import AUCTION, HEAD_BLOCK, MockChain
+from multicall import encode_call
+from readcache import BlockReader
+from rpc import RpcError
+from rpcpool import COOLDOWN, EWMA_ALPHA, RpcPool
+
+
+@pytest.fixture
+def chains():
+    with MockChain(5, 1) as a, MockChain(5, 1) as b:
+        yield a, b
+
+
+def make_pool(chains, hedge=False, health_file=None):
+    return RpcPool([chain.url for chain in chains], hedge=hedge, health_file=health_file)
+
+
+def test_fails_over_on_http_errors(chains):
+    a, b = chains
+    pool = make_pool(chains)
+    a.inject_http(503)
+    assert pool.eth.block_number == HEAD_BLOCK
+    first, second = pool.endpoints
+    assert (a.stats["requests"], b.stats["requests"]) == (1, 1)
+    assert first.failures == 1 and second.failures == 0
+
+    # The failed endpoint cools down, so the next call goes straight to the other
+    assert pool.ranked()[0] is second
+    pool.eth.block_number
+    assert (a.stats["requests"], b.stats["requests"]) == (1, 2)
+
+
+def test_fails_over_on_rate_limits_not_on_call_errors(chains):
+    a, b = chains
+    pool = make_pool(chains)
+    a.inject("eth_blockNumber", -32005, "rate limit exceeded")
+    assert pool.eth.block_number == HEAD_BLOCK
+    assert b.stats["methods"]["eth_blockNumber"] == 1
+
+    # Same code, but an answer about the query: raised, no failover
+    first = pool.ranked()[0]
+    chain = a if first.url == a.url else b
+    chain.inject("eth_getLogs", -32005, "query returned more than 10000 results")
+    with pytest.raises(RpcError):
+        pool.eth.get_logs({"fromBlock": 0, "toBlock": "latest"})
+    assert a.stats["methods"]["eth_getLogs"] + b.stats["methods"]["eth_getLogs"] == 1
+    assert first.failures == 0
+
+
+def test_dead_endpoint(chains):
+    a, b = chains
+    dead = a.url
+    a.stop()
+    pool = RpcPool([dead, b.url], health_file=None)
+    assert pool.eth.block_number == HEAD_BLOCK
+    assert pool.endpoints[0].failures == 1
+    with pytest.raises(OSError):
+        RpcPool([dead], health_file=None).eth.block_number
+
+
+def test_cooldown_grows_and_expires(chains, monkeypatch):
+    now = [1_000.0]
+    monkeypatch.setattr(rpcpool.time, "time", lambda: now[0])
+    pool = make_pool(chains)
+    first, second = pool.endpoints
+    first.latency, second.latency = 0.01, 0.1
+
+    first.failed()
+    assert first.down_until == now[0] + COOLDOWN
+    first.failed()
+    assert first.down_until == now[0] + 2 * COOLDOWN
+    assert pool.ranked()[0] is second
+
+    now[0] += 2 * COOLDOWN + 1
+    first.errors = 0.0
+    assert pool.ranked()[0] is first
+    first.succeeded(0.01)
+    assert (first.failures, first.down_until) == (0, 0.0)
+
+
+def test_health_scoring_prefers_the_faster_endpoint(chains):
+    a, b = chains
+    a.latency = 0.05
+    pool = make_pool(chains)
+    for endpoint in pool.endpoints:
+        for _ in range(3):
+            pool._call(endpoint, lambda client: client.request("eth_blockNumber"))
+    slow, fast = pool.endpoints
+    assert slow.latency > 0.04 > fast.latency
+    assert pool.ranked() == [fast, slow]
+
+    b.reset_stats()
+    pool.eth.block_number
+    assert b.stats["requests"] == 1
+
+
+def test_error_ewma_penalizes_score(chains):
+    pool = make_pool(chains)
+    endpoint = pool.endpoints[0]
+    endpoint.succeeded(0.1)
+    clean = endpoint.score()
+    endpoint.failed()
+    assert endpoint.errors == pytest.approx(EWMA_ALPHA)
+    assert endpoint.score() > clean
+    endpoint.succeeded(0.1)
+    assert endpoint.errors == pytest.approx(EWMA_ALPHA * (1 - EWMA_ALPHA))
+
+
+def test_hedged_read_beats_a_stalled_endpoint(chains):
+    a, b = chains
+    pool = make_pool(chains, hedge=True)
+    first, second = pool.endpoints
+    first.latency, second.latency = 0.01, 0.02  # a looks best, then stalls
+    a.latency = 0.5
+
+    started = time.perf_counter()
+    assert pool.eth.block_number == HEAD_BLOCK
+    assert time.perf_counter() - started < 0.4
+    assert b.stats["requests"] == 1
+
+    unhedged = make_pool(chains)
+    unhedged.endpoints[0].latency, unhedged.endpoints[1].latency = 0.01, 0.02
+    started = time.perf_counter()
+    unhedged.eth.block_number
+    assert time.perf_counter() - started >= 0.5
+
+
+def test_hedged_broadcast_goes_to_both(chains):
+    a, b = chains
+    pool = make_pool(chains, hedge=True)
+    tx_hash = pool.request("eth_sendRawTransaction", ["0x" + "ab" * 100])
+    deadline = time.time() + 2
+    while a.stats["methods"]["eth_sendRawTransaction"] + b.stats["methods"]["eth_sendRawTransaction"] < 2:
+        assert time.time() < deadline
+        time.sleep(0.01)
+    assert tx_hash in a.sent and tx_hash in b.sent
+
+
+def test_health_persists(chains, tmp_path):
+    health = tmp_path / "rpc-health.json"
+    a, _ = chains
+    pool = make_pool(chains, health_file=health)
+    a.inject_http(429)
+    pool.eth.block_number
+    pool.save()
+
+    reloaded = make_pool(chains, health_file=health)
+    first, second = reloaded.endpoints
+    assert first.failures == 1 and first.down_until > time.time()
+    assert second.latency is not None
+    assert reloaded.ranked()[0] is second
+
+
+@pytest.mark.parametrize("hedge", [False, True], ids=["failover", "hedged"])
+def test_pinned_read_skips_a_lagging_endpoint(chains, hedge):
+    lagging_chain, leading_chain = chains
+    lagging_chain.block = HEAD_BLOCK - 2
+    pool = make_pool(chains, hedge=hedge)
+    lagging, leading = pool.endpoints
+    lagging.latency, leading.latency = 0.01, 0.02  # The lagging one is ranked first
+
+    # Block from the leading node, eth_call sent to the lagging one first
+    reader = BlockReader(pool, block=leading_chain.block)
+    data = encode_call("getBidCount()", (), ())
+    assert reader.call(AUCTION, data) == leading_chain.contract_call(AUCTION, data)
+    assert lagging_chain.stats["methods"]["eth_call"] == 1
+    assert lagging.failures == 1 and leading.failures == 0
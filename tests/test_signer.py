@@ -0,0 +1,114 @@
+import socket
+import socketserver
+import threading
+
+import pytest
+from eth_abi import encode
+from eth_utils import keccak
+
+import signer
+from contracts import AUCTION, CHAIN_ID, USDC
+from encode import encode_approve, encode_contribute_to_bid, encode_create_bid
+from peercred import peer_is_owner
+from signer import Agent, check_tx, connect_agent
+
+
+class FakeAccount:
+    address = "0x" + "11" * 20
+
+
+def serve_in_thread(server):
+    thread = threading.Thread(target=server.handle_request, daemon=True)
+    thread.start()
+    return thread
+
+
+def test_peer_is_owner():
+    a, b = socket.socketpair(socket.AF_UNIX)
+    with a, b:
+        assert peer_is_owner(a)
+
+
+def test_connect_agent(tmp_path):
+    path = tmp_path / "signer.sock"
+    agent = Agent(FakeAccount(), ttl=0)
+    thread = threading.Thread(target=agent.serve, args=(path,), daemon=True)
+    thread.start()
+    while not path.exists():
+        pass
+    client = connect_agent(path)
+    assert client is not None and client.address == FakeAccount.address
+    client.request({"op": "stop"})
+    thread.join(5)
+    assert not path.exists()
+
+
+def test_no_agent_on_bad_reply(tmp_path):
+    replies = [b"", b"{}\n", b"[1, 2]\n", b"not json\n"]
+    for i, reply in enumerate(replies):
+        path = tmp_path / f"bad{i}.sock"
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                self.rfile.readline()
+                self.wfile.write(reply)
+
+        with socketserver.UnixStreamServer(str(path), Handler) as server:
+            thread = serve_in_thread(server)
+            assert connect_agent(path) is None, reply
+            thread.join(5)
+
+
+def test_refuses_other_uids(tmp_path, monkeypatch):
+    path = tmp_path / "signer.sock"
+    monkeypatch.setattr(signer.os, "getuid", lambda: -1)
+    agent = Agent(FakeAccount(), ttl=2)
+    thread = threading.Thread(target=agent.serve, args=(path,), daemon=True)
+    thread.start()
+    while not path.exists():
+        pass
+    assert connect_agent(path) is None
+    agent.running = False
+    thread.join(5)
+
+
+def test_idle_client_does_not_outlive_the_ttl(tmp_path):
+    path = tmp_path / "signer.sock"
+    agent = Agent(FakeAccount(), ttl=1)
+    thread = threading.Thread(target=agent.serve, args=(path,), daemon=True)
+    thread.start()
+    while not path.exists():
+        pass
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as idle:
+        idle.connect(str(path))  # and never sends a line
+        thread.join(5)
+        assert not thread.is_alive()
+    assert agent.account is None
+    assert not path.exists()
+
+
+POLICY = {"policies": {"maxTxValueUSD": 50}}
+OTHER = "0x" + "33" * 20
+
+
+def tx(to, data, **fields):
+    return {"chainId": CHAIN_ID, "to": to, "data": data, "value": 0, **fields}
+
+
+def test_policy_allows_the_bid_flow():
+    assert check_tx(tx(USDC, "0x" + encode_approve(AUCTION, 50 * 10**6)), POLICY) is None
+    assert check_tx(tx(AUCTION, "0x" + encode_create_bid(1, "https://example.com", "me")), POLICY) is None
+    assert check_tx(tx(AUCTION, "0x" + encode_contribute_to_bid(1, "https://example.com", "me")), POLICY) is None
+
+
+@pytest.mark.parametrize("bad, reason", [
+    (tx(AUCTION, "0x" + encode_create_bid(1, "https://example.com", "me"), chainId=1), "chainId"),
+    (tx(AUCTION, "0x" + encode_create_bid(1, "https://example.com", "me"), value=1), "ETH transfers"),
+    (tx(USDC, "0x" + encode_approve(OTHER, 10**6)), "spender must be the auction"),
+    (tx(USDC, "0x" + encode_approve(AUCTION, 50 * 10**6 + 1)), "exceeds maxTxValueUSD"),
+    (tx(USDC, "0xa9059cbb" + encode(["address", "uint256"], [OTHER, 10**6]).hex()), "only approve()"),
+    (tx(AUCTION, "0x" + keccak(text="settleAuction()")[:4].hex()), "only createBid() and contributeToBid()"),
+    (tx(OTHER, "0x" + encode_create_bid(1, "https://example.com", "me")), "is not allowed"),
+], ids=["chain-id", "value", "spender", "over-limit", "usdc-transfer", "auction-selector", "target"])
+def test_policy_refuses(bad, reason):
+    assert reason in check_tx(bad, POLICY)
@@ -0,0 +1,78 @@
+import asyncio
+import json
+
+import pytest
+
+import watch
+from events import decode_log
+from indexer import Indexer
+from mockchain import AUCTION, FIRST_LOG_BLOCK, TOKEN_ID, MockChain
+from rpc import RpcClient
+
+SNAPSHOT_BLOCK = FIRST_LOG_BLOCK + 10
+
+
+def snapshot_at(chain, block):
+    """(auction_info, bids, block) as of `block`, built from the mock's logs."""
+    indexer = Indexer(":memory:")
+    for log in chain.logs():
+        if int(log["blockNumber"], 16) <= block:
+            indexer.apply(decode_log(log))
+    return {"tokenId": TOKEN_ID, "endTime": chain.ends}, indexer.get_bids(TOKEN_ID), block
+
+
+def run_watch(monkeypatch, chain, polls):
+    calls = []
+
+    def sleep(seconds):
+        calls.append(seconds)
+        if len(calls) > polls:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(watch.time, "sleep", sleep)
+    snapshots = []
+
+    def load_snapshot():
+        snapshots.append(SNAPSHOT_BLOCK)
+        return snapshot_at(chain, SNAPSHOT_BLOCK)
+
+    watch.watch(RpcClient(chain.url), AUCTION, load_snapshot, interval=0)
+    return snapshots
+
+
+def test_live_bids_drop_events_already_in_the_snapshot():
+    book = watch.LiveBids()
+    event = {"event": "AuctionBid", "tokenId": 1, "urlString": "https://a", "bidder": "0x01", "amount": 5,
+             "extended": False, "endTime": 10, "transactionHash": "0xaa", "logIndex": 0, "blockNumber": 100}
+    book.reset(1, 10, [], block=100)
+    assert book.apply(event) == []
+    assert book.apply({**event, "blockNumber": 101})[0]["totalUsdc"] == 5 / 1_000_000
+    assert book.apply({**event, "blockNumber": 101}) == []  # Duplicate delivery
+
+
+@pytest.mark.parametrize("fail_first_poll", [False, True])
+def test_polling_covers_every_log_after_the_snapshot_once(monkeypatch, capsys, fail_first_poll):
+    with MockChain(bids=30, contributions=3) as chain:
+        if fail_first_poll:
+            chain.inject("eth_getLogs", -32000, "filter not found")
+        snapshots = run_watch(monkeypatch, chain, polls=2)
+        later = [log for log in chain.logs() if int(log["blockNumber"], 16) > SNAPSHOT_BLOCK]
+        totals = {url: total for total, url, _ in chain.bids}
+
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [line["block"] for line in lines if line["type"] == "snapshot"] == snapshots
+    assert len(snapshots) == (2 if fail_first_poll else 1)
+    bids = [line for line in lines if line["type"] == "bid"]
+    assert len(bids) == len(later)
+    final = {}
+    for line in bids:
+        final[line["url"]] = line["totalUsdc"]
+    assert final == {url: totals[url] / 1_000_000 for url in final}
+
+
+def test_websocket_gives_up_after_repeated_failures(capsys):
+    resyncs = []
+    asyncio.run(watch.watch_ws("ws://127.0.0.1:1", AUCTION, watch.LiveBids(), lambda: resyncs.append(1),
+                               max_failures=1))
+    assert resyncs == []
+    assert "falling back to HTTP polling" in capsys.readouterr().err